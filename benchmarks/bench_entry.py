@@ -0,0 +1,68 @@
+"""
+Compare the slotted ``BinLogEntry`` against the plain frozen dataclass it used to be:
+memory per entry, and construction time both through ``__init__`` and the parser's trusted path
+
+Usage: python benchmarks/bench_entry.py [repeat_count]
+"""
+
+import sys, dataclasses, datetime, pathlib, timeit, tracemalloc
+from binhistory import BinLogEntry
+from binhistory._binlogentry import _validate_fields, _trusted_entry
+from binhistory.defaults import DEFAULT_COMPUTER, DEFAULT_USER
+
+PATH_LOG = pathlib.Path(__file__).parent.parent / "tests" / "example.log"
+MAX_YEAR = 2023
+ENTRY_COUNT = 100_000
+
+@dataclasses.dataclass(frozen=True, order=True)
+class DictBinLogEntry:
+	"""``BinLogEntry`` as it was before slots: a ``__dict__`` per instance, validated on every construction"""
+
+	timestamp:datetime.datetime = dataclasses.field(default_factory=lambda: datetime.datetime.now())
+	computer:str = DEFAULT_COMPUTER
+	user:str = DEFAULT_USER
+
+	def __post_init__(self):
+		_validate_fields(self.timestamp, self.computer, self.user)
+
+def best_of(func, number:int, repeat:int) -> float:
+	"""Best time per call, in microseconds"""
+	return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1_000_000
+
+def bytes_per_entry(make_entries) -> float:
+	"""Memory allocated per entry (not counting the shared field values themselves)"""
+
+	tracemalloc.start()
+	before, _ = tracemalloc.get_traced_memory()
+	entries = make_entries()
+	after, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	# Minus the list holding them
+	return (after - before - sys.getsizeof(entries)) / len(entries)
+
+if __name__ == "__main__":
+
+	repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+	# Parse fields once up front so only construction is timed
+	lines  = PATH_LOG.read_text(encoding="utf-8").splitlines()
+	fields = [(e.timestamp, e.computer, e.user) for e in BinLogEntry.parse_lines(lines, MAX_YEAR)]
+	fields = (fields * (ENTRY_COUNT // len(fields) + 1))[:ENTRY_COUNT]
+
+	constructors = {
+		"dict dataclass (__init__)": lambda: [DictBinLogEntry(*f) for f in fields],
+		"slotted (__init__)":        lambda: [BinLogEntry(*f) for f in fields],
+		"slotted (parsed fields)":   lambda: [BinLogEntry._from_parsed_fields(*f) for f in fields],
+		"slotted (trusted)":         lambda: [_trusted_entry(*f) for f in fields],
+	}
+
+	print(f"{'':>26}   {'bytes/entry':>11}   {'usec/entry':>10}")
+	for name, make_entries in constructors.items():
+		memory = bytes_per_entry(make_entries)
+		usec   = best_of(make_entries, 1, repeat) / ENTRY_COUNT
+		print(f"{name:>26}:  {memory:>11.1f}   {usec:>10.3f}")
+
+	lines = lines * (ENTRY_COUNT // len(lines))
+	print("")
+	print(f"{'BinLogEntry.parse_lines':>26}:  {'':>11}   {best_of(lambda: BinLogEntry.parse_lines(lines, MAX_YEAR), 1, repeat) / len(lines):>10.3f}")
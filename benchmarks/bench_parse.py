@@ -0,0 +1,38 @@
+"""
+Compare the hand-written timestamp parser against the ``strptime`` route, and 
+``BinLogEntry.from_string`` per line against ``BinLogEntry.parse_lines`` in bulk
+
+Usage: python benchmarks/bench_parse.py [repeat_count]
+"""
+
+import sys, pathlib, timeit
+from binhistory import BinLogEntry
+from binhistory._binlogentry import _fast_datetime_from_log_timestamp, _strptime_datetime_from_log_timestamp
+
+PATH_LOG = pathlib.Path(__file__).parent.parent / "tests" / "example.log"
+MAX_YEAR = 2023
+
+def best_of(func, number:int, repeat:int) -> float:
+	"""Best time per call, in microseconds"""
+	return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1_000_000
+
+if __name__ == "__main__":
+
+	repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+	# A nice big pile of real-looking lines
+	lines = PATH_LOG.read_text(encoding="utf-8").splitlines() * 1_000
+	timestamps = [line[0:19] for line in lines]
+
+	results = {
+		"timestamp (strptime)": best_of(lambda: [_strptime_datetime_from_log_timestamp(t, MAX_YEAR) for t in timestamps], 1, repeat) / len(lines),
+		"timestamp (fixed-width)": best_of(lambda: [_fast_datetime_from_log_timestamp(t, MAX_YEAR) for t in timestamps], 1, repeat) / len(lines),
+		"BinLogEntry.from_string": best_of(lambda: [BinLogEntry.from_string(l, MAX_YEAR) for l in lines], 1, repeat) / len(lines),
+		"BinLogEntry.parse_lines": best_of(lambda: BinLogEntry.parse_lines(lines, MAX_YEAR), 1, repeat) / len(lines),
+	}
+
+	for name, usec in results.items():
+		print(f"{name:>26}:  {usec:.3f} usec/line")
+	
+	print("")
+	print(f"Fixed-width timestamp parsing is {results['timestamp (strptime)'] / results['timestamp (fixed-width)']:.1f}x faster than strptime")
@@ -0,0 +1,62 @@
+"""
+Hammer a single log with concurrent ``BinLog.touch`` calls from several processes, with and without locking
+
+For each writer count, reports throughput, how many entries were lost to read-modify-write races, and lock 
+contention (retries and time spent waiting) from ``binhistory.lock_metrics``.
+
+Usage: python benchmarks/bench_touch_contention.py [touches_per_writer] [max_writers]
+"""
+
+import sys, tempfile, pathlib, time, multiprocessing
+import binhistory
+from binhistory import BinLog, BinLogEntry
+
+def touch_lots(log_path:str, writer:int, touches:int, lock:bool, max_entries:int) -> tuple:
+	"""Touch the log a bunch of times, returning this process's lock metrics"""
+
+	# Keep every entry around so lost updates can be counted
+	binhistory._binlog.MAX_ENTRIES = max_entries
+	binhistory.lock_metrics.reset()
+
+	for _ in range(touches):
+		BinLog.touch(log_path, BinLogEntry(user=f"writer{writer}"), lock=lock)
+	
+	return binhistory.lock_metrics.retries, binhistory.lock_metrics.wait_time
+
+def run(writers:int, touches:int, lock:bool) -> dict:
+
+	with tempfile.TemporaryDirectory() as temp_dir:
+
+		log_path = str(pathlib.Path(temp_dir, "contended.log"))
+		expected = writers * touches
+
+		with multiprocessing.Pool(writers) as pool:
+			started = time.perf_counter()
+			metrics = pool.starmap(touch_lots, [(log_path, writer, touches, lock, expected) for writer in range(writers)])
+			elapsed = time.perf_counter() - started
+		
+		with open(log_path) as log_handle:
+			written = sum(1 for _ in log_handle)
+
+		return {
+			"writers":    writers,
+			"lock":       lock,
+			"touches/s":  expected / elapsed,
+			"lost":       expected - written,
+			"retries":    sum(m[0] for m in metrics),
+			"wait (s)":   sum(m[1] for m in metrics),
+		}
+
+if __name__ == "__main__":
+
+	touches     = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+	max_writers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+	print(f"{'writers':>7}  {'lock':>5}  {'touches/s':>10}  {'lost':>6}  {'retries':>8}  {'wait (s)':>9}")
+
+	writers = 1
+	while writers <= max_writers:
+		for lock in (False, True):
+			result = run(writers, touches, lock)
+			print(f"{result['writers']:>7}  {str(result['lock']):>5}  {result['touches/s']:>10.1f}  {result['lost']:>6}  {result['retries']:>8}  {result['wait (s)']:>9.3f}")
+		writers *= 2
@@ -0,0 +1,143 @@
+"""
+Benchmark suite for `binhistory`, run against a synthetic project
+
+Results are saved as JSON in ``benchmarks/results/``, named for the time and git revision.  Pass ``--compare`` 
+with an earlier results file to see what got faster or slower.
+
+Usage: python benchmarks/run.py [--bins N] [--repeat N] [--compare results.json] [--threshold 0.1] [--filter name]
+"""
+
+import sys, argparse, json, pathlib, platform, subprocess, tempfile, timeit, datetime, shutil, typing
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+import binhistory
+from binhistory import BinLog, BinLogEntry
+from synthetic import make_project
+
+RESULTS_DIR = pathlib.Path(__file__).parent / "results"
+
+class Benchmarks:
+	"""Each `bench_*` method returns a callable to be timed, and the number of items it processes per call"""
+
+	def __init__(self, project:pathlib.Path, bin_paths:typing.List[pathlib.Path], scratch:pathlib.Path):
+
+		self.project  = project
+		self.scratch  = scratch
+		self.log_paths = [p.with_suffix(".log") for p in bin_paths]
+
+		# Good logs only, for the benchmarks that aren't about error handling
+		self.good_logs = []
+		for log_path in self.log_paths:
+			try:
+				self.good_logs.append((log_path, BinLog.from_path(log_path)))
+			except binhistory.exceptions.BinLogParseError:
+				pass
+		
+		self.lines = [line for log_path, _ in self.good_logs for line in log_path.read_text().splitlines()]
+	
+	def bench_entry_from_string(self):
+		lines = self.lines
+		return (lambda: [BinLogEntry.from_string(line, 2025) for line in lines]), len(lines)
+	
+	def bench_entry_parse_lines(self):
+		lines = self.lines
+		return (lambda: BinLogEntry.parse_lines(lines, 2025)), len(lines)
+	
+	def bench_log_from_path(self):
+		log_paths = [log_path for log_path, _ in self.good_logs]
+		return (lambda: [BinLog.from_path(log_path) for log_path in log_paths]), len(log_paths)
+	
+	def bench_log_to_string(self):
+		logs = [log for _, log in self.good_logs]
+		return (lambda: [log.to_string() for log in logs]), len(logs)
+	
+	def bench_log_touch(self):
+		touch_paths = []
+		for index, (log_path, _) in enumerate(self.good_logs[:200]):
+			touch_paths.append(self.scratch / f"touch_{index}.log")
+			shutil.copy(log_path, touch_paths[-1])
+		entry = BinLogEntry(timestamp=datetime.datetime(2025, 6, 2), computer="zBench", user="bench")
+		return (lambda: [BinLog.touch(touch_path, entry) for touch_path in touch_paths]), len(touch_paths)
+	
+	def bench_scan_project(self):
+		return (lambda: sum(1 for _ in binhistory.scan_project(self.project))), len(self.log_paths)
+	
+	def bench_scan_project_single_worker(self):
+		return (lambda: sum(1 for _ in binhistory.scan_project(self.project, workers=1))), len(self.log_paths)
+
+	def bench_scan_project_processes(self):
+		return (lambda: sum(1 for _ in binhistory.scan_project(self.project, use_processes=True))), len(self.log_paths)
+
+	@classmethod
+	def names(cls) -> typing.List[str]:
+		return [name[len("bench_"):] for name in dir(cls) if name.startswith("bench_")]
+
+def git_revision() -> str:
+	try:
+		return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=pathlib.Path(__file__).parent).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return "unknown"
+
+def compare(results:dict, previous:dict, threshold:float):
+	"""Print the change in each benchmark since a previous run"""
+
+	print("")
+	print(f"Compared to {previous['revision']} ({previous['timestamp']}):")
+
+	for name, result in results["benchmarks"].items():
+
+		if name not in previous["benchmarks"]:
+			print(f"{name:>30}:  (new)")
+			continue
+
+		ratio = result["usec_per_item"] / previous["benchmarks"][name]["usec_per_item"]
+		flag = "  <-- SLOWER" if ratio > 1 + threshold else "  faster" if ratio < 1 - threshold else ""
+		print(f"{name:>30}:  {ratio:.2f}x time{flag}")
+
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser(description="Run the binhistory benchmark suite")
+	parser.add_argument("--bins",      type=int,   default=2000, help="Number of bins in the synthetic project")
+	parser.add_argument("--repeat",    type=int,   default=5,    help="Number of times to run each benchmark (best is kept)")
+	parser.add_argument("--compare",   type=pathlib.Path,        help="A previous results file to compare against")
+	parser.add_argument("--threshold", type=float, default=0.1,  help="Relative change to flag as a regression")
+	parser.add_argument("--filter",    default="",               help="Only run benchmarks containing this text")
+	args = parser.parse_args()
+
+	results = {
+		"revision":  git_revision(),
+		"timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+		"python":    platform.python_version(),
+		"platform":  platform.platform(),
+		"bins":      args.bins,
+		"benchmarks": dict(),
+	}
+
+	with tempfile.TemporaryDirectory() as temp_dir:
+
+		project = pathlib.Path(temp_dir, "Project")
+		scratch = pathlib.Path(temp_dir, "Scratch")
+		scratch.mkdir()
+
+		print(f"Building a synthetic project with {args.bins} bins...")
+		suite = Benchmarks(project, make_project(project, bin_count=args.bins), scratch)
+
+		for name in Benchmarks.names():
+
+			if args.filter not in name:
+				continue
+
+			func, items = getattr(suite, f"bench_{name}")()
+			best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+			results["benchmarks"][name] = {"seconds": best, "items": items, "usec_per_item": best / items * 1_000_000}
+			print(f"{name:>30}:  {best:8.4f} s  ({best / items * 1_000_000:.2f} usec each, {items} items)")
+
+	RESULTS_DIR.mkdir(exist_ok=True)
+	results_path = RESULTS_DIR / f"{results['timestamp'].replace(':', '')}_{results['revision']}.json"
+	results_path.write_text(json.dumps(results, indent="\t"))
+	print(f"\nSaved results to {results_path}")
+
+	if args.compare:
+		compare(results, json.loads(args.compare.read_text()), args.threshold)
@@ -0,0 +1,76 @@
+"""
+Build synthetic Avid projects full of realistic bin logs, for benchmarking
+
+Usage: python benchmarks/synthetic.py output_dir [bin_count]
+"""
+
+import sys, os, pathlib, random, datetime, typing
+from binhistory import BinLog, BinLogEntry, defaults
+
+def make_project(root:str, bin_count:int=1000, seed:int=0, user_count:int=60, computer_count:int=40, leap_day_ratio:float=0.02, corrupt_ratio:float=0.01, bins_per_folder:int=50) -> typing.List[pathlib.Path]:
+	"""
+	Create a synthetic Avid project at ``root`` with ``bin_count`` bins and their logs, returning the bin paths
+
+	Each log gets between 1 and :data:`.defaults.MAX_ENTRIES` entries from a pool of users and computers, with 
+	its modified time set to match its latest entry (like Avid would).  Some logs include a Feb 29 entry, some 
+	are corrupt, and every bin also gets a ``._`` resource fork for the scanner to skip.
+	"""
+
+	rng = random.Random(seed)
+	root = pathlib.Path(root)
+
+	users     = [f"Editor {i}"[:defaults.MAX_FIELD_LENGTH] for i in range(user_count)]
+	computers = [f"zBay{i:02}"[:defaults.MAX_FIELD_LENGTH] for i in range(computer_count)]
+	now       = datetime.datetime(2025, 6, 1, 12, 0, 0)
+
+	bin_paths = []
+
+	for bin_index in range(bin_count):
+
+		folder = root / f"{bin_index // bins_per_folder:02} Folder"
+		folder.mkdir(parents=True, exist_ok=True)
+
+		bin_path = folder / f"Reel {bin_index}.avb"
+		bin_path.write_bytes(b"")
+		(folder / f"._Reel {bin_index}.avb").write_bytes(b"\x00\x05\x16\x07")
+		bin_paths.append(bin_path)
+
+		log_path = bin_path.with_suffix(defaults.DEFAULT_FILE_EXTENSION)
+
+		if rng.random() < corrupt_ratio:
+			log_path.write_text(rng.choice([
+				"Heehee oops\n",
+				"Tue Jun 27 17:22:13  Computer: zTimmy\n",
+				"Xyz Jun 27 17:22:13  Computer: zTimmy          User: user           \n",
+			]))
+			continue
+
+		# The Feb 29 entry is always the oldest, so leave room for it or `to_string()` would trim it right back off
+		has_leap_day = rng.random() < leap_day_ratio
+
+		# Walk backwards from a recent-ish time in realistic-ish hops
+		timestamp = now - datetime.timedelta(days=rng.randint(0, 365))
+		entries = []
+		for _ in range(rng.randint(1, defaults.MAX_ENTRIES - 1 if has_leap_day else defaults.MAX_ENTRIES)):
+			entries.append(BinLogEntry(timestamp=timestamp.replace(microsecond=0), computer=rng.choice(computers), user=rng.choice(users)))
+			timestamp -= datetime.timedelta(minutes=rng.randint(1, 60 * 24 * 7))
+		
+		if has_leap_day:
+			entries.append(BinLogEntry(timestamp=datetime.datetime(2024, 2, 29, rng.randint(0, 23), rng.randint(0, 59)), computer=rng.choice(computers), user=rng.choice(users)))
+
+		log = BinLog(entries)
+		log.to_path(log_path)
+
+		latest = log.latest_entry().timestamp.timestamp()
+		os.utime(log_path, (latest, latest))
+	
+	return bin_paths
+
+if __name__ == "__main__":
+
+	if not len(sys.argv) > 1:
+		print(f"Usage: {pathlib.Path(__file__).name} output_dir [bin_count]", file=sys.stderr)
+		sys.exit(1)
+
+	bin_paths = make_project(sys.argv[1], bin_count=int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
+	print(f"Created {len(bin_paths)} bins in {sys.argv[1]}")
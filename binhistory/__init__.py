@@ -5,5 +5,16 @@ Written by Michael Jordan <michael@glowingpixel.com>
 """
 
 from . import exceptions, defaults
-from ._binlog import BinLog
-from ._binlogentry import BinLogEntry
\ No newline at end of file
+from ._binlog import BinLog, TouchResult
+from ._binlogentry import BinLogEntry, clear_interned_names
+from ._binlogstats import BinLogStats
+from ._sortedbinlog import SortedBinLog
+from ._binlogtable import BinLogTable
+from ._instrumentation import stats, Instrumentation
+from ._locking import BinLogLock, lock_metrics
+from ._async import ascan_project
+from ._scan import scan_project, walk_project, LogFileInfo
+from ._export import export_csv, export_jsonl, export_parquet, iter_rows, iter_record_batches, ExportRow
+from ._scanindex import ScanIndex, ScanIndexChanges
+from ._accessindex import AccessIndex, Posting
+from ._watch import watch, LogWatcher
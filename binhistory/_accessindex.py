@@ -0,0 +1,168 @@
+"""
+`AccessIndex`: who touched which bins, and when, across a whole project
+"""
+
+import bisect, datetime, os, typing
+
+from ._binlog import BinLog
+from ._binlogentry import BinLogEntry
+
+class Posting(typing.NamedTuple):
+	"""One access to a bin by a user or computer in an :class:`AccessIndex`"""
+
+	timestamp:datetime.datetime
+	"""When the bin was accessed"""
+
+	bin_path:str
+	"""Path to the bin"""
+
+class AccessIndex:
+	"""
+	An inverted index from each user and computer to the bins they've touched, in time order
+
+	Build one from a scan with :meth:`from_project` or :meth:`from_scan`, then ask things like "which bins did
+	``zBay4`` touch this week?" with :meth:`bins_touched`, without reading any logs.  When a log changes, only
+	that bin needs to be re-indexed, with :meth:`update_bin`.
+	"""
+
+	def __init__(self):
+
+		self._user_postings:typing.Dict[str, typing.List[Posting]] = dict()
+		self._computer_postings:typing.Dict[str, typing.List[Posting]] = dict()
+
+		self._bin_entries:typing.Dict[str, typing.List[BinLogEntry]] = dict()
+		"""Entries currently indexed for each bin, so they can be taken out again"""
+
+	@classmethod
+	def from_project(cls, root:str, workers:typing.Optional[int]=None, use_processes:bool=False) -> "AccessIndex":
+		"""Build an index of every log in an Avid project (see :func:`.scan_project`).  Logs that can't be read are left out."""
+		from ._scan import scan_project
+		return cls.from_scan(scan_project(root, workers=workers, use_processes=use_processes))
+
+	@classmethod
+	def from_scan(cls, scan_results:typing.Iterable[typing.Tuple[str, typing.Union[BinLog, Exception]]]) -> "AccessIndex":
+		"""Build an index from ``(bin_path, log)`` results, such as those from :func:`.scan_project` or :meth:`.ScanIndex.scan`.  Exceptions are skipped."""
+
+		index = cls()
+
+		for bin_path, log in scan_results:
+			if isinstance(log, Exception):
+				continue
+			# A bin listed more than once keeps only its last log, as with `update_bin`
+			index._bin_entries[os.fspath(bin_path)] = list(log)
+
+		for bin_path, entries in index._bin_entries.items():
+			for entry in entries:
+				index._user_postings.setdefault(entry.user, []).append(Posting(entry.timestamp, bin_path))
+				index._computer_postings.setdefault(entry.computer, []).append(Posting(entry.timestamp, bin_path))
+
+		# Cheaper to sort everything once at the end than to keep it sorted along the way
+		for postings in (*index._user_postings.values(), *index._computer_postings.values()):
+			postings.sort()
+
+		return index
+
+	# Updates
+	def update_bin(self, bin_path:str, log:typing.Optional[typing.Iterable[BinLogEntry]]=None):
+		"""
+		Re-index one bin with its current log
+
+		The log is read from disk unless given.  A bin whose log no longer exists is removed from the index.
+		"""
+		bin_path = os.fspath(bin_path)
+
+		if log is None:
+			try:
+				log = BinLog.from_bin(bin_path)
+			except FileNotFoundError:
+				self.remove_bin(bin_path)
+				return
+
+		entries = list(log)
+		self.remove_bin(bin_path)
+		self._bin_entries[bin_path] = entries
+
+		for entry in entries:
+			bisect.insort(self._user_postings.setdefault(entry.user, []), Posting(entry.timestamp, bin_path))
+			bisect.insort(self._computer_postings.setdefault(entry.computer, []), Posting(entry.timestamp, bin_path))
+
+	def remove_bin(self, bin_path:str):
+		"""Take a bin out of the index (it's fine if it wasn't there)"""
+
+		bin_path = os.fspath(bin_path)
+
+		for entry in self._bin_entries.pop(bin_path, []):
+			_remove_posting(self._user_postings, entry.user, Posting(entry.timestamp, bin_path))
+			_remove_posting(self._computer_postings, entry.computer, Posting(entry.timestamp, bin_path))
+
+	# Queries
+	def user_postings(self, user:str, start:typing.Optional[datetime.datetime]=None, end:typing.Optional[datetime.datetime]=None) -> typing.List[Posting]:
+		"""Every access by ``user`` between ``start`` and ``end`` (inclusive), oldest first"""
+		return _window(self._user_postings.get(user, []), start, end)
+
+	def computer_postings(self, computer:str, start:typing.Optional[datetime.datetime]=None, end:typing.Optional[datetime.datetime]=None) -> typing.List[Posting]:
+		"""Every access from ``computer`` between ``start`` and ``end`` (inclusive), oldest first"""
+		return _window(self._computer_postings.get(computer, []), start, end)
+
+	def bins_touched(self, users:typing.Union[str, typing.Iterable[str]]=(), computers:typing.Union[str, typing.Iterable[str]]=(), start:typing.Optional[datetime.datetime]=None, end:typing.Optional[datetime.datetime]=None) -> typing.List[str]:
+		"""Paths of the bins touched by any of the given ``users`` or ``computers`` between ``start`` and ``end`` (inclusive), most recently touched first"""
+
+		users     = [users] if isinstance(users, str) else users
+		computers = [computers] if isinstance(computers, str) else computers
+
+		last_touched:typing.Dict[str, datetime.datetime] = dict()
+
+		for postings in [self.user_postings(user, start, end) for user in users] + [self.computer_postings(computer, start, end) for computer in computers]:
+			for timestamp, bin_path in postings:
+				if bin_path not in last_touched or timestamp > last_touched[bin_path]:
+					last_touched[bin_path] = timestamp
+
+		return sorted(last_touched, key=lambda bin_path: (last_touched[bin_path], bin_path), reverse=True)
+
+	@property
+	def users(self) -> typing.List[str]:
+		"""Every user in the index"""
+		return list(self._user_postings)
+
+	@property
+	def computers(self) -> typing.List[str]:
+		"""Every computer in the index"""
+		return list(self._computer_postings)
+
+	@property
+	def bin_paths(self) -> typing.List[str]:
+		"""Every bin in the index"""
+		return list(self._bin_entries)
+
+	def __len__(self) -> int:
+		return len(self._bin_entries)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} bins={len(self)} users={len(self.users)} computers={len(self.computers)}>"
+
+def _window(postings:typing.List[Posting], start:typing.Optional[datetime.datetime], end:typing.Optional[datetime.datetime]) -> typing.List[Posting]:
+	"""The postings between ``start`` and ``end`` (inclusive), found by bisecting"""
+
+	# A one-item tuple sorts before any posting with the same timestamp
+	start_index = bisect.bisect_left(postings, (start,)) if start is not None else 0
+
+	if end is None or end == datetime.datetime.max:
+		end_index = len(postings)
+	else:
+		end_index = bisect.bisect_left(postings, (end + datetime.timedelta(microseconds=1),))
+
+	return postings[start_index:end_index]
+
+def _remove_posting(postings_by_name:typing.Dict[str, typing.List[Posting]], name:str, posting:Posting):
+	"""Remove one posting for a user or computer, dropping them altogether once they have none left"""
+
+	postings = postings_by_name.get(name)
+	if not postings:
+		return
+
+	index = bisect.bisect_left(postings, posting)
+	if index < len(postings) and postings[index] == posting:
+		del postings[index]
+
+	if not postings:
+		del postings_by_name[name]
@@ -0,0 +1,83 @@
+"""
+asyncio helpers, for reading and writing logs without blocking the event loop
+"""
+
+import collections, concurrent.futures, functools, itertools, typing, weakref
+
+from ._binlog import BinLog
+from .defaults import DEFAULT_ASYNC_CONCURRENCY
+
+_default_limiters:"weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+"""One shared semaphore per event loop, for calls that don't bring their own"""
+
+# `asyncio` is only imported once an async function is actually called, so `import binhistory` doesn't pay for it
+
+def _default_limiter() -> "asyncio.Semaphore":
+	"""The default semaphore for the running event loop, allowing :data:`.defaults.DEFAULT_ASYNC_CONCURRENCY` file operations at once"""
+	import asyncio
+
+	loop = asyncio.get_running_loop()
+	if loop not in _default_limiters:
+		_default_limiters[loop] = asyncio.Semaphore(DEFAULT_ASYNC_CONCURRENCY)
+	return _default_limiters[loop]
+
+async def _run_blocking(func:typing.Callable, *args, limiter:typing.Optional["asyncio.Semaphore"]=None, executor:typing.Optional[concurrent.futures.Executor]=None, **kwargs) -> typing.Any:
+	"""Run a blocking call on an executor, once ``limiter`` lets us"""
+	import asyncio
+
+	loop = asyncio.get_running_loop()
+
+	async with (limiter or _default_limiter()):
+		return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+async def ascan_project(root:str, limiter:typing.Optional["asyncio.Semaphore"]=None, executor:typing.Optional[concurrent.futures.Executor]=None) -> typing.AsyncIterator[typing.Tuple[str, typing.Union[BinLog, Exception]]]:
+	"""
+	Read and parse every ``.log`` file in an Avid project without blocking the event loop
+
+	Like :func:`.scan_project`, yields a ``(bin_path, result)`` tuple for each log as soon as it has been read, 
+	where ``result`` is either the :class:`.BinLog`, or the exception raised while reading it.  At most ``limiter`` 
+	logs are read at once (:data:`.defaults.DEFAULT_ASYNC_CONCURRENCY` by default).
+	"""
+	import asyncio
+	from ._scan import walk_project, _read_walked_log
+
+	limiter = limiter or _default_limiter()
+
+	# As with `scan_project`, the project is walked as reads are needed and only so many are in flight at once, 
+	# so finished logs can't pile up in memory when they're read faster than the caller gets through them
+	window = DEFAULT_ASYNC_CONCURRENCY * 2
+	log_infos = walk_project(root)
+	walked:typing.Deque["LogFileInfo"] = collections.deque()
+
+	async def read_log(log_info:"LogFileInfo") -> typing.Tuple[str, typing.Union[BinLog, Exception]]:
+		try:
+			return log_info.bin_path, await _run_blocking(_read_walked_log, log_info, limiter=limiter, executor=executor)
+		except (OSError, ValueError) as e:
+			return log_info.bin_path, e
+	
+	async def fill(reads:typing.Set["asyncio.Future"]) -> typing.Set["asyncio.Future"]:
+		"""Top up the in-flight reads, walking a little more of the project (off the event loop) when needed"""
+
+		while len(reads) < window:
+
+			if not walked:
+				walked.extend(await _run_blocking(lambda: list(itertools.islice(log_infos, window)), limiter=limiter, executor=executor))
+				if not walked:
+					break
+			
+			reads.add(asyncio.ensure_future(read_log(walked.popleft())))
+		
+		return reads
+
+	reads = await fill(set())
+
+	try:
+		while reads:
+			done, reads = await asyncio.wait(reads, return_when=asyncio.FIRST_COMPLETED)
+			for read in done:
+				yield read.result()
+			reads = await fill(reads)
+	finally:
+		# Don't leave reads running if the caller stopped early
+		for read in reads:
+			read.cancel()
@@ -2,15 +2,25 @@
 `BinLog` class (a.k.a THE MEAT)
 """
 
-import collections, datetime, typing
+import bisect, collections, datetime, typing
 
 from ._binlogentry import BinLogEntry
-from .defaults import MAX_ENTRIES, DEFAULT_FILE_EXTENSION
-from .exceptions import BinLogTypeError, BinLogNotFoundError, BinNotFoundError, BinLogParseError
+from ._instrumentation import stats as _stats
+from .defaults import MAX_ENTRIES, MAX_FIELD_LENGTH, DEFAULT_FILE_EXTENSION, DEFAULT_BIN_EXTENSION, DEFAULT_LOCK_TIMEOUT, DEFAULT_ENCODINGS, FIELD_START_COMPUTER, FIELD_START_USER
+from .exceptions import BinLogTypeError, BinLogNotFoundError, BinNotFoundError, BinLogParseError, BinLogLineError
 
 class BinLog(collections.UserList):
 	"""An .avb access log"""
 
+	_raw_lines:typing.Optional[typing.List[str]] = None
+	"""Unparsed lines from a lazily-loaded log, or ``None`` once they've been parsed"""
+
+	_raw_max_year:typing.Optional[int] = None
+	"""The ``max_year`` to use when parsing `_raw_lines`"""
+
+	_sorted_index:typing.Optional[typing.Tuple[typing.List[datetime.datetime], typing.List[BinLogEntry]]] = None
+	"""Timestamps and entries in sorted order for the time queries, or ``None`` until they're needed again after a change"""
+
 	def __init__(self, entries:typing.Optional[typing.Iterable[BinLogEntry]]=None):
 
 		if entries is None:
@@ -27,6 +37,34 @@ class BinLog(collections.UserList):
 
 		super().__init__(entries)
 	
+	@property
+	def data(self) -> typing.List[BinLogEntry]:
+		"""The underlying list of entries (parsing any lazily-loaded lines first)"""
+		if self._raw_lines is not None:
+			self._parse_raw_lines()
+		return self._data
+	
+	@data.setter
+	def data(self, entries:typing.List[BinLogEntry]):
+		self._data = entries
+		self._raw_lines = None
+		self._sorted_index = None
+	
+	def _parse_raw_lines(self):
+		"""Parse the lines of a lazily-loaded log into entries"""
+		self.data = BinLogEntry.parse_lines(self._raw_lines, max_year=self._raw_max_year)
+	
+	@property
+	def is_parsed(self) -> bool:
+		"""Whether the entries have been parsed yet (always ``True`` unless loaded with ``lazy=True``)"""
+		return self._raw_lines is None
+
+	def __len__(self) -> int:
+		# A lazily-loaded log has one entry per line, so no need to parse just to count them
+		if self._raw_lines is not None:
+			return len(self._raw_lines)
+		return super().__len__()
+
 	# Validators
 	@staticmethod
 	def _validate_item(item:typing.Any):
@@ -44,8 +82,13 @@ class BinLog(collections.UserList):
 	
 	def __setitem__(self, index:int, item:typing.Any):
 		self._validate_item(item)
+		self._sorted_index = None
 		super().__setitem__(index, item)
 	
+	def __delitem__(self, index:int):
+		self._sorted_index = None
+		super().__delitem__(index)
+	
 	def __add__(self, other):
 		if not isinstance(other, self.__class__):
 			raise BinLogTypeError(f"Can only add another {self.__class__.__name__} (got {type(other).__name__})")
@@ -54,14 +97,21 @@ class BinLog(collections.UserList):
 	def __iadd__(self, other):
 		if not isinstance(other, self.__class__):
 			raise BinLogTypeError(f"Can only add another {self.__class__.__name__} (got {type(other).__name__})")
+		self._sorted_index = None
 		return super().__iadd__(other)
 	
+	def __imul__(self, n:int):
+		self._sorted_index = None
+		return super().__imul__(n)
+	
 	def insert(self, i, item):
 		self._validate_item(item)
+		self._sorted_index = None
 		return super().insert(i, item)
 	
 	def append(self, item):
 		self._validate_item(item)
+		self._sorted_index = None
 		return super().append(item)
 	
 	def extend(self, other):
@@ -70,8 +120,21 @@ class BinLog(collections.UserList):
 				self._validate_item(o)
 		except TypeError as e:
 			raise BinLogTypeError(e) from e
+		self._sorted_index = None
 		return super().extend(other)
 	
+	def pop(self, i:int=-1) -> BinLogEntry:
+		self._sorted_index = None
+		return super().pop(i)
+	
+	def remove(self, item:BinLogEntry):
+		self._sorted_index = None
+		super().remove(item)
+	
+	def clear(self):
+		self._sorted_index = None
+		super().clear()
+	
 	# Formatters
 	def to_string(self) -> str:
 		"""Format as string"""
@@ -80,48 +143,127 @@ class BinLog(collections.UserList):
 
 	# Readers
 	@classmethod
-	def from_bin(cls, bin_path:str, missing_bin_ok:bool=True, max_year:typing.Optional[int]=None) -> "BinLog":
+	def from_bin(cls, bin_path:str, missing_bin_ok:bool=True, max_year:typing.Optional[int]=None, lazy:bool=False, encodings:typing.Optional[typing.Sequence[str]]=None) -> "BinLog":
 		"""Load an existing .log file for a given bin"""
-		return cls.from_path(BinLog.log_path_from_bin_path(bin_path, missing_bin_ok=missing_bin_ok), max_year)
+		return cls.from_path(BinLog.log_path_from_bin_path(bin_path, missing_bin_ok=missing_bin_ok), max_year, lazy=lazy, encodings=encodings)
 
 	@classmethod
-	def from_path(cls, log_path:str, max_year:typing.Optional[int]=None) -> "BinLog":
-		"""Load from an existing .log file"""
-		# NOTE: Encountered mac_roman, need to deal with older encodings sometimes
+	def from_path(cls, log_path:str, max_year:typing.Optional[int]=None, lazy:bool=False, encodings:typing.Optional[typing.Sequence[str]]=None) -> "BinLog":
+		"""
+		Load from an existing .log file
+
+		The file is read as bytes in one go, and decoded with the first of ``encodings`` that works 
+		(:data:`.defaults.DEFAULT_ENCODINGS` by default: UTF-8, then mac_roman).
+		"""
 
 		try:
-			with open (log_path, "r") as log_handle:
-				return cls.from_stream(log_handle, max_year=max_year)
+			lines, mtime_year = _read_log_file(log_path, encodings)
 		except FileNotFoundError as e:
 			raise BinLogNotFoundError(f"A log file was not found at the given path {log_path}") from e
-		except UnicodeDecodeError as e:
-			raise BinLogParseError(f"Error decoding log: {e}") from e
+		
+		return cls._from_lines(lines, max_year or mtime_year, lazy=lazy)
 	
 	@classmethod
-	def from_stream(cls, file_handle:typing.TextIO, max_year:typing.Optional[int]=None) -> "BinLog":
-		"""Parse a log from an open file handle"""
-		import os
+	def from_bytes(cls, log_bytes:bytes, max_year:typing.Optional[int]=None, lazy:bool=False, encodings:typing.Optional[typing.Sequence[str]]=None) -> "BinLog":
+		"""
+		Parse a log from the raw bytes of a .log file, decoded with the first of ``encodings`` that works
+
+		Without a ``max_year``, the current year is assumed.
+		"""
+		return cls._from_lines(_split_log_lines(_decode_log_bytes(log_bytes, encodings)), max_year, lazy=lazy)
+	
+	@classmethod
+	def from_stream(cls, file_handle:typing.TextIO, max_year:typing.Optional[int]=None, lazy:bool=False) -> "BinLog":
+		"""
+		Parse a log from an open file handle
+
+		With ``lazy=True``, the lines are only read here.  They are parsed the first time the entries are needed, 
+		so any :class:`.exceptions.BinLogParseError` is raised then instead.
+		"""
+		max_year = max_year or cls._max_year_from_stream(file_handle)
+
+		with _stats.timer("read"):
+			lines = file_handle.readlines()
 		
-		# If we didn't get a `max_year` anywhere else, use the mtime
-		if not max_year:
-			stat_info = os.fstat(file_handle.fileno())
-			max_year =datetime.datetime.fromtimestamp(stat_info.st_mtime).year
-
-		entries = []
-		for entry in file_handle:
-			entries.append(BinLogEntry.from_string(entry, max_year=max_year))
+		return cls._from_lines(lines, max_year, lazy=lazy)
+	
+	@classmethod
+	def _from_lines(cls, lines:typing.List[str], max_year:typing.Optional[int]=None, lazy:bool=False) -> "BinLog":
+		"""Parse a log from the raw lines of a .log file, or hold onto them for later with ``lazy=True``"""
+
+		if lazy:
+			log = cls()
+			log._raw_lines    = lines
+			log._raw_max_year = max_year
+			return log
+		
+		with _stats.timer("parse"):
+			entries = BinLogEntry.parse_lines(lines, max_year=max_year)
 		
 		return cls(entries)
 
+	@classmethod
+	def iter_entries(cls, file_handle:typing.TextIO, max_year:typing.Optional[int]=None, on_error:str="raise") -> typing.Iterator[typing.Union[BinLogEntry, BinLogLineError]]:
+		"""
+		Parse a log from an open file handle one line at a time, yielding each :class:`.BinLogEntry` as it goes
+
+		``on_error`` determines what happens with a line that can't be parsed:
+
+		- ``"raise"``: Raise a :class:`.exceptions.BinLogLineError` (the default)
+		- ``"skip"``:  Quietly skip the line and carry on
+		- ``"yield"``: Yield the :class:`.exceptions.BinLogLineError` in place of the entry, and carry on
+		"""
+
+		if on_error not in ("raise", "skip", "yield"):
+			raise ValueError(f"`on_error` must be one of \"raise\", \"skip\" or \"yield\" (got {on_error!r})")
+
+		max_year = max_year or cls._max_year_from_stream(file_handle)
+
+		for line_number, line in enumerate(file_handle, start=1):
+
+			try:
+				entry = BinLogEntry.from_string(line, max_year=max_year)
+			except ValueError as e:
+				if on_error == "skip":
+					continue
+				error = BinLogLineError(f"Line {line_number}: {e}", line_number=line_number, line=line)
+				if on_error == "raise":
+					raise error from e
+				yield error
+				continue
+			
+			yield entry
+	
+	@staticmethod
+	def _max_year_from_stream(file_handle:typing.IO) -> int:
+		"""If we didn't get a `max_year` anywhere else, use the mtime"""
+		import os
+
+		stat_info = os.fstat(file_handle.fileno())
+		return datetime.datetime.fromtimestamp(stat_info.st_mtime).year
+
 	# Writers
 	def to_bin(self, bin_path:str, missing_bin_ok:bool=True):
 		"""Write to a log for a given bin"""
 		self.to_path(BinLog.log_path_from_bin_path(bin_path, missing_bin_ok=missing_bin_ok))
 
-	def to_path(self, file_path:str):
-		"""Write log to filepath"""
+	def to_path(self, file_path:str, atomic:bool=False, fsync:bool=False):
+		"""
+		Write log to filepath
+
+		With ``atomic=True``, the log is written to a temporary file alongside ``file_path`` and then renamed over it, 
+		so a crash or a concurrent reader never sees a half-written log.  ``fsync=True`` also flushes it to disk first.
+		"""
+		if atomic:
+			_write_text_atomic(file_path, self.to_string(), fsync=fsync)
+			return
+
 		with open(file_path, "w", encoding="utf-8") as output_handle:
 			self.to_stream(output_handle)
+			if fsync:
+				import os
+				output_handle.flush()
+				os.fsync(output_handle.fileno())
 	
 	def to_stream(self, file_handle:typing.TextIO):
 		"""Write log to given stream"""
@@ -130,12 +272,78 @@ class BinLog(collections.UserList):
 	# Convenience methods	
 	def earliest_entry(self) -> typing.Optional[BinLogEntry]:
 		"""Get the first/earliest entry from a bin log"""
+		if self._raw_lines is not None:
+			return self._raw_line_entry(min)
 		return min(self) if self else None
 
 	def latest_entry(self) -> typing.Optional[BinLogEntry]:
 		"""Get the last/latest/most recent entry from a bin log"""
+		if self._raw_lines is not None:
+			return self._raw_line_entry(max)
 		return max(self) if self else None
 	
+	# Time queries
+	def entry_at_or_before(self, timestamp:datetime.datetime) -> typing.Optional[BinLogEntry]:
+		"""Get the latest entry made at or before ``timestamp``, or ``None`` if there isn't one"""
+		timestamps, entries = self._get_sorted_index()
+		index = bisect.bisect_right(timestamps, timestamp)
+		return entries[index - 1] if index else None
+	
+	def entry_at_or_after(self, timestamp:datetime.datetime) -> typing.Optional[BinLogEntry]:
+		"""Get the earliest entry made at or after ``timestamp``, or ``None`` if there isn't one"""
+		timestamps, entries = self._get_sorted_index()
+		index = bisect.bisect_left(timestamps, timestamp)
+		return entries[index] if index < len(entries) else None
+	
+	def nearest(self, timestamp:datetime.datetime, tolerance:typing.Optional[datetime.timedelta]=None) -> typing.Optional[BinLogEntry]:
+		"""
+		Get the entry made closest to ``timestamp``, before or after (the earlier one wins a tie)
+
+		If a ``tolerance`` is given, entries further away than that don't count.  Returns ``None`` if there's no entry to be had.
+		"""
+		before = self.entry_at_or_before(timestamp)
+		after  = self.entry_at_or_after(timestamp)
+
+		if before is None or (after is not None and after.timestamp - timestamp < timestamp - before.timestamp):
+			closest = after
+		else:
+			closest = before
+		
+		if closest is None or (tolerance is not None and abs(closest.timestamp - timestamp) > tolerance):
+			return None
+		return closest
+	
+	def between(self, start:typing.Optional[datetime.datetime]=None, end:typing.Optional[datetime.datetime]=None) -> "BinLog":
+		"""Get a new log with only the entries made between ``start`` and ``end`` (inclusive), in order.  Either end may be left open with ``None``."""
+		timestamps, entries = self._get_sorted_index()
+		start_index = bisect.bisect_left(timestamps, start) if start is not None else 0
+		end_index   = bisect.bisect_right(timestamps, end) if end is not None else len(entries)
+		return self.__class__(entries[start_index:end_index])
+	
+	def _get_sorted_index(self) -> typing.Tuple[typing.List[datetime.datetime], typing.List[BinLogEntry]]:
+		"""The timestamps and entries in sorted order, sorted once and kept until the log is changed"""
+		if self._sorted_index is None:
+			entries = sorted(self.data)
+			self._sorted_index = ([entry.timestamp for entry in entries], entries)
+		return self._sorted_index
+
+	def _raw_line_entry(self, picker:typing.Callable) -> typing.Optional[BinLogEntry]:
+		"""Pick one entry from the raw lines of a lazily-loaded log by its fields, without building an entry for every line"""
+		from ._binlogentry import _fields_from_string, _validate_fields, _trusted_entry
+
+		if not self._raw_lines:
+			return None
+		
+		max_year = self._raw_max_year
+
+		def checked_fields(line:str) -> typing.Tuple[datetime.datetime, str, str]:
+			# Every line is validated, so a bad one raises just as it would if the log were fully parsed
+			fields = _fields_from_string(line, max_year)
+			_validate_fields(*fields)
+			return fields
+
+		return _trusted_entry(*picker(map(checked_fields, self._raw_lines)))
+	
 	def users(self) -> typing.List[str]:
 		"""Get a list of unique users in the log"""
 		return list(set(e.user for e in self))
@@ -149,23 +357,133 @@ class BinLog(collections.UserList):
 		return list(set(e.timestamp for e in self))
 	
 	@classmethod
-	def touch(cls, log_path:str, entry:typing.Optional[BinLogEntry]=None):
-		"""Add an entry to a log file"""
-		import pathlib
+	def touch(cls, log_path:str, entry:typing.Optional[BinLogEntry]=None, atomic:bool=True, fsync:bool=False, lock:bool=False, lock_timeout:float=DEFAULT_LOCK_TIMEOUT):
+		"""
+		Add an entry to a log file
 
-		entries = [entry or BinLogEntry()]
+		By default, the log is rewritten atomically (see :meth:`to_path`).  If the existing log is already valid 
+		and sorted, and the new entry is the latest, the existing lines are kept as-is rather than re-formatted.
+
+		With ``lock=True``, a :class:`.BinLogLock` is held around the whole read-modify-write, so that other 
+		processes touching the same log with ``lock=True`` don't lose each other's entries.  If the lock can't be 
+		acquired within ``lock_timeout`` seconds, :class:`.exceptions.BinLogLockError` is raised.
+		"""
+		cls._touch(log_path, entry or BinLogEntry(), atomic=atomic, fsync=fsync, lock=lock, lock_timeout=lock_timeout)
+	
+	@classmethod
+	def _touch(cls, log_path:str, entry:BinLogEntry, entry_line:typing.Optional[str]=None, atomic:bool=True, fsync:bool=False, lock:bool=False, lock_timeout:float=DEFAULT_LOCK_TIMEOUT):
+		"""Add an entry to a log file, optionally with ``entry_line`` already formatted"""
+
+		with _stats.timer("touch"):
+			cls._touch_log(log_path, entry, entry_line, atomic=atomic, fsync=fsync, lock=lock, lock_timeout=lock_timeout)
+	
+	@classmethod
+	def _touch_log(cls, log_path:str, entry:BinLogEntry, entry_line:typing.Optional[str]=None, atomic:bool=True, fsync:bool=False, lock:bool=False, lock_timeout:float=DEFAULT_LOCK_TIMEOUT):
+		"""The read-modify-write part of :meth:`touch`"""
+
+		if lock:
+			from ._locking import BinLogLock
+			with BinLogLock(log_path, timeout=lock_timeout):
+				cls._touch_log(log_path, entry, entry_line, atomic=atomic, fsync=fsync, lock=False)
+			return
 
 		# Read in any existing entries
-		if pathlib.Path(log_path).is_file():
-			entries.extend(cls.from_path(log_path))
+		try:
+			existing_lines, max_year = _read_log_file(log_path)
+		except FileNotFoundError:
+			existing_lines, max_year = [], None
+		
+		with _stats.timer("format"):
+
+			log_string = _append_to_sorted_lines(existing_lines, entry, max_year, entry_line)
+
+			if log_string is None:
+				log_string = BinLog([entry] + BinLogEntry.parse_lines(existing_lines, max_year=max_year)).to_string()
+		
+		with _stats.timer("write"):
+			cls._write_touched_log(log_path, log_string, atomic=atomic, fsync=fsync)
+		
+		_stats.count("files_written")
+		if _stats.enabled:
+			# Bytes as written, not characters
+			_stats.count("bytes_written", len(log_string.encode("utf-8")))
+	
+	@staticmethod
+	def _write_touched_log(log_path:str, log_string:str, atomic:bool=True, fsync:bool=False):
+		"""Write out the new log for :meth:`touch`"""
+
+		if atomic:
+			_write_text_atomic(log_path, log_string, fsync=fsync)
+			return
 		
-		BinLog(entries).to_path(log_path)
+		with open(log_path, "w", encoding="utf-8") as output_handle:
+			output_handle.write(log_string)
+			if fsync:
+				import os
+				output_handle.flush()
+				os.fsync(output_handle.fileno())
 	
 	@classmethod
-	def touch_bin(cls, bin_path:str, entry:typing.Optional[BinLogEntry]=None, missing_bin_ok:bool=True):
+	def touch_bin(cls, bin_path:str, entry:typing.Optional[BinLogEntry]=None, missing_bin_ok:bool=True, atomic:bool=True, fsync:bool=False, lock:bool=False, lock_timeout:float=DEFAULT_LOCK_TIMEOUT):
 		"""Add an entry to a log file for a given bin"""
-		cls.touch(BinLog.log_path_from_bin_path(bin_path, missing_bin_ok), entry)
+		cls.touch(BinLog.log_path_from_bin_path(bin_path, missing_bin_ok), entry, atomic=atomic, fsync=fsync, lock=lock, lock_timeout=lock_timeout)
 	
+	@classmethod
+	def touch_many(cls, bin_paths:typing.Iterable[str], entry:typing.Optional[BinLogEntry]=None, workers:typing.Optional[int]=None, missing_bin_ok:bool=True, atomic:bool=True, fsync:bool=False, lock:bool=False, lock_timeout:float=DEFAULT_LOCK_TIMEOUT) -> typing.List["TouchResult"]:
+		"""
+		Add the same entry to the logs of many bins at once, on a pool of threads
+
+		Rather than stopping at the first problem, returns a :class:`.TouchResult` for each bin, in the same order 
+		as ``bin_paths``.  Other options are the same as :meth:`touch`.
+		"""
+		import os
+		from ._scan import _map_threaded
+
+		entry = entry or BinLogEntry()
+		entry_line = entry.to_string() + "\n"
+
+		bin_paths = [os.fspath(bin_path) for bin_path in bin_paths]
+		log_paths = {bin_path: os.path.splitext(bin_path)[0] + DEFAULT_FILE_EXTENSION for bin_path in bin_paths}
+
+		def touch_bin(bin_path:str):
+			if not missing_bin_ok and not os.path.isfile(bin_path):
+				raise BinNotFoundError(f"An existing bin was not found at {bin_path}")
+			cls._touch(log_paths[bin_path], entry, entry_line, atomic=atomic, fsync=fsync, lock=lock, lock_timeout=lock_timeout)
+		
+		errors = dict(_map_threaded(dict.fromkeys(bin_paths), workers, touch_bin))
+
+		return [TouchResult(bin_path, log_paths[bin_path], errors[bin_path]) for bin_path in bin_paths]
+
+	# Async
+	@classmethod
+	async def afrom_bin(cls, bin_path:str, missing_bin_ok:bool=True, max_year:typing.Optional[int]=None, lazy:bool=False, encodings:typing.Optional[typing.Sequence[str]]=None, limiter:typing.Optional["asyncio.Semaphore"]=None, executor:typing.Optional["concurrent.futures.Executor"]=None) -> "BinLog":
+		"""Load an existing .log file for a given bin, without blocking the event loop (see :meth:`from_bin`)"""
+		from ._async import _run_blocking
+		return await _run_blocking(cls.from_bin, bin_path, missing_bin_ok=missing_bin_ok, max_year=max_year, lazy=lazy, encodings=encodings, limiter=limiter, executor=executor)
+
+	@classmethod
+	async def afrom_path(cls, log_path:str, max_year:typing.Optional[int]=None, lazy:bool=False, encodings:typing.Optional[typing.Sequence[str]]=None, limiter:typing.Optional["asyncio.Semaphore"]=None, executor:typing.Optional["concurrent.futures.Executor"]=None) -> "BinLog":
+		"""
+		Load from an existing .log file, without blocking the event loop (see :meth:`from_path`)
+		
+		The file is read on ``executor`` (the event loop's default executor if ``None``), once the ``limiter`` semaphore allows.  
+		By default, all async calls on an event loop share a semaphore of :data:`.defaults.DEFAULT_ASYNC_CONCURRENCY`.
+		"""
+		from ._async import _run_blocking
+		return await _run_blocking(cls.from_path, log_path, max_year=max_year, lazy=lazy, encodings=encodings, limiter=limiter, executor=executor)
+	
+	@classmethod
+	async def atouch(cls, log_path:str, entry:typing.Optional[BinLogEntry]=None, atomic:bool=True, fsync:bool=False, lock:bool=False, lock_timeout:float=DEFAULT_LOCK_TIMEOUT, limiter:typing.Optional["asyncio.Semaphore"]=None, executor:typing.Optional["concurrent.futures.Executor"]=None):
+		"""Add an entry to a log file, without blocking the event loop (see :meth:`touch`)"""
+		from ._async import _run_blocking
+		await _run_blocking(cls.touch, log_path, entry, atomic=atomic, fsync=fsync, lock=lock, lock_timeout=lock_timeout, limiter=limiter, executor=executor)
+	
+	@classmethod
+	async def atouch_bin(cls, bin_path:str, entry:typing.Optional[BinLogEntry]=None, missing_bin_ok:bool=True, atomic:bool=True, fsync:bool=False, lock:bool=False, lock_timeout:float=DEFAULT_LOCK_TIMEOUT, limiter:typing.Optional["asyncio.Semaphore"]=None, executor:typing.Optional["concurrent.futures.Executor"]=None):
+		"""Add an entry to a log file for a given bin, without blocking the event loop (see :meth:`touch_bin`)"""
+		from ._async import _run_blocking
+		await _run_blocking(cls.touch_bin, bin_path, entry, missing_bin_ok, atomic=atomic, fsync=fsync, lock=lock, lock_timeout=lock_timeout, limiter=limiter, executor=executor)
+
 	@staticmethod
 	def log_path_from_bin_path(bin_path:str, missing_bin_ok:bool=True) -> str:
 		"""Determine the expected log path for a given bin path"""
@@ -174,7 +492,187 @@ class BinLog(collections.UserList):
 			raise BinNotFoundError(f"An existing bin was not found at {bin_path}")
 		return str(pathlib.Path(bin_path).with_suffix(DEFAULT_FILE_EXTENSION))
 
+	@staticmethod
+	def bin_path_from_log_path(log_path:str) -> str:
+		"""Determine the expected bin path for a given log path"""
+		import pathlib
+		return str(pathlib.Path(log_path).with_suffix(DEFAULT_BIN_EXTENSION))
+
 	def __repr__(self) -> str:
 		last_entry = self.latest_entry()
 		last_entry_str = last_entry.to_string().rstrip() if last_entry else None
 		return f"<{self.__class__.__name__} entries={len(self)} last_entry={last_entry_str}>"
+
+
+def _read_log_file(log_path:str, encodings:typing.Optional[typing.Sequence[str]]=None, size:typing.Optional[int]=None, mtime:typing.Optional[float]=None) -> typing.Tuple[typing.List[str], int]:
+	"""
+	Read and decode the lines of a .log file, along with the year it was last modified
+
+	The whole file is read with a single ``read()`` on a raw file descriptor (they're tiny), rather than through a file 
+	object, so trying another encoding doesn't mean reading the file again.  If the ``size`` and ``mtime`` are already 
+	known (say, from a directory listing), the file isn't ``stat``'d at all: just opened, read, and closed.
+	"""
+	import os
+
+	with _stats.timer("open"):
+		log_fd = os.open(log_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+	_stats.count("files_opened")
+
+	try:
+
+		if size is None or mtime is None:
+			stat_info = os.fstat(log_fd)
+			size, mtime = stat_info.st_size, stat_info.st_mtime
+
+		with _stats.timer("read"):
+
+			# Asking for one byte more than expected: the only way to see EOF without another read, in case it's grown
+			log_bytes = os.read(log_fd, size + 1)
+			while len(log_bytes) > size:
+				more_bytes = os.read(log_fd, 65536)
+				if not more_bytes:
+					break
+				log_bytes += more_bytes
+				size += len(more_bytes)
+		
+		_stats.count("bytes_read", len(log_bytes))
+	
+	finally:
+		os.close(log_fd)
+	
+	return _split_log_lines(_decode_log_bytes(log_bytes, encodings)), datetime.datetime.fromtimestamp(mtime).year
+
+def _decode_log_bytes(log_bytes:bytes, encodings:typing.Optional[typing.Sequence[str]]=None) -> str:
+	"""Decode the bytes of a log with the first of ``encodings`` that works"""
+
+	encodings = DEFAULT_ENCODINGS if encodings is None else encodings
+
+	for encoding in encodings:
+		try:
+			return log_bytes.decode(encoding)
+		except UnicodeDecodeError as e:
+			error = e
+	
+	if not encodings:
+		raise ValueError("At least one encoding must be given")
+	
+	raise BinLogParseError(f"Error decoding log as any of {', '.join(encodings)}: {error}") from error
+
+def _split_log_lines(log_text:str) -> typing.List[str]:
+	"""Split decoded log text into lines exactly as reading it in text mode would (universal newlines, line endings kept)"""
+	import io
+	return io.StringIO(log_text, newline=None).readlines()
+
+def _append_to_sorted_lines(lines:typing.List[str], entry:BinLogEntry, max_year:typing.Optional[int], entry_line:typing.Optional[str]=None) -> typing.Optional[str]:
+	"""
+	Format a log with ``entry`` added to the end of the existing ``lines``, without re-parsing them into entries
+
+	Only works if every line looks exactly like :meth:`.BinLogEntry.to_string` output with a valid date, the lines 
+	are already sorted, and ``entry`` sorts last.  Otherwise returns ``None``, and the log needs to be parsed and 
+	formatted the long way (which is also where any errors get raised).
+	"""
+
+	entry_line = entry_line or entry.to_string() + "\n"
+
+	if not lines:
+		return entry_line
+	
+	if max_year is None:
+		return None
+	
+	entry_width = len(entry_line)
+	last_fields = None
+
+	for line in lines:
+
+		fields = _log_line_fields(line, entry_width, max_year)
+		if fields is None or (last_fields is not None and fields < last_fields):
+			return None
+		last_fields = fields
+	
+	if (entry.timestamp, entry.computer, entry.user) < last_fields:
+		return None
+	
+	return str().join(lines[max(0, len(lines) - MAX_ENTRIES + 1):] + [entry_line])
+
+def _log_line_fields(line:str, line_width:int, max_year:int) -> typing.Optional[typing.Tuple[datetime.datetime, str, str]]:
+	"""
+	``(timestamp, computer, user)`` from a log line formatted exactly like :meth:`.BinLogEntry.to_string` output, 
+	or ``None`` if it isn't, or if anything about it would need a closer look
+	"""
+	from ._binlogentry import _fast_datetime_from_log_timestamp
+
+	if len(line) != line_width or line[-1] != "\n" or line[19:21] != "  " or line[21:31] != FIELD_START_COMPUTER or line[47:53] != FIELD_START_USER:
+		return None
+	
+	computer = line[31:47].rstrip()
+	user = line[53:-1].rstrip()
+	if not (computer and user and len(computer) <= MAX_FIELD_LENGTH and len(user) <= MAX_FIELD_LENGTH and computer.isprintable() and user.isprintable()):
+		return None
+	
+	# `None` for anything but a well-formed date that actually exists, which also resolves the year (cached, so cheap)
+	timestamp = _fast_datetime_from_log_timestamp(line[0:19], max_year)
+	if timestamp is None:
+		return None
+
+	return timestamp, computer, user
+
+def _write_text_atomic(file_path:str, text:str, fsync:bool=False):
+	"""Write text to a temporary file beside ``file_path``, then rename it into place"""
+	import os, secrets, stat
+
+	file_path = os.fspath(file_path)
+	directory, file_name = os.path.split(os.path.abspath(file_path))
+
+	# Dotfile, so scans skip it if it's ever left behind
+	temp_path = os.path.join(directory, f".{file_name}.{secrets.token_hex(4)}.tmp")
+
+	# Creating with 0o666 respects the umask like `open()` would, and an existing log's permissions are kept
+	temp_fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+	
+	try:
+		with os.fdopen(temp_fd, "w", encoding="utf-8") as temp_handle:
+			temp_handle.write(text)
+			if fsync:
+				temp_handle.flush()
+				os.fsync(temp_handle.fileno())
+		
+		try:
+			os.chmod(temp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+		except FileNotFoundError:
+			pass
+
+		os.replace(temp_path, file_path)
+	
+	except BaseException:
+		try:
+			os.remove(temp_path)
+		except OSError:
+			pass
+		raise
+
+	if fsync and hasattr(os, "O_DIRECTORY"):
+		# Make the rename itself durable, where the platform allows
+		dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+		try:
+			os.fsync(dir_fd)
+		finally:
+			os.close(dir_fd)
+
+
+class TouchResult(typing.NamedTuple):
+	"""The outcome of touching one bin with :meth:`.BinLog.touch_many`"""
+
+	bin_path:str
+	"""Path to the bin"""
+
+	log_path:str
+	"""Path to the bin's log"""
+
+	error:typing.Optional[Exception]
+	"""The exception raised while touching this bin's log, or ``None`` if it went fine"""
+
+	@property
+	def ok(self) -> bool:
+		"""Whether the log was touched successfully"""
+		return self.error is None
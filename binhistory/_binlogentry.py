@@ -1,7 +1,43 @@
-import dataclasses, datetime, typing
-from .defaults import DEFAULT_COMPUTER, DEFAULT_USER, FIELD_START_USER, FIELD_START_COMPUTER, DATETIME_STRING_FORMAT, MAX_FIELD_LENGTH
+import dataclasses, datetime, functools, time, typing
+from ._instrumentation import stats as _stats
+from .defaults import DEFAULT_COMPUTER, DEFAULT_USER, FIELD_START_USER, FIELD_START_COMPUTER, DATETIME_STRING_FORMAT, MAX_FIELD_LENGTH, YEAR_CACHE_SIZE, NAME_INTERN_CACHE_SIZE
 from .exceptions import BinLogParseError, BinLogInvalidFieldError, BinLogFieldLengthError
 
+def _with_slots(cls:type) -> type:
+	"""
+	Rebuild a dataclass with ``__slots__`` for its fields, so instances don't each carry a ``__dict__``
+
+	Does what ``dataclasses.dataclass(slots=True)`` does on Python 3.10+, which isn't available to us on 3.7.
+	"""
+
+	field_names = tuple(field.name for field in dataclasses.fields(cls))
+
+	cls_dict = dict(cls.__dict__)
+	# Keep `__weakref__` so entries can still be weakly referenced, as they could before
+	cls_dict["__slots__"] = field_names + ("__weakref__",)
+
+	# Class-level defaults would clash with the slot descriptors (`__init__` already has its own copy of them)
+	for field_name in field_names:
+		cls_dict.pop(field_name, None)
+	cls_dict.pop("__dict__", None)
+	cls_dict.pop("__weakref__", None)
+
+	# The generated frozen `__setattr__`/`__delattr__` refer back to the original class, so make new ones
+	if cls.__dataclass_params__.frozen:
+		cls_dict["__setattr__"] = _frozen_setattr
+		cls_dict["__delattr__"] = _frozen_delattr
+
+	slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+	slotted_cls.__qualname__ = cls.__qualname__
+	return slotted_cls
+
+def _frozen_setattr(self, name:str, value:typing.Any):
+	raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+def _frozen_delattr(self, name:str):
+	raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+@_with_slots
 @dataclasses.dataclass(frozen=True, order=True)
 class BinLogEntry:
 	"""An entry in a bin log"""
@@ -18,25 +54,22 @@ class BinLogEntry:
 	def __post_init__(self):
 		"""Validate fields"""
 
-		# `user` should be a non-empty string of printable (not \n etc) characters
-		if not isinstance(self.user, str):
-			raise BinLogInvalidFieldError(f"`user` field must be a string (got {repr(self.user)})")
-		elif not self.user.strip() or len(self.user) > MAX_FIELD_LENGTH:
-			raise BinLogFieldLengthError(f"`user` field must be between 1 and {MAX_FIELD_LENGTH} characters long (got {len(self.user)})")
-		elif not self.user.isprintable():
-			raise BinLogInvalidFieldError(f"`user` field contains invalid characters")
-
-		# `computer` should be a non-empty string of printable (not \n etc) characters
-		if not isinstance(self.computer, str):
-			raise BinLogInvalidFieldError(f"`computer` field must be a string (got {repr(self.computer)})")
-		elif not self.computer.strip() or len(self.computer) > MAX_FIELD_LENGTH:
-			raise BinLogFieldLengthError(f"`computer` field must be between 1 and {MAX_FIELD_LENGTH} characters long (got {len(self.computer)})")
-		elif not self.computer.isprintable():
-			raise BinLogInvalidFieldError(f"`computer` field contains invalid characters")
-		
-		# `timestamp` should be a `datetime.datetime`
-		if not isinstance(self.timestamp, datetime.datetime):
-			raise BinLogInvalidFieldError(f"`timestamp` field must be a valid `datetime.datetime` object (got {repr(self.timestamp)})")
+		# Once per entry, so timed with a bare check of `enabled` rather than a `with` block
+		started = time.perf_counter() if _stats.enabled else None
+
+		try:
+			_validate_fields(self.timestamp, self.computer, self.user)
+		finally:
+			if started is not None:
+				_stats.since("validate", started)
+	
+	def __getstate__(self) -> typing.Tuple[datetime.datetime, str, str]:
+		return (self.timestamp, self.computer, self.user)
+	
+	def __setstate__(self, state:typing.Tuple[datetime.datetime, str, str]):
+		# Frozen, so the default `setattr`-based unpickling won't do
+		for field_name, value in zip(("timestamp", "computer", "user"), state):
+			object.__setattr__(self, field_name, value)
 
 	def copy_with(self, **fields):
 		"""Creates a copy of this `BinLogEntry`, with optional changes to specified fields"""
@@ -60,28 +93,57 @@ class BinLogEntry:
 		"""Return the log entry from a given log entry string"""
 
 		try:
-			entry_datetime   = log_entry[0:19]
-			parsed_timestamp = cls._datetime_from_log_timestamp(entry_datetime, max_year)
-		except ValueError as e:
-			raise BinLogParseError(f"Unexpected value encountered while parsing access time \"{entry_datetime}\" (Assuming a max year of {max_year}): {e}") from e
+			entry = cls._from_parsed_fields(*_fields_from_string(log_entry, max_year))
+		except ValueError:
+			_stats.count("parse_errors")
+			raise
+		
+		_stats.count("lines_parsed")
+		return entry
+	
+	@classmethod
+	def parse_lines(cls, lines:typing.Iterable[str], max_year:typing.Optional[int]=None) -> typing.List["BinLogEntry"]:
+		"""Return the log entries from many log entry strings at once"""
+
+		# Resolve the default year once for the whole batch rather than per line
+		if max_year is None:
+			max_year = datetime.datetime.now().year
+
+		fields_from_string = _fields_from_string
+		from_parsed_fields = cls._from_parsed_fields
+
+		try:
+			entries = [from_parsed_fields(*fields_from_string(line, max_year)) for line in lines]
+		except ValueError:
+			_stats.count("parse_errors")
+			raise
+		
+		_stats.count("lines_parsed", len(entries))
+		return entries
+	
+	@classmethod
+	def _from_parsed_fields(cls, timestamp:datetime.datetime, computer:str, user:str) -> "BinLogEntry":
+		"""
+		Create an entry from fields just sliced out of a log line by :func:`_fields_from_string`
+
+		Those are already known to be a ``datetime`` and two ``rstrip``'d strings, so only the checks a 
+		malformed line could actually fail are repeated here.  Anything fishy goes through the full validation 
+		for its error message.
+		"""
+
+		# Once per line, so timed with a bare check of `enabled` rather than a `with` block
+		started = time.perf_counter() if _stats.enabled else None
+
+		is_valid = cls is BinLogEntry and user and computer and len(user) <= MAX_FIELD_LENGTH and len(computer) <= MAX_FIELD_LENGTH and user.isprintable() and computer.isprintable() and not user.isspace() and not computer.isspace()
+
+		if started is not None:
+			_stats.since("validate", started)
+
+		if is_valid:
+			return _trusted_entry(timestamp, computer, user)
 		
-		# Computer name: Observed to be AT LEAST 15 characters.  Likely the max but need to check.
-		entry_computer = log_entry[21:47]
-		if not entry_computer.startswith(FIELD_START_COMPUTER):
-			raise BinLogParseError(f"Unexpected value encountered while parsing computer name: \"{entry_computer}\"")
-		parsed_computer = entry_computer[10:].rstrip()
-
-		# User name: Observed to be max 15 characters (to end of line)
-		entry_user = log_entry[47:68]
-		if not entry_user.startswith(FIELD_START_USER):
-			raise BinLogParseError(f"Unexpected value encountered while parsing user name: \"{entry_user}\"")
-		parsed_user = entry_user[6:].rstrip()
-
-		return cls(
-			timestamp = parsed_timestamp,
-			computer  = parsed_computer,
-			user      = parsed_user
-		)
+		# Subclasses may have their own ideas in `__init__`
+		return cls(timestamp, computer, user)
 	
 	@staticmethod
 	def _datetime_from_log_timestamp(timestamp:str, max_year:typing.Optional[int]=None) -> datetime.datetime:
@@ -95,33 +157,180 @@ class BinLogEntry:
 
 		Also accounting for Feb 29 leap year stuff.  It's been fun.
 		"""
-		
-		import calendar
 
 		if max_year is None:
 			max_year = datetime.datetime.now().year
 
-		# Account for leap year
-		needs_leapyear = "Feb 29" in timestamp
-		while needs_leapyear and not calendar.isleap(max_year):
-			max_year -= 1
+		parsed = _fast_datetime_from_log_timestamp(timestamp, max_year)
+		if parsed is not None:
+			return parsed
+		
+		# Anything off the beaten path goes through `strptime`, mostly so bad timestamps get its helpful error messages
+		return _strptime_datetime_from_log_timestamp(timestamp, max_year)
+
+def _trusted_entry(timestamp:datetime.datetime, computer:str, user:str) -> BinLogEntry:
+	"""Create a :class:`BinLogEntry` without running `__init__` or validating fields.  Only for values known to be valid already."""
+
+	entry = _new_object(BinLogEntry)
+	_set_timestamp(entry, timestamp)
+	_set_computer(entry, computer)
+	_set_user(entry, user)
+	return entry
+
+# Slot descriptors set directly, sidestepping the frozen `__setattr__`
+_new_object    = object.__new__
+_set_timestamp = BinLogEntry.timestamp.__set__
+_set_computer  = BinLogEntry.computer.__set__
+_set_user      = BinLogEntry.user.__set__
+
+def _validate_fields(timestamp:typing.Any, computer:typing.Any, user:typing.Any):
+	"""Validate the fields of a log entry, raising an appropriate exception for the first bad one"""
+
+	# `user` should be a non-empty string of printable (not \n etc) characters
+	if not isinstance(user, str):
+		raise BinLogInvalidFieldError(f"`user` field must be a string (got {repr(user)})")
+	elif not user.strip() or len(user) > MAX_FIELD_LENGTH:
+		raise BinLogFieldLengthError(f"`user` field must be between 1 and {MAX_FIELD_LENGTH} characters long (got {len(user)})")
+	elif not user.isprintable():
+		raise BinLogInvalidFieldError(f"`user` field contains invalid characters")
+
+	# `computer` should be a non-empty string of printable (not \n etc) characters
+	if not isinstance(computer, str):
+		raise BinLogInvalidFieldError(f"`computer` field must be a string (got {repr(computer)})")
+	elif not computer.strip() or len(computer) > MAX_FIELD_LENGTH:
+		raise BinLogFieldLengthError(f"`computer` field must be between 1 and {MAX_FIELD_LENGTH} characters long (got {len(computer)})")
+	elif not computer.isprintable():
+		raise BinLogInvalidFieldError(f"`computer` field contains invalid characters")
+	
+	# `timestamp` should be a `datetime.datetime`
+	if not isinstance(timestamp, datetime.datetime):
+		raise BinLogInvalidFieldError(f"`timestamp` field must be a valid `datetime.datetime` object (got {repr(timestamp)})")
+
+def _fields_from_string(log_entry:str, max_year:typing.Optional[int]=None) -> typing.Tuple[datetime.datetime, str, str]:
+	"""Parse the timestamp, computer and user fields out of a log entry string"""
+
+	try:
+		entry_datetime   = log_entry[0:19]
+
+		# Once per line, so timed with a bare check of `enabled` rather than a `with` block
+		started = time.perf_counter() if _stats.enabled else None
+		parsed_timestamp = BinLogEntry._datetime_from_log_timestamp(entry_datetime, max_year)
+		if started is not None:
+			_stats.since("timestamp", started)
+	except ValueError as e:
+		raise BinLogParseError(f"Unexpected value encountered while parsing access time \"{entry_datetime}\" (Assuming a max year of {max_year}): {e}") from e
+	
+	# Computer name: Observed to be AT LEAST 15 characters.  Likely the max but need to check.
+	entry_computer = log_entry[21:47]
+	if not entry_computer.startswith(FIELD_START_COMPUTER):
+		raise BinLogParseError(f"Unexpected value encountered while parsing computer name: \"{entry_computer}\"")
+	parsed_computer = _intern_name(entry_computer[10:].rstrip())
+
+	# User name: Observed to be max 15 characters (to end of line)
+	entry_user = log_entry[47:68]
+	if not entry_user.startswith(FIELD_START_USER):
+		raise BinLogParseError(f"Unexpected value encountered while parsing user name: \"{entry_user}\"")
+	parsed_user = _intern_name(entry_user[6:].rstrip())
+
+	return parsed_timestamp, parsed_computer, parsed_user
+
+_interned_names:typing.Dict[str,str] = {}
+"""User and computer names seen so far, so that equal names parsed from different lines share one string"""
+
+def _intern_name(name:str) -> str:
+	"""Return the shared copy of a user or computer name, adding this one if it's new"""
+
+	interned = _interned_names.get(name)
+	if interned is not None:
+		return interned
+
+	# Keep it bounded for long-running processes that see a lot of names
+	if len(_interned_names) >= NAME_INTERN_CACHE_SIZE:
+		_interned_names.clear()
+
+	_interned_names[name] = name
+	return name
+
+def clear_interned_names():
+	"""Forget the user and computer names shared between parsed log entries, freeing their memory"""
+	_interned_names.clear()
+
+_MONTH_NUMBERS:typing.Dict[str,int] = {name:number for number, name in enumerate(["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"], start=1)}
+"""Month abbreviations (``%b``) as written in a log, to their month number"""
+
+_WEEKDAY_NAMES:typing.Tuple[str,...] = ("Mon","Tue","Wed","Thu","Fri","Sat","Sun")
+"""Weekday abbreviations (``%a``) as written in a log, indexed by :meth:`datetime.date.weekday`"""
+
+def _fast_datetime_from_log_timestamp(timestamp:str, max_year:int) -> typing.Optional[datetime.datetime]:
+	"""
+	Parse a ``Wed Dec 15 09:47:51``-style timestamp by its fixed offsets, without ``strptime``
+
+	Returns ``None`` for anything that isn't exactly in that layout or doesn't make a valid date, 
+	so the caller can fall back to the stricter (and much slower) ``strptime`` route.
+	"""
+
+	if len(timestamp) != 19 or timestamp[3] != " " or timestamp[7] != " " or timestamp[10] != " " or timestamp[13] != ":" or timestamp[16] != ":":
+		return None
+	
+	wkday = timestamp[0:3]
+	month = _MONTH_NUMBERS.get(timestamp[4:7])
+	digits = timestamp[8:10] + timestamp[11:13] + timestamp[14:16] + timestamp[17:19]
+	
+	if month is None or wkday not in _WEEKDAY_NAMES or not (digits.isascii() and digits.isdigit()):
+		return None
+	
+	day = int(timestamp[8:10])
+
+	try:
+		year = _resolve_year(month, day, wkday, max_year)
+		if year is None:
+			return None
+		return datetime.datetime(year, month, day, int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]))
+	except ValueError:
+		return None
+
+def _strptime_datetime_from_log_timestamp(timestamp:str, max_year:int) -> datetime.datetime:
+	"""Form a datetime from a given timestamp string via ``strptime``"""
+
+	# Make the initial datetime from known info
+	# NOTE: Appending a leap year here primarily to avoid invalid leap year timestamps
+	initial_date = datetime.datetime.strptime(timestamp + " " + str(_LEAP_YEAR), DATETIME_STRING_FORMAT + " %Y")
+
+	# Also get the weekday from the timestamp string to compare against the resolved year
+	wkday = timestamp[:3]
+
+	year = _resolve_year(initial_date.month, initial_date.day, wkday, max_year)
+	if year is None:
+		raise ValueError(f"Could not determine a valid year for which {initial_date.month}/{initial_date.day} occurs on a {wkday}")
+	
+	return initial_date.replace(year=year)
+
+_LEAP_YEAR:int = 2000
+"""Any ol' leap year, so that Feb 29 timestamps can be parsed before their actual year is known"""
+
+@functools.lru_cache(maxsize=YEAR_CACHE_SIZE)
+def _resolve_year(month:int, day:int, wkday:str, max_year:int) -> typing.Optional[int]:
+	"""
+	Find the most recent year, no later than ``max_year``, in which ``month``/``day`` falls on ``wkday``
+
+	Returns ``None`` if no such year exists within the 11 years it takes for weekday/date pairs to start repeating.
+	Results are cached process-wide, since every entry in a log (and most logs in a project) share the same handful of keys.
+	"""
 
-		# Make the initial datetime from known info
-		# NOTE: Appending `max_year` here primarily to avoid invalid leap year timestamps
-		initial_date = datetime.datetime.strptime(timestamp + " " + str(max_year), DATETIME_STRING_FORMAT + " %Y")
+	import calendar
 
-		# Also get the weekday from the timestamp string to compare against the parsed datetime.datetime weekday
-		wkday = timestamp[:3]
+	# Account for leap year
+	needs_leapyear = (month, day) == (2, 29)
+	while needs_leapyear and not calendar.isleap(max_year):
+		max_year -= 1
 
-		# Search backwards up to 11 years (when weekday/date pairs start repeating)
-		for year in range(max_year, max_year - 11, -1):
+	# Search backwards up to 11 years (when weekday/date pairs start repeating)
+	for year in range(max_year, max_year - 11, -1):
 
-			if needs_leapyear and not calendar.isleap(year):
-				continue
+		if needs_leapyear and not calendar.isleap(year):
+			continue
 
-			test_date = initial_date.replace(year=year)
-			
-			if test_date.strftime("%a") == wkday:
-				return test_date
+		if _WEEKDAY_NAMES[datetime.date(year, month, day).weekday()] == wkday:
+			return year
 
-		raise ValueError(f"Could not determine a valid year for which {initial_date.month}/{initial_date.day} occurs on a {wkday}")
\ No newline at end of file
+	return None
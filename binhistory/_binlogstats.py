@@ -0,0 +1,153 @@
+"""
+`BinLogStats`: mergeable summary statistics over many logs
+"""
+
+import collections, datetime, typing
+
+from ._binlogentry import BinLogEntry
+
+class BinLogStats:
+	"""
+	Running totals of who touched what, and when, across any number of logs
+
+	Add logs one at a time with :meth:`add`.  Stats gathered separately (say, one per worker, each reading part
+	of a project) can be combined with :meth:`merge`, and sent between processes or machines with :meth:`to_dict`
+	and :meth:`from_dict`.
+	"""
+
+	def __init__(self):
+
+		self.logs_read:int = 0
+		"""Number of logs added"""
+
+		self.logs_failed:int = 0
+		"""Number of logs which couldn't be read (see :meth:`add_error`)"""
+
+		self.entry_count:int = 0
+		"""Number of entries across all logs"""
+
+		self.user_counts:typing.Counter[str] = collections.Counter()
+		"""Number of entries per user"""
+
+		self.computer_counts:typing.Counter[str] = collections.Counter()
+		"""Number of entries per computer"""
+
+		self.day_counts:typing.Counter[datetime.date] = collections.Counter()
+		"""Number of entries per day"""
+
+		self.earliest_entry:typing.Optional[BinLogEntry] = None
+		"""The earliest entry seen in any log"""
+
+		self.earliest_path:typing.Optional[str] = None
+		"""Path given for the log containing :attr:`earliest_entry`"""
+
+		self.latest_entry:typing.Optional[BinLogEntry] = None
+		"""The latest entry seen in any log"""
+
+		self.latest_path:typing.Optional[str] = None
+		"""Path given for the log containing :attr:`latest_entry`"""
+
+	def add(self, log:typing.Iterable[BinLogEntry], path:typing.Optional[str]=None) -> "BinLogStats":
+		"""Add the entries of a :class:`.BinLog` (from ``path``, if you'd like to know where the earliest and latest entries came from)"""
+
+		entries = list(log)
+
+		self.logs_read += 1
+		self.entry_count += len(entries)
+
+		if not entries:
+			return self
+
+		self.user_counts.update(entry.user for entry in entries)
+		self.computer_counts.update(entry.computer for entry in entries)
+		self.day_counts.update(entry.timestamp.date() for entry in entries)
+
+		self._update_extremes(min(entries), path, max(entries), path)
+		return self
+
+	def add_error(self) -> "BinLogStats":
+		"""Count a log that couldn't be read"""
+		self.logs_failed += 1
+		return self
+
+	def merge(self, other:"BinLogStats") -> "BinLogStats":
+		"""Add the totals from another :class:`BinLogStats` into this one"""
+
+		if not isinstance(other, BinLogStats):
+			raise TypeError(f"Can only merge another `BinLogStats` (got {type(other).__name__})")
+
+		self.logs_read   += other.logs_read
+		self.logs_failed += other.logs_failed
+		self.entry_count += other.entry_count
+
+		self.user_counts.update(other.user_counts)
+		self.computer_counts.update(other.computer_counts)
+		self.day_counts.update(other.day_counts)
+
+		self._update_extremes(other.earliest_entry, other.earliest_path, other.latest_entry, other.latest_path)
+		return self
+
+	def _update_extremes(self, earliest_entry:typing.Optional[BinLogEntry], earliest_path:typing.Optional[str], latest_entry:typing.Optional[BinLogEntry], latest_path:typing.Optional[str]):
+		"""Keep whichever earliest/latest entries win.  Ties go to the lowest path, so the results don't depend on the order logs were added or merged."""
+
+		if earliest_entry is not None and (self.earliest_entry is None or (earliest_entry, earliest_path or "") < (self.earliest_entry, self.earliest_path or "")):
+			self.earliest_entry, self.earliest_path = earliest_entry, earliest_path
+
+		if latest_entry is not None and (self.latest_entry is None or latest_entry > self.latest_entry or (latest_entry == self.latest_entry and (latest_path or "") < (self.latest_path or ""))):
+			self.latest_entry, self.latest_path = latest_entry, latest_path
+
+	def to_dict(self) -> typing.Dict[str, typing.Any]:
+		"""Serialize to a JSON-friendly ``dict``, most common users and computers first"""
+
+		return {
+			"logs_read":   self.logs_read,
+			"logs_failed": self.logs_failed,
+			"entries":     self.entry_count,
+			"users":       dict(self.user_counts.most_common()),
+			"computers":   dict(self.computer_counts.most_common()),
+			"days":        {day.isoformat(): count for day, count in sorted(self.day_counts.items())},
+			"earliest":    _entry_to_dict(self.earliest_entry, self.earliest_path),
+			"latest":      _entry_to_dict(self.latest_entry, self.latest_path),
+		}
+
+	@classmethod
+	def from_dict(cls, stats_dict:typing.Dict[str, typing.Any]) -> "BinLogStats":
+		"""Deserialize from a ``dict`` made by :meth:`to_dict`"""
+
+		stats = cls()
+
+		stats.logs_read       = stats_dict["logs_read"]
+		stats.logs_failed     = stats_dict["logs_failed"]
+		stats.entry_count     = stats_dict["entries"]
+		stats.user_counts     = collections.Counter(stats_dict["users"])
+		stats.computer_counts = collections.Counter(stats_dict["computers"])
+		stats.day_counts      = collections.Counter({datetime.date.fromisoformat(day): count for day, count in stats_dict["days"].items()})
+
+		stats.earliest_entry, stats.earliest_path = _entry_from_dict(stats_dict["earliest"])
+		stats.latest_entry,   stats.latest_path   = _entry_from_dict(stats_dict["latest"])
+
+		return stats
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, BinLogStats):
+			return NotImplemented
+		return self.to_dict() == other.to_dict()
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} logs_read={self.logs_read} logs_failed={self.logs_failed} entries={self.entry_count} users={len(self.user_counts)} computers={len(self.computer_counts)}>"
+
+def _entry_to_dict(entry:typing.Optional[BinLogEntry], path:typing.Optional[str]) -> typing.Optional[typing.Dict[str, typing.Optional[str]]]:
+
+	if entry is None:
+		return None
+	return {"path": path, "timestamp": entry.timestamp.isoformat(), "computer": entry.computer, "user": entry.user}
+
+def _entry_from_dict(entry_dict:typing.Optional[typing.Dict[str, typing.Optional[str]]]) -> typing.Tuple[typing.Optional[BinLogEntry], typing.Optional[str]]:
+
+	if entry_dict is None:
+		return None, None
+	return BinLogEntry(
+		timestamp = datetime.datetime.fromisoformat(entry_dict["timestamp"]),
+		computer  = entry_dict["computer"],
+		user      = entry_dict["user"],
+	), entry_dict["path"]
@@ -0,0 +1,286 @@
+"""
+`BinLogTable` class, for crunching numbers on lots of logs at once
+"""
+
+import datetime, typing
+
+from ._binlog import BinLog, _read_log_file
+from ._binlogentry import BinLogEntry, _fields_from_string
+from .exceptions import BinLogNotFoundError
+
+class BinLogTable:
+	"""
+	Log entries from many bins, stored as columns rather than as :class:`.BinLogEntry` objects
+
+	Requires :mod:`numpy` (``pip install pybinhistory[table]``).  Timestamps are stored as a ``datetime64[s]`` array, 
+	while users, computers and bin paths are stored as integer codes into the :attr:`users`, :attr:`computers` 
+	and :attr:`bin_paths` lookup lists.
+	"""
+
+	def __init__(self, timestamps=None, user_codes=None, computer_codes=None, bin_codes=None, users:typing.Optional[typing.Sequence[str]]=None, computers:typing.Optional[typing.Sequence[str]]=None, bin_paths:typing.Optional[typing.Sequence[str]]=None):
+
+		numpy = _require_numpy()
+
+		self.timestamps     = numpy.asarray(timestamps if timestamps is not None else [], dtype="datetime64[s]")
+		"""Timestamp of each entry"""
+
+		self.user_codes     = numpy.asarray(user_codes if user_codes is not None else [], dtype=numpy.int32)
+		"""Index into :attr:`users` for each entry"""
+
+		self.computer_codes = numpy.asarray(computer_codes if computer_codes is not None else [], dtype=numpy.int32)
+		"""Index into :attr:`computers` for each entry"""
+
+		self.bin_codes      = numpy.asarray(bin_codes if bin_codes is not None else [], dtype=numpy.int32)
+		"""Index into :attr:`bin_paths` for each entry"""
+
+		self.users:typing.List[str]     = list(users or [])
+		"""Unique user names, by code"""
+
+		self.computers:typing.List[str] = list(computers or [])
+		"""Unique computer names, by code"""
+
+		self.bin_paths:typing.List[str] = list(bin_paths or [])
+		"""Unique bin paths, by code"""
+
+		self.errors:typing.Dict[str, Exception] = dict()
+		"""Logs which could not be read while building the table, keyed by log path"""
+
+		if not len(self.timestamps) == len(self.user_codes) == len(self.computer_codes) == len(self.bin_codes):
+			raise ValueError("All `BinLogTable` columns must be the same length")
+	
+	def __len__(self) -> int:
+		return len(self.timestamps)
+	
+	@property
+	def user_lookup(self) -> typing.Dict[str, int]:
+		"""Codes for each user name"""
+		return {name: code for code, name in enumerate(self.users)}
+	
+	@property
+	def computer_lookup(self) -> typing.Dict[str, int]:
+		"""Codes for each computer name"""
+		return {name: code for code, name in enumerate(self.computers)}
+	
+	@property
+	def bin_lookup(self) -> typing.Dict[str, int]:
+		"""Codes for each bin path"""
+		return {path: code for code, path in enumerate(self.bin_paths)}
+
+	# Builders
+	@classmethod
+	def from_lines(cls, lines_by_bin:typing.Iterable[typing.Tuple[str, typing.Iterable[str]]], max_year:typing.Optional[int]=None) -> "BinLogTable":
+		"""Build a table from ``(bin_path, log_lines)`` pairs, without creating a :class:`.BinLogEntry` for each line"""
+
+		_require_numpy()
+
+		if max_year is None:
+			max_year = datetime.datetime.now().year
+
+		builder = _TableBuilder()
+		for bin_path, lines in lines_by_bin:
+			builder.add_lines(bin_path, lines, max_year)
+		
+		return builder.build(cls)
+	
+	@classmethod
+	def from_paths(cls, log_paths:typing.Iterable[str], max_year:typing.Optional[int]=None) -> "BinLogTable":
+		"""Build a table from existing ``.log`` files"""
+
+		_require_numpy()
+
+		builder = _TableBuilder()
+		for log_path in log_paths:
+			lines, log_max_year = _read_log_lines(log_path, max_year)
+			builder.add_lines(BinLog.bin_path_from_log_path(log_path), lines, log_max_year)
+		
+		return builder.build(cls)
+	
+	@classmethod
+	def from_project(cls, root:str, workers:typing.Optional[int]=None, max_year:typing.Optional[int]=None) -> "BinLogTable":
+		"""
+		Build a table from every ``.log`` file in an Avid project
+
+		Logs are read on a pool of threads.  Logs that can't be read or parsed are skipped, and noted in :attr:`errors`.
+		"""
+
+		from ._scan import walk_project, LogFileInfo, _map_threaded
+
+		_require_numpy()
+
+		builder = _TableBuilder()
+		errors = dict()
+
+		def read_lines(walked:typing.Tuple[int, LogFileInfo]) -> typing.Tuple[typing.List[str], int]:
+			log_info = walked[1]
+			return _read_log_lines(log_info.log_path, max_year, log_info.size, log_info.mtime)
+
+		# Reads finish in any order, but are added in walk order so the table comes out the same every time.
+		# Only a few reads are in flight at once, so only those few can be waiting their turn.
+		waiting:typing.Dict[int, typing.Tuple[LogFileInfo, typing.Any]] = dict()
+		next_index = 0
+
+		for (index, log_info), result in _map_threaded(enumerate(walk_project(root)), workers, read_lines):
+
+			waiting[index] = log_info, result
+
+			while next_index in waiting:
+
+				log_info, result = waiting.pop(next_index)
+				next_index += 1
+
+				if isinstance(result, Exception):
+					errors[log_info.log_path] = result
+					continue
+
+				lines, log_max_year = result
+				try:
+					builder.add_lines(log_info.bin_path, lines, log_max_year)
+				except ValueError as e:
+					errors[log_info.log_path] = e
+		
+		table = builder.build(cls)
+		table.errors = errors
+		return table
+	
+	# Queries
+	def filter(self, start:typing.Optional[datetime.datetime]=None, end:typing.Optional[datetime.datetime]=None, users:typing.Union[str, typing.Iterable[str], None]=None, computers:typing.Union[str, typing.Iterable[str], None]=None, bin_paths:typing.Union[str, typing.Iterable[str], None]=None) -> "BinLogTable":
+		"""Return a new table with only the entries between ``start`` and ``end`` (inclusive) for the given users, computers and/or bins"""
+
+		import numpy
+
+		mask = numpy.ones(len(self), dtype=bool)
+
+		if start is not None:
+			mask &= self.timestamps >= numpy.datetime64(start, "s")
+		if end is not None:
+			mask &= self.timestamps <= numpy.datetime64(end, "s")
+		if users is not None:
+			mask &= numpy.isin(self.user_codes, _codes_for(users, self.user_lookup))
+		if computers is not None:
+			mask &= numpy.isin(self.computer_codes, _codes_for(computers, self.computer_lookup))
+		if bin_paths is not None:
+			mask &= numpy.isin(self.bin_codes, _codes_for(bin_paths, self.bin_lookup))
+		
+		return self._take(mask)
+	
+	def count_by(self, column:str) -> typing.Dict[str, int]:
+		"""Count the entries for each unique ``"user"``, ``"computer"`` or ``"bin_path"``"""
+
+		columns = {
+			"user":     (self.user_codes, self.users),
+			"computer": (self.computer_codes, self.computers),
+			"bin_path": (self.bin_codes, self.bin_paths),
+		}
+
+		if column not in columns:
+			raise ValueError(f"Can only count by {', '.join(repr(c) for c in columns)} (got {column!r})")
+		
+		import numpy
+
+		codes, names = columns[column]
+		counts = numpy.bincount(codes, minlength=len(names))
+		return {names[code]: int(count) for code, count in enumerate(counts) if count}
+	
+	def to_binlog(self, bin_path:str) -> BinLog:
+		"""Build a :class:`.BinLog` of the entries for a single bin"""
+
+		import numpy
+
+		bin_code = self.bin_lookup.get(str(bin_path))
+		if bin_code is None:
+			return BinLog()
+
+		rows = numpy.flatnonzero(self.bin_codes == bin_code)
+		rows = rows[numpy.argsort(self.timestamps[rows], kind="stable")]
+
+		return BinLog(
+			BinLogEntry(
+				timestamp = self.timestamps[row].item(),
+				computer  = self.computers[self.computer_codes[row]],
+				user      = self.users[self.user_codes[row]],
+			) for row in rows
+		)
+	
+	def _take(self, rows) -> "BinLogTable":
+		"""New table with only the given rows (by index or mask), sharing the same lookups"""
+
+		return self.__class__(
+			timestamps     = self.timestamps[rows],
+			user_codes     = self.user_codes[rows],
+			computer_codes = self.computer_codes[rows],
+			bin_codes      = self.bin_codes[rows],
+			users          = self.users,
+			computers      = self.computers,
+			bin_paths      = self.bin_paths,
+		)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} entries={len(self)} bins={len(self.bin_paths)} users={len(self.users)} computers={len(self.computers)}>"
+
+class _TableBuilder:
+	"""Accumulates parsed fields into plain lists of codes before they become numpy columns"""
+
+	def __init__(self):
+
+		self.timestamps:typing.List[datetime.datetime] = []
+		self.user_codes:typing.List[int]     = []
+		self.computer_codes:typing.List[int] = []
+		self.bin_codes:typing.List[int]      = []
+
+		self.user_lookup:typing.Dict[str,int]     = dict()
+		self.computer_lookup:typing.Dict[str,int] = dict()
+		self.bin_lookup:typing.Dict[str,int]      = dict()
+	
+	def add_lines(self, bin_path:str, lines:typing.Iterable[str], max_year:int):
+		"""Parse and add all lines for a given bin"""
+
+		# Parse everything first so a bad line doesn't leave a partial log behind
+		parsed = [_fields_from_string(line, max_year) for line in lines]
+
+		bin_code = self.bin_lookup.setdefault(str(bin_path), len(self.bin_lookup))
+
+		for timestamp, computer, user in parsed:
+			self.timestamps.append(timestamp)
+			self.computer_codes.append(self.computer_lookup.setdefault(computer, len(self.computer_lookup)))
+			self.user_codes.append(self.user_lookup.setdefault(user, len(self.user_lookup)))
+			self.bin_codes.append(bin_code)
+	
+	def build(self, cls:typing.Type[BinLogTable]) -> BinLogTable:
+
+		import numpy
+
+		return cls(
+			timestamps     = numpy.array(self.timestamps, dtype="datetime64[s]"),
+			user_codes     = self.user_codes,
+			computer_codes = self.computer_codes,
+			bin_codes      = self.bin_codes,
+			users          = list(self.user_lookup),
+			computers      = list(self.computer_lookup),
+			bin_paths      = list(self.bin_lookup),
+		)
+
+def _read_log_lines(log_path:str, max_year:typing.Optional[int]=None, size:typing.Optional[int]=None, mtime:typing.Optional[float]=None) -> typing.Tuple[typing.List[str], int]:
+	"""Read the raw lines of a log, along with the ``max_year`` to parse them with"""
+
+	try:
+		lines, mtime_year = _read_log_file(log_path, size=size, mtime=mtime)
+	except FileNotFoundError as e:
+		raise BinLogNotFoundError(f"A log file was not found at the given path {log_path}") from e
+	
+	return lines, max_year or mtime_year
+
+def _codes_for(names:typing.Union[str, typing.Iterable[str]], lookup:typing.Dict[str,int]) -> typing.List[int]:
+	"""Codes for the given name(s), ignoring any that aren't in the table"""
+
+	if isinstance(names, str):
+		names = [names]
+	return [lookup[name] for name in names if name in lookup]
+
+def _require_numpy():
+	"""Import :mod:`numpy` only once a table is actually needed, so ``import binhistory`` doesn't pay for it"""
+
+	try:
+		import numpy
+	except ImportError as e:
+		raise ImportError("`BinLogTable` requires `numpy`.  Install it with `pip install pybinhistory[table]`") from e
+	return numpy
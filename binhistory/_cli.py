@@ -0,0 +1,185 @@
+"""
+The ``binhistory`` command-line tool
+
+Results are written as JSON Lines (one JSON object per line) as soon as each log is read,
+so output can be piped straight into other tools while a big project is still being scanned.
+"""
+
+import argparse, json, os, sys, typing
+
+from ._binlog import BinLog
+from ._binlogentry import BinLogEntry
+
+def main(argv:typing.Optional[typing.Sequence[str]]=None) -> int:
+	"""Run the ``binhistory`` command-line tool, returning its exit code"""
+
+	args = _build_parser().parse_args(argv)
+
+	try:
+		return args.command(args)
+	except BrokenPipeError:
+		# Whoever we were piping to (`head`, say) has stopped listening, which is fine.  Quietly point stdout
+		# somewhere harmless so Python doesn't complain again when it flushes on the way out.
+		devnull = os.open(os.devnull, os.O_WRONLY)
+		os.dup2(devnull, sys.stdout.fileno())
+		return 0
+	except KeyboardInterrupt:
+		return 130
+
+def _build_parser() -> argparse.ArgumentParser:
+
+	parser = argparse.ArgumentParser(prog="binhistory", description="Read and write Avid bin history logs.  Results are printed as JSON Lines.")
+	subparsers = parser.add_subparsers(title="commands", metavar="command")
+	subparsers.required = True
+
+	parser_scan = subparsers.add_parser("scan", help="Print every entry of every log in a project")
+	parser_scan.set_defaults(command=_command_scan)
+
+	parser_latest = subparsers.add_parser("latest", help="Print the most recent entry of each log in a project")
+	parser_latest.set_defaults(command=_command_latest)
+
+	parser_stats = subparsers.add_parser("stats", help="Print a summary of the users, computers and times in a project's logs")
+	parser_stats.set_defaults(command=_command_stats)
+
+	parser_export = subparsers.add_parser("export", help="Write every entry in a project to a CSV, JSON Lines or Parquet file")
+	parser_export.set_defaults(command=_command_export)
+	parser_export.add_argument("--format", choices=["csv", "jsonl", "parquet"], default="jsonl", help="Output format (default: jsonl)")
+	parser_export.add_argument("--output", default="-", help="File to write to (default: stdout, except for parquet)")
+	parser_export.add_argument("--batch-size", type=_positive_int, default=None, help="Rows per record batch, for parquet")
+
+	for project_parser in (parser_scan, parser_latest, parser_stats, parser_export):
+		project_parser.add_argument("project", help="Path to an Avid project directory")
+		project_parser.add_argument("--workers", type=_positive_int, default=None, help="Number of logs to read at once")
+		project_parser.add_argument("--processes", action="store_true", help="Parse logs on a pool of processes instead of threads (faster for logs on a local disk)")
+
+	parser_touch = subparsers.add_parser("touch", help="Add an entry to the logs of one or more bins")
+	parser_touch.set_defaults(command=_command_touch)
+	parser_touch.add_argument("bins", nargs="+", metavar="bin", help="Path to an Avid bin")
+	parser_touch.add_argument("--user", default=None, help="User name for the new entry (default: the current user)")
+	parser_touch.add_argument("--computer", default=None, help="Computer name for the new entry (default: this computer's hostname)")
+	parser_touch.add_argument("--require-bin", action="store_true", help="Fail for bins that don't exist, rather than writing their logs anyway")
+	parser_touch.add_argument("--lock", action="store_true", help="Lock each log while it's being updated")
+	parser_touch.add_argument("--workers", type=_positive_int, default=None, help="Number of logs to touch at once")
+
+	return parser
+
+def _command_scan(args:argparse.Namespace) -> int:
+	"""One line per log, with all of its entries"""
+	from ._scan import _scan_walked
+
+	for log_info, result in _scan_walked(args.project, args.workers, args.processes):
+
+		if isinstance(result, Exception):
+			_write_record(_error_record(log_info.bin_path, log_info.log_path, result))
+			continue
+
+		_write_record({
+			"bin_path": log_info.bin_path,
+			"log_path": log_info.log_path,
+			"entries":  [_entry_record(entry) for entry in result],
+		})
+
+	return 0
+
+def _command_latest(args:argparse.Namespace) -> int:
+	"""One line per log, with its latest entry (empty logs are skipped)"""
+	from ._scan import _scan_walked
+
+	for log_info, result in _scan_walked(args.project, args.workers, args.processes):
+
+		if isinstance(result, Exception):
+			_write_record(_error_record(log_info.bin_path, log_info.log_path, result))
+			continue
+
+		latest_entry = result.latest_entry()
+		if latest_entry is None:
+			continue
+
+		_write_record({"bin_path": log_info.bin_path, **_entry_record(latest_entry)})
+
+	return 0
+
+def _command_stats(args:argparse.Namespace) -> int:
+	"""A single line summarizing the whole project"""
+	from ._binlogstats import BinLogStats
+	from ._scan import _scan_walked
+
+	stats = BinLogStats()
+
+	for log_info, result in _scan_walked(args.project, args.workers, args.processes):
+
+		if isinstance(result, Exception):
+			stats.add_error()
+		else:
+			stats.add(result, log_info.bin_path)
+
+	_write_record(stats.to_dict())
+
+	return 0
+
+def _command_export(args:argparse.Namespace) -> int:
+	"""One row per entry, in the requested format"""
+	from . import _export
+
+	if args.format == "parquet":
+
+		if args.output == "-":
+			print("binhistory export: parquet output needs an --output file", file=sys.stderr)
+			return 2
+
+		try:
+			batch_size = args.batch_size or _export.DEFAULT_EXPORT_BATCH_SIZE
+			_export.export_parquet(args.project, args.output, batch_size, workers=args.workers, use_processes=args.processes)
+		except ImportError as e:
+			print(f"binhistory export: {e}", file=sys.stderr)
+			return 2
+		return 0
+
+	exporter = _export.export_csv if args.format == "csv" else _export.export_jsonl
+	exporter(args.project, sys.stdout if args.output == "-" else args.output, workers=args.workers, use_processes=args.processes)
+	return 0
+
+def _command_touch(args:argparse.Namespace) -> int:
+	"""One line per bin, noting whether its log was touched"""
+
+	fields = {name: value for name, value in (("user", args.user), ("computer", args.computer)) if value is not None}
+
+	try:
+		entry = BinLogEntry(**fields)
+	except ValueError as e:
+		print(f"binhistory touch: {e}", file=sys.stderr)
+		return 2
+
+	failed = False
+
+	for touch_result in BinLog.touch_many(args.bins, entry, workers=args.workers, missing_bin_ok=not args.require_bin, lock=args.lock):
+
+		if touch_result.ok:
+			_write_record({"bin_path": touch_result.bin_path, "log_path": touch_result.log_path, **_entry_record(entry)})
+		else:
+			_write_record(_error_record(touch_result.bin_path, touch_result.log_path, touch_result.error))
+			failed = True
+
+	return 1 if failed else 0
+
+def _entry_record(entry:BinLogEntry) -> typing.Dict[str, str]:
+	return {"timestamp": entry.timestamp.isoformat(), "computer": entry.computer, "user": entry.user}
+
+def _error_record(bin_path:str, log_path:str, error:Exception) -> typing.Dict[str, str]:
+	return {"bin_path": bin_path, "log_path": log_path, "error": f"{type(error).__name__}: {error}"}
+
+def _write_record(record:typing.Dict[str, typing.Any]):
+	"""Write a JSON Lines record to stdout, flushed right away so it can be picked up downstream while the scan goes on"""
+	sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+	sys.stdout.flush()
+
+def _positive_int(value:str) -> int:
+
+	try:
+		number = int(value)
+	except ValueError:
+		number = 0
+
+	if number < 1:
+		raise argparse.ArgumentTypeError(f"must be a whole number of at least 1 (got {value!r})")
+	return number
@@ -0,0 +1,156 @@
+"""
+Streaming exports of a whole project's log entries, for loading into spreadsheets, databases and the like
+"""
+
+import contextlib, csv, datetime, json, os, typing
+
+from ._scan import _scan_walked
+from .defaults import DEFAULT_EXPORT_BATCH_SIZE
+
+class ExportRow(typing.NamedTuple):
+	"""One log entry, as exported"""
+
+	bin_path:str
+	"""Path to the bin"""
+
+	timestamp:datetime.datetime
+	"""Timestamp of the entry"""
+
+	user:str
+	"""User profile which accessed the bin"""
+
+	computer:str
+	"""Hostname of the system which accessed the bin"""
+
+	log_mtime:datetime.datetime
+	"""Modified time of the ``.log`` file the entry came from"""
+
+def iter_rows(root:str, workers:typing.Optional[int]=None, use_processes:bool=False) -> typing.Iterator[ExportRow]:
+	"""
+	Scan an Avid project (see :func:`.scan_project`), yielding an :class:`ExportRow` for every entry of every log as it's read
+
+	Logs that can't be read are skipped.  Only a handful of logs are held in memory at a time, however big the project.
+	"""
+
+	for log_info, result in _scan_walked(root, workers, use_processes):
+
+		if isinstance(result, Exception):
+			continue
+
+		log_mtime = datetime.datetime.fromtimestamp(log_info.mtime)
+
+		for entry in result:
+			yield ExportRow(log_info.bin_path, entry.timestamp, entry.user, entry.computer, log_mtime)
+
+def export_csv(root:str, output:typing.Union[str, os.PathLike, typing.TextIO], workers:typing.Optional[int]=None, use_processes:bool=False) -> int:
+	"""Write every entry in an Avid project to a CSV file (a path, or an open text file), with a header row.  Returns the number of entries written."""
+
+	with _open_text(output) as output_handle:
+
+		writer = csv.writer(output_handle)
+		writer.writerow(ExportRow._fields)
+
+		row_count = 0
+		for row in iter_rows(root, workers, use_processes):
+			writer.writerow((row.bin_path, row.timestamp.isoformat(), row.user, row.computer, row.log_mtime.isoformat()))
+			row_count += 1
+
+	return row_count
+
+def export_jsonl(root:str, output:typing.Union[str, os.PathLike, typing.TextIO], workers:typing.Optional[int]=None, use_processes:bool=False) -> int:
+	"""Write every entry in an Avid project to a JSON Lines file (a path, or an open text file), one object per entry.  Returns the number of entries written."""
+
+	with _open_text(output) as output_handle:
+
+		row_count = 0
+		for row in iter_rows(root, workers, use_processes):
+			output_handle.write(json.dumps({
+				"bin_path":  row.bin_path,
+				"timestamp": row.timestamp.isoformat(),
+				"user":      row.user,
+				"computer":  row.computer,
+				"log_mtime": row.log_mtime.isoformat(),
+			}, ensure_ascii=False) + "\n")
+			row_count += 1
+
+	return row_count
+
+def iter_record_batches(root:str, batch_size:int=DEFAULT_EXPORT_BATCH_SIZE, workers:typing.Optional[int]=None, use_processes:bool=False) -> typing.Iterator["pyarrow.RecordBatch"]:
+	"""
+	Scan an Avid project, yielding its entries as Arrow record batches of up to ``batch_size`` rows
+
+	Requires :mod:`pyarrow` (``pip install pybinhistory[parquet]``).
+	"""
+
+	pyarrow = _require_pyarrow()
+
+	if batch_size < 1:
+		raise ValueError(f"`batch_size` must be at least 1 (got {batch_size})")
+
+	schema = _arrow_schema()
+	columns:typing.List[list] = [[] for _ in schema]
+
+	for row in iter_rows(root, workers, use_processes):
+
+		for column, value in zip(columns, row):
+			column.append(value)
+
+		if len(columns[0]) >= batch_size:
+			yield _record_batch(columns, schema)
+			columns = [[] for _ in schema]
+
+	if columns[0]:
+		yield _record_batch(columns, schema)
+
+def export_parquet(root:str, output:typing.Union[str, os.PathLike], batch_size:int=DEFAULT_EXPORT_BATCH_SIZE, workers:typing.Optional[int]=None, use_processes:bool=False) -> int:
+	"""
+	Write every entry in an Avid project to a Parquet file, ``batch_size`` rows at a time.  Returns the number of entries written.
+
+	Requires :mod:`pyarrow` (``pip install pybinhistory[parquet]``).
+	"""
+
+	pyarrow = _require_pyarrow()
+	import pyarrow.parquet
+
+	row_count = 0
+
+	with contextlib.closing(pyarrow.parquet.ParquetWriter(os.fspath(output), _arrow_schema())) as writer:
+		for record_batch in iter_record_batches(root, batch_size, workers, use_processes):
+			writer.write_table(pyarrow.Table.from_batches([record_batch]))
+			row_count += record_batch.num_rows
+
+	return row_count
+
+def _arrow_schema() -> "pyarrow.Schema":
+	import pyarrow
+
+	return pyarrow.schema([
+		("bin_path",  pyarrow.string()),
+		("timestamp", pyarrow.timestamp("s")),
+		("user",      pyarrow.string()),
+		("computer",  pyarrow.string()),
+		("log_mtime", pyarrow.timestamp("us")),
+	])
+
+def _record_batch(columns:typing.List[list], schema:"pyarrow.Schema") -> "pyarrow.RecordBatch":
+	import pyarrow
+	return pyarrow.RecordBatch.from_arrays([pyarrow.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema)
+
+@contextlib.contextmanager
+def _open_text(output:typing.Union[str, os.PathLike, typing.TextIO]) -> typing.Iterator[typing.TextIO]:
+	"""Open a path for writing as UTF-8, or pass an already-open text file through (leaving it open)"""
+
+	if isinstance(output, (str, os.PathLike)):
+		with open(output, "w", encoding="utf-8", newline="") as output_handle:
+			yield output_handle
+	else:
+		yield output
+
+def _require_pyarrow():
+	"""Import :mod:`pyarrow` only once an Arrow or Parquet export is asked for, so ``import binhistory`` doesn't pay for it"""
+
+	try:
+		import pyarrow
+	except ImportError as e:
+		raise ImportError("Arrow and Parquet exports require `pyarrow`.  Install it with `pip install pybinhistory[parquet]`") from e
+	return pyarrow
@@ -0,0 +1,120 @@
+"""
+Lightweight instrumentation for finding out where the time goes when reading and writing logs
+"""
+
+import contextlib, threading, time, typing
+
+COUNTERS:typing.Tuple[str, ...] = ("files_opened", "bytes_read", "lines_parsed", "parse_errors", "files_written", "bytes_written")
+"""Names of the counters kept by :class:`Instrumentation`"""
+
+STAGES:typing.Tuple[str, ...] = ("open", "read", "parse", "timestamp", "validate", "touch", "format", "write")
+"""Names of the stages timed by :class:`Instrumentation`"""
+
+class Instrumentation:
+	"""
+	Counters and cumulative timings for reading, parsing and touching logs
+
+	Disabled by default, in which case the instrumented code only pays for checking :attr:`enabled`.  
+	Counters are listed in :data:`COUNTERS`, and the timed stages (in seconds) are:
+
+	- ``open``:      Opening log files in :meth:`.BinLog.from_path`
+	- ``read``:      Reading (and decoding) lines from the file in :meth:`.BinLog.from_stream`
+	- ``parse``:     Parsing the lines into entries in :meth:`.BinLog.from_stream`, which includes...
+	- ``timestamp``: ...working out the timestamp (and year) of each entry, and...
+	- ``validate``:  ...validating the fields of each new :class:`.BinLogEntry`
+	- ``touch``:     All of :meth:`.BinLog.touch`, which includes...
+	- ``format``:    ...merging and formatting the new log, and...
+	- ``write``:     ...writing it out
+
+	Stages can overlap, and time spent in several threads at once is added up, so timings can add up to 
+	more than the wall-clock time.
+	"""
+
+	def __init__(self):
+
+		self.enabled:bool = False
+		"""Whether stats are currently being collected"""
+
+		self._mutex = threading.Lock()
+		self.counters:typing.Dict[str, int]   = dict.fromkeys(COUNTERS, 0)
+		self.timings:typing.Dict[str, float]  = dict.fromkeys(STAGES, 0.0)
+	
+	def enable(self):
+		"""Start collecting stats"""
+		self.enabled = True
+	
+	def disable(self):
+		"""Stop collecting stats"""
+		self.enabled = False
+	
+	def reset(self):
+		"""Reset all counters and timings to zero"""
+		with self._mutex:
+			self.counters = dict.fromkeys(COUNTERS, 0)
+			self.timings  = dict.fromkeys(STAGES, 0.0)
+	
+	@contextlib.contextmanager
+	def collecting(self, reset:bool=True) -> typing.Iterator["Instrumentation"]:
+		"""Collect stats for the duration of a ``with`` block, optionally starting from zero"""
+
+		if reset:
+			self.reset()
+
+		was_enabled, self.enabled = self.enabled, True
+		try:
+			yield self
+		finally:
+			self.enabled = was_enabled
+	
+	def count(self, counter:str, amount:int=1):
+		"""Add to a counter (does nothing while disabled)"""
+		if not self.enabled:
+			return
+		with self._mutex:
+			self.counters[counter] += amount
+	
+	def add_time(self, stage:str, seconds:float):
+		"""Add to the time spent in a stage"""
+		with self._mutex:
+			self.timings[stage] += seconds
+	
+	def since(self, stage:str, started:float):
+		"""Add the time since ``started`` (from :func:`time.perf_counter`) to a stage"""
+		self.add_time(stage, time.perf_counter() - started)
+	
+	def timer(self, stage:str) -> typing.ContextManager[None]:
+		"""Add the time spent in a ``with`` block to a stage (does nothing while disabled)"""
+		if not self.enabled:
+			return _NOT_TIMING
+		return _StageTimer(self, stage)
+	
+	def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Union[int, float]]]:
+		"""A copy of the current counters and timings"""
+		with self._mutex:
+			return {"counters": dict(self.counters), "timings": dict(self.timings)}
+	
+	def __repr__(self) -> str:
+		counters = " ".join(f"{name}={value}" for name, value in self.counters.items())
+		timings  = " ".join(f"{name}={value:.4f}s" for name, value in self.timings.items())
+		return f"<{self.__class__.__name__} enabled={self.enabled} {counters} {timings}>"
+
+class _StageTimer:
+	"""Context manager for :meth:`Instrumentation.timer`"""
+
+	__slots__ = ("_instrumentation", "_stage", "_started")
+
+	def __init__(self, instrumentation:Instrumentation, stage:str):
+		self._instrumentation = instrumentation
+		self._stage = stage
+	
+	def __enter__(self):
+		self._started = time.perf_counter()
+	
+	def __exit__(self, exc_type, exc_value, traceback):
+		self._instrumentation.since(self._stage, self._started)
+
+_NOT_TIMING = contextlib.nullcontext()
+"""Shared do-nothing stand-in for a :class:`_StageTimer` while instrumentation is disabled"""
+
+stats = Instrumentation()
+"""Process-wide instrumentation.  Call ``binhistory.stats.enable()`` to start collecting."""
@@ -0,0 +1,288 @@
+"""
+Advisory locking, so concurrent writers don't trample each other's log entries
+"""
+
+import os, random, secrets, socket, threading, time, typing
+
+from .defaults import DEFAULT_LOCK_TIMEOUT
+from .exceptions import BinLogLockError
+
+try:
+	import fcntl
+except ImportError:
+	fcntl = None
+
+class LockMetrics:
+	"""Running totals of lock contention across every :class:`.BinLogLock` in the process"""
+
+	def __init__(self):
+
+		self._mutex = threading.Lock()
+
+		self.acquisitions:int = 0
+		"""Number of locks successfully acquired"""
+
+		self.timeouts:int     = 0
+		"""Number of locks given up on"""
+
+		self.retries:int      = 0
+		"""Number of times a lock was found to be held by someone else"""
+
+		self.wait_time:float  = 0.0
+		"""Total seconds spent waiting for locks"""
+	
+	def reset(self):
+		"""Reset all totals to zero"""
+		with self._mutex:
+			self.acquisitions = 0
+			self.timeouts     = 0
+			self.retries      = 0
+			self.wait_time    = 0.0
+	
+	def _record(self, acquired:bool, retries:int, wait_time:float):
+		with self._mutex:
+			if acquired:
+				self.acquisitions += 1
+			else:
+				self.timeouts += 1
+			self.retries   += retries
+			self.wait_time += wait_time
+	
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} acquisitions={self.acquisitions} timeouts={self.timeouts} retries={self.retries} wait_time={self.wait_time:.3f}>"
+
+lock_metrics = LockMetrics()
+"""Process-wide lock contention totals"""
+
+class BinLogLock:
+	"""
+	An advisory cross-process lock on a log, held for the length of a read-modify-write like :meth:`.BinLog.touch`
+
+	The lock is a hidden ``.<log name>.lock`` file beside the log, removed again on release.  Where :mod:`fcntl` is 
+	available, it is held with ``flock()``, which the OS releases if the process dies.  Elsewhere, the lock file is 
+	created exclusively with the holder's PID and hostname written in it.  One older than ``stale_after`` seconds 
+	is assumed to be abandoned, unless its holder is a process on this computer that's still running.  (Holders 
+	on other computers can't be checked, so keep ``stale_after`` well above the longest a lock is held for.)
+
+	If the lock is held elsewhere, acquiring retries with exponential backoff for up to ``timeout`` seconds 
+	before raising :class:`.exceptions.BinLogLockError`.
+	"""
+
+	def __init__(self, log_path:str, timeout:float=DEFAULT_LOCK_TIMEOUT, retry_delay:float=0.005, max_retry_delay:float=0.25, stale_after:float=60.0, use_fcntl:typing.Optional[bool]=None):
+
+		log_path = os.path.abspath(os.fspath(log_path))
+		directory, log_name = os.path.split(log_path)
+
+		self.lock_path:str = os.path.join(directory, f".{log_name}.lock")
+		"""Path to the lock file"""
+
+		self.timeout         = timeout
+		self.retry_delay     = retry_delay
+		self.max_retry_delay = max_retry_delay
+		self.stale_after     = stale_after
+		self.use_fcntl       = fcntl is not None if use_fcntl is None else use_fcntl
+
+		if self.use_fcntl and fcntl is None:
+			raise BinLogLockError("`fcntl` locking is not available on this platform")
+
+		self.retries:int     = 0
+		"""Number of times the lock was found to be held elsewhere during the last :meth:`acquire`"""
+
+		self.wait_time:float = 0.0
+		"""Seconds spent waiting during the last :meth:`acquire`"""
+
+		self._fd:typing.Optional[int] = None
+	
+	@property
+	def is_held(self) -> bool:
+		"""Whether this lock is currently held"""
+		return self._fd is not None
+	
+	def acquire(self):
+		"""Acquire the lock, waiting up to :attr:`timeout` seconds"""
+
+		if self.is_held:
+			raise BinLogLockError(f"Lock is already held: {self.lock_path}")
+
+		started = time.monotonic()
+		delay   = self.retry_delay
+		self.retries = 0
+
+		while not self._try_acquire():
+
+			self.retries += 1
+			elapsed = time.monotonic() - started
+
+			if elapsed >= self.timeout:
+				self.wait_time = elapsed
+				lock_metrics._record(False, self.retries, self.wait_time)
+				raise BinLogLockError(f"Timed out after {elapsed:.2f} seconds waiting for lock {self.lock_path}")
+			
+			# Jitter so a herd of writers doesn't retry in lockstep
+			time.sleep(min(delay * random.uniform(0.5, 1.5), self.timeout - elapsed))
+			delay = min(delay * 2, self.max_retry_delay)
+		
+		self.wait_time = time.monotonic() - started
+		lock_metrics._record(True, self.retries, self.wait_time)
+	
+	def release(self):
+		"""Release the lock"""
+
+		if not self.is_held:
+			return
+
+		fd, self._fd = self._fd, None
+
+		if self.use_fcntl:
+			# Removed while still locked, so anyone who opened it in the meantime sees it's gone once they get 
+			# the lock (see `_try_acquire`), rather than every bin directory keeping a lock file forever
+			try:
+				os.remove(self.lock_path)
+			except FileNotFoundError:
+				pass
+			fcntl.flock(fd, fcntl.LOCK_UN)
+			os.close(fd)
+			return
+		
+		# Only remove the lock file if it's still ours, and wasn't broken as stale and taken by someone else
+		try:
+			is_ours = _same_file(os.fstat(fd), os.stat(self.lock_path))
+		except FileNotFoundError:
+			is_ours = False
+		
+		os.close(fd)
+		if is_ours:
+			try:
+				os.remove(self.lock_path)
+			except FileNotFoundError:
+				pass
+
+	def _try_acquire(self) -> bool:
+		"""Attempt to take the lock once"""
+
+		if self.use_fcntl:
+			fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+			try:
+				fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+				# The last holder may have removed the file between our open and flock
+				is_current = _same_file(os.fstat(fd), os.stat(self.lock_path))
+			except (BlockingIOError, FileNotFoundError):
+				os.close(fd)
+				return False
+			except BaseException:
+				os.close(fd)
+				raise
+			if not is_current:
+				os.close(fd)
+				return False
+			self._fd = fd
+			return True
+		
+		try:
+			fd = os.open(self.lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+		except FileExistsError:
+			self._break_stale_lock()
+			return False
+		
+		try:
+			os.write(fd, f"{os.getpid()} {socket.gethostname()}\n".encode("utf-8"))
+		except BaseException:
+			os.close(fd)
+			os.remove(self.lock_path)
+			raise
+		self._fd = fd
+		return True
+	
+	def _break_stale_lock(self):
+		"""Clear out a lock file left behind by a writer that never came back"""
+
+		try:
+			stale_stat = os.stat(self.lock_path)
+			if time.time() - stale_stat.st_mtime <= self.stale_after or _holder_is_running(self.lock_path):
+				return
+			
+			# Moved aside first, then checked that it's the same file we judged to be stale.  If another waiter 
+			# beat us to it and someone's taken a fresh lock since, that's what we'd have just moved.
+			stale_path = f"{self.lock_path}.{secrets.token_hex(4)}.stale"
+			os.rename(self.lock_path, stale_path)
+		
+		except (FileNotFoundError, PermissionError):
+			# Gone already, or (on Windows) still open by its holder
+			return
+		
+		try:
+			if not _same_file(stale_stat, os.stat(stale_path)):
+				# Put the fresh lock back where it was (unless yet another lock has been taken since)
+				try:
+					_restore_lock_file(stale_path, self.lock_path)
+					return
+				except FileExistsError:
+					pass
+		finally:
+			try:
+				os.remove(stale_path)
+			except FileNotFoundError:
+				pass
+
+	def __enter__(self) -> "BinLogLock":
+		self.acquire()
+		return self
+	
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.release()
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} lock_path={self.lock_path} is_held={self.is_held}>"
+
+def _same_file(stat_a:os.stat_result, stat_b:os.stat_result) -> bool:
+	"""Whether two ``stat`` results are for the very same file, and it hasn't been modified in between"""
+	return (stat_a.st_dev, stat_a.st_ino, stat_a.st_mtime_ns) == (stat_b.st_dev, stat_b.st_ino, stat_b.st_mtime_ns)
+
+def _restore_lock_file(moved_path:str, lock_path:str):
+	"""Move a lock file back into place, without overwriting one that's been created since"""
+
+	if hasattr(os, "link"):
+		os.link(moved_path, lock_path)
+	else:
+		# Windows, where renaming doesn't overwrite anyway
+		os.rename(moved_path, lock_path)
+
+def _holder_is_running(lock_path:str) -> bool:
+	"""Whether the PID written in a lock file is a process on this computer that's still running"""
+
+	try:
+		with open(lock_path, encoding="utf-8") as lock_file:
+			pid, hostname = lock_file.read(256).split(maxsplit=1)
+		pid = int(pid)
+	except (OSError, ValueError):
+		# Unreadable, or from before PIDs were written
+		return False
+	
+	if hostname.strip() != socket.gethostname():
+		return False
+	
+	return _pid_is_running(pid)
+
+def _pid_is_running(pid:int) -> bool:
+	"""Whether a process with the given ID is running"""
+
+	if os.name == "nt":
+		import ctypes
+		kernel32 = ctypes.windll.kernel32
+		handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+		if not handle:
+			return False
+		try:
+			exit_code = ctypes.c_ulong()
+			return bool(kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))) and exit_code.value == 259  # STILL_ACTIVE
+		finally:
+			kernel32.CloseHandle(handle)
+	
+	try:
+		os.kill(pid, 0)
+	except ProcessLookupError:
+		return False
+	except PermissionError:
+		# Running, just not ours
+		return True
+	return True
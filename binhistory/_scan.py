@@ -0,0 +1,220 @@
+"""
+Project-wide scanning of bin logs
+"""
+
+import concurrent.futures, datetime, itertools, os, typing
+
+from ._binlog import BinLog, _read_log_file
+from ._binlogentry import _trusted_entry, _intern_name
+from .defaults import DEFAULT_FILE_EXTENSION, DEFAULT_BIN_EXTENSION, DEFAULT_SCAN_WORKERS, DEFAULT_SCAN_PROCESSES, DEFAULT_SCAN_CHUNK_SIZE
+from .exceptions import BinLogNotFoundError
+
+class LogFileInfo(typing.NamedTuple):
+	"""A ``.log`` file found by :func:`walk_project`, with what the directory listing already told us about it"""
+
+	log_path:str
+	"""Path to the log file"""
+
+	bin_path:str
+	"""Path to the bin the log belongs to"""
+
+	has_bin:bool
+	"""Whether the bin was in the same directory listing"""
+
+	size:int
+	"""Size of the log file in bytes, as of the walk"""
+
+	mtime_ns:int
+	"""Modified time of the log file in nanoseconds since the epoch, as of the walk"""
+
+	@property
+	def mtime(self) -> float:
+		"""Modified time of the log file in seconds since the epoch, as of the walk"""
+		return self.mtime_ns / 1_000_000_000
+	
+	@property
+	def stat_key(self) -> typing.Tuple[int, int]:
+		"""``(mtime_ns, size)``, for telling whether a log has changed since"""
+		return self.mtime_ns, self.size
+
+def scan_project(root:str, workers:typing.Optional[int]=None, use_processes:bool=False) -> typing.Iterator[typing.Tuple[str, typing.Union[BinLog, Exception]]]:
+	"""
+	Read and parse every ``.log`` file in an Avid project on a pool of threads
+
+	Yields a ``(bin_path, result)`` tuple for each log as soon as it has been read, where ``result`` is either 
+	the :class:`.BinLog`, or the exception raised while reading it.  Results are yielded in order of completion, 
+	not in directory order.
+
+	Threads are best when the logs are on a file server and most of the time is spent waiting on it.  When they're 
+	on a fast local disk, parsing becomes the bottleneck instead, so ``use_processes=True`` parses them on a pool 
+	of processes (:data:`.defaults.DEFAULT_SCAN_PROCESSES` by default) to make use of every core.
+	"""
+
+	for log_info, result in _scan_walked(root, workers, use_processes):
+		yield log_info.bin_path, result
+
+def walk_project(root:str) -> typing.Iterator[LogFileInfo]:
+	"""
+	Walk an Avid project once, yielding a :class:`LogFileInfo` for each ``.log`` file
+
+	Sizes and modified times come from the directory listing (``os.scandir``), so readers given a :class:`LogFileInfo` 
+	don't need to ``stat`` the log again, and ``has_bin`` doesn't cost a ``stat`` of the bin.  Dotfiles and resource 
+	forks are skipped, and symlinked directories aren't followed.
+	"""
+
+	directories = [os.fspath(root)]
+
+	while directories:
+
+		try:
+			dir_entries = os.scandir(directories.pop())
+		except OSError:
+			# Unreadable directories are skipped rather than ending the walk
+			continue
+
+		with dir_entries:
+
+			log_entries = []
+			names = set()
+
+			for dir_entry in dir_entries:
+
+				# Skip dotfiles and resource forks
+				if dir_entry.name.startswith("."):
+					continue
+
+				names.add(dir_entry.name)
+
+				try:
+					if dir_entry.is_dir(follow_symlinks=False):
+						directories.append(dir_entry.path)
+					elif dir_entry.name.lower().endswith(DEFAULT_FILE_EXTENSION) and dir_entry.is_file():
+						log_entries.append(dir_entry)
+				except OSError:
+					continue
+		
+		# Bins can't be matched up until the whole directory has been listed
+		for dir_entry in log_entries:
+
+			try:
+				stat_info = dir_entry.stat()
+			except OSError:
+				continue
+
+			bin_name = os.path.splitext(dir_entry.name)[0] + DEFAULT_BIN_EXTENSION
+			yield LogFileInfo(
+				log_path = dir_entry.path,
+				bin_path = os.path.join(os.path.dirname(dir_entry.path), bin_name),
+				has_bin  = bin_name in names,
+				size     = stat_info.st_size,
+				mtime_ns = stat_info.st_mtime_ns,
+			)
+
+def _scan_walked(root:str, workers:typing.Optional[int]=None, use_processes:bool=False) -> typing.Iterator[typing.Tuple[LogFileInfo, typing.Union[BinLog, Exception]]]:
+	"""Like :func:`scan_project`, but yields the :class:`LogFileInfo` of each log rather than just its bin path"""
+
+	if use_processes:
+		return _map_processes(walk_project(root), workers)
+	return _map_threaded(walk_project(root), workers, _read_walked_log)
+
+def _read_walked_log(log_info:LogFileInfo) -> BinLog:
+	"""Read a log found by :func:`walk_project`, taking its size and ``max_year`` from the walk rather than another ``stat``"""
+
+	try:
+		lines, max_year = _read_log_file(log_info.log_path, size=log_info.size, mtime=log_info.mtime)
+	except FileNotFoundError as e:
+		raise BinLogNotFoundError(f"A log file was not found at the given path {log_info.log_path}") from e
+	
+	return BinLog._from_lines(lines, max_year)
+
+def _map_threaded(paths:typing.Iterable[str], workers:typing.Optional[int]=None, func:typing.Callable[[str], typing.Any]=BinLog.from_path) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+	"""Call ``func`` (reading a log, by default) for each path on a pool of threads, yielding ``(path, result or exception)`` as each completes"""
+
+	workers = DEFAULT_SCAN_WORKERS if workers is None else workers
+	if workers < 1:
+		raise ValueError(f"`workers` must be at least 1 (got {workers})")
+
+	paths = iter(paths)
+
+	with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+
+		# Only keep a couple of reads queued per worker, so huge projects aren't walked all up front
+		pending = {executor.submit(func, path): path for path in itertools.islice(paths, workers * 2)}
+
+		try:
+			while pending:
+
+				done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+				for future in done:
+
+					path = pending.pop(future)
+
+					for next_path in itertools.islice(paths, 1):
+						pending[executor.submit(func, next_path)] = next_path
+
+					try:
+						result = future.result()
+					except (OSError, ValueError) as e:
+						result = e
+
+					yield path, result
+		finally:
+			# Don't bother finishing queued reads if the caller stopped early
+			for future in pending:
+				future.cancel()
+
+def _map_processes(log_infos:typing.Iterable[LogFileInfo], workers:typing.Optional[int]=None, chunk_size:int=DEFAULT_SCAN_CHUNK_SIZE) -> typing.Iterator[typing.Tuple[LogFileInfo, typing.Union[BinLog, Exception]]]:
+	"""Read logs in chunks on a pool of processes, yielding ``(log_info, log or exception)`` as each chunk completes"""
+
+	workers = DEFAULT_SCAN_PROCESSES if workers is None else workers
+	if workers < 1:
+		raise ValueError(f"`workers` must be at least 1 (got {workers})")
+
+	log_infos = iter(log_infos)
+	chunks = iter(lambda: list(itertools.islice(log_infos, chunk_size)), [])
+
+	with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+
+		# As with threads, only keep a couple of chunks queued per worker
+		pending = {executor.submit(_read_walked_chunk, chunk): chunk for chunk in itertools.islice(chunks, workers * 2)}
+
+		try:
+			while pending:
+
+				done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+				for future in done:
+
+					chunk = pending.pop(future)
+
+					for next_chunk in itertools.islice(chunks, 1):
+						pending[executor.submit(_read_walked_chunk, next_chunk)] = next_chunk
+
+					for log_info, result in zip(chunk, future.result()):
+						yield log_info, result if isinstance(result, Exception) else _log_from_fields(result)
+		finally:
+			for future in pending:
+				future.cancel()
+
+def _read_walked_chunk(log_infos:typing.List[LogFileInfo]) -> typing.List[typing.Union[typing.List[typing.Tuple[datetime.datetime, str, str]], Exception]]:
+	"""
+	Read a chunk of logs in a worker process
+
+	Each log comes back as a list of plain ``(timestamp, computer, user)`` tuples, which pickle into a lot less than 
+	:class:`.BinLogEntry` objects would (and repeated names are only sent once, thanks to interning).
+	"""
+
+	results = []
+
+	for log_info in log_infos:
+		try:
+			results.append([(entry.timestamp, entry.computer, entry.user) for entry in _read_walked_log(log_info)])
+		except (OSError, ValueError) as e:
+			results.append(e)
+	
+	return results
+
+def _log_from_fields(fields:typing.List[typing.Tuple[datetime.datetime, str, str]]) -> BinLog:
+	"""Rebuild a log from fields already validated by a worker process"""
+	return BinLog([_trusted_entry(timestamp, _intern_name(computer), _intern_name(user)) for timestamp, computer, user in fields])
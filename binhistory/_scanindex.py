@@ -0,0 +1,191 @@
+"""
+`ScanIndex` class, a persistent cache of parsed logs between project scans
+"""
+
+import datetime, itertools, os, sqlite3, typing
+
+from ._binlog import BinLog
+from ._binlogentry import BinLogEntry, _intern_name
+from .exceptions import BinLogParseError
+
+class ScanIndexChanges(typing.NamedTuple):
+	"""What changed in a project since the last :meth:`.ScanIndex.update`"""
+
+	changed:typing.List[str]
+	"""Paths of new or modified logs which were re-read"""
+
+	removed:typing.List[str]
+	"""Paths of logs which no longer exist"""
+
+	unchanged:int
+	"""Number of logs which were skipped, since their size and modified time were the same"""
+
+class ScanIndex:
+	"""
+	A persistent on-disk index of parsed logs, keyed by log path, modified time and size
+
+	After the first scan of a project, later scans only re-read logs whose ``st_mtime_ns`` or ``st_size`` have 
+	changed, so most of a rescan is just a walk of the directory tree.  The index is a SQLite database, which 
+	defaults to ``binhistory/scan_index.sqlite3`` under the user's cache directory.  It can be shared by several 
+	processes at once, but (being in write-ahead log mode) should be kept on a local disk rather than a file server.
+	"""
+
+	def __init__(self, index_path:typing.Optional[str]=None):
+
+		if index_path is None:
+			index_path = _default_index_path()
+			os.makedirs(os.path.dirname(index_path), exist_ok=True)
+		
+		self._index_path = os.fspath(index_path)
+		self._db = sqlite3.connect(self._index_path, timeout=_BUSY_TIMEOUT)
+		self._db.executescript(_SCHEMA)
+
+		self._unreadable:typing.Dict[str, OSError] = dict()
+		"""Logs the last :meth:`update` couldn't read, kept out of the database so they're retried next time"""
+	
+	@property
+	def index_path(self) -> str:
+		"""Path to the index database"""
+		return self._index_path
+	
+	def close(self):
+		"""Close the index database"""
+		self._db.close()
+	
+	def __enter__(self) -> "ScanIndex":
+		return self
+	
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def update(self, root:str, workers:typing.Optional[int]=None) -> ScanIndexChanges:
+		"""Bring the index up-to-date with the logs in a project, re-reading only new or modified logs"""
+		from ._scan import walk_project, _map_threaded, _read_walked_log
+
+		prefix = _path_prefix(root)
+
+		known = {log_path: (mtime_ns, size) for log_path, mtime_ns, size in self._db.execute(
+			"SELECT log_path, mtime_ns, size FROM logs WHERE substr(log_path, 1, ?) = ?", (len(prefix), prefix)
+		)}
+
+		# Walk everything first, so a log modified mid-read just gets picked up again next time
+		current = {log_info.log_path: log_info for log_info in walk_project(os.path.abspath(root))}
+		
+		changed = [log_path for log_path, log_info in current.items() if known.get(log_path) != log_info.stat_key]
+		removed = [log_path for log_path in known if log_path not in current]
+
+		with self._db:
+			self._db.executemany("DELETE FROM logs WHERE log_path = ?", ((log_path,) for log_path in removed))
+			self._db.executemany("DELETE FROM entries WHERE log_path = ?", ((log_path,) for log_path in removed))
+
+		for log_path in removed:
+			self._unreadable.pop(log_path, None)
+
+		# The index may well be shared with other processes scanning other projects, so it's only written to in short 
+		# transactions between reads, rather than held locked while reading logs from a (possibly slow) file server.
+		# A changed log keeps its old row until its new one is written, so if this is interrupted it's just re-read next time.
+		read_logs = _map_threaded((current[log_path] for log_path in changed), workers, _read_walked_log)
+
+		for batch in iter(lambda: list(itertools.islice(read_logs, _WRITE_BATCH_SIZE)), []):
+			with self._db:
+				for log_info, result in batch:
+					self._write_log(log_info, result)
+		
+		return ScanIndexChanges(changed=changed, removed=removed, unchanged=len(current) - len(changed))
+	
+	def _write_log(self, log_info:"LogFileInfo", result:typing.Union[BinLog, Exception]):
+		"""Replace the indexed entries of one log with what was just read (within a transaction)"""
+
+		log_path = log_info.log_path
+		self._unreadable.pop(log_path, None)
+
+		self._db.execute("DELETE FROM entries WHERE log_path = ?", (log_path,))
+
+		# Trouble reading (a flaky file server, say) may well clear up by next time, so isn't saved with the log's
+		# stat key like a parse error is.  Without a row, the log counts as new and is read again next update.
+		if isinstance(result, OSError):
+			self._db.execute("DELETE FROM logs WHERE log_path = ?", (log_path,))
+			self._unreadable[log_path] = result
+			return
+
+		error = str(result) if isinstance(result, Exception) else None
+
+		self._db.execute("INSERT OR REPLACE INTO logs (log_path, mtime_ns, size, error) VALUES (?, ?, ?, ?)", (log_path, log_info.mtime_ns, log_info.size, error))
+		
+		if error is None:
+			self._db.executemany("INSERT INTO entries (log_path, position, timestamp, computer, user) VALUES (?, ?, ?, ?, ?)", (
+				(log_path, position, entry.timestamp.isoformat(), entry.computer, entry.user) for position, entry in enumerate(result)
+			))
+	
+	def logs(self, root:typing.Optional[str]=None) -> typing.Iterator[typing.Tuple[str, typing.Union[BinLog, Exception]]]:
+		"""
+		Yield a ``(bin_path, result)`` tuple for each indexed log (under ``root``, if given), as of the last :meth:`update`
+
+		As with :func:`.scan_project`, ``result`` is either the :class:`.BinLog`, a :class:`.exceptions.BinLogParseError` 
+		if the log couldn't be parsed, or the ``OSError`` raised if it couldn't be read at all.
+		"""
+
+		prefix = _path_prefix(root) if root is not None else ""
+
+		logs = self._db.execute("SELECT log_path, error FROM logs WHERE substr(log_path, 1, ?) = ?", (len(prefix), prefix)).fetchall()
+		logs.extend((log_path, read_error) for log_path, read_error in self._unreadable.items() if log_path.startswith(prefix))
+
+		for log_path, error in sorted(logs, key=lambda log: log[0]):
+
+			if isinstance(error, OSError):
+				yield BinLog.bin_path_from_log_path(log_path), error
+				continue
+
+			if error is not None:
+				yield BinLog.bin_path_from_log_path(log_path), BinLogParseError(error)
+				continue
+
+			yield BinLog.bin_path_from_log_path(log_path), BinLog(
+				BinLogEntry(
+					timestamp = datetime.datetime.fromisoformat(timestamp),
+					computer  = _intern_name(computer),
+					user      = _intern_name(user)
+				) for timestamp, computer, user in self._db.execute("SELECT timestamp, computer, user FROM entries WHERE log_path = ? ORDER BY position", (log_path,))
+			)
+	
+	def scan(self, root:str, workers:typing.Optional[int]=None) -> typing.Iterator[typing.Tuple[str, typing.Union[BinLog, Exception]]]:
+		"""Update the index for a project, then yield a ``(bin_path, result)`` tuple for each of its logs, like :func:`.scan_project`"""
+
+		self.update(root, workers)
+		return self.logs(root)
+	
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} index_path={self.index_path}>"
+
+_WRITE_BATCH_SIZE:int = 256
+"""Number of freshly-read logs written to the index per transaction"""
+
+_BUSY_TIMEOUT:float = 60.0
+"""Seconds to wait for another process to finish writing to the index"""
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS logs (
+	log_path TEXT PRIMARY KEY,
+	mtime_ns INTEGER NOT NULL,
+	size     INTEGER NOT NULL,
+	error    TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+	log_path  TEXT NOT NULL,
+	position  INTEGER NOT NULL,
+	timestamp TEXT NOT NULL,
+	computer  TEXT NOT NULL,
+	user      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_log_path ON entries (log_path);
+"""
+
+def _path_prefix(root:str) -> str:
+	"""Absolute path of a directory, with a trailing separator so ``/proj`` doesn't match ``/project``"""
+	return os.path.join(os.path.abspath(root), "")
+
+def _default_index_path() -> str:
+	"""Default location of the index database in the user's cache directory"""
+	cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+	return os.path.join(cache_dir, "binhistory", "scan_index.sqlite3")
@@ -0,0 +1,128 @@
+"""
+`SortedBinLog`: a `BinLog` that's always in order
+"""
+
+import bisect, datetime, operator, typing
+
+from ._binlog import BinLog
+from ._binlogentry import BinLogEntry
+from .defaults import MAX_ENTRIES
+from .exceptions import BinLogTypeError
+
+_sort_key:typing.Callable[[BinLogEntry], typing.Tuple[datetime.datetime, str, str]] = operator.attrgetter("timestamp", "computer", "user")
+"""The same order as comparing :class:`.BinLogEntry`\\s, but as plain tuples that compare without calling back into Python"""
+
+class SortedBinLog(BinLog):
+	"""
+	A :class:`.BinLog` which keeps its entries sorted, oldest first
+
+	Entries go in their proper place no matter how they're added (so the index given to :meth:`insert` is ignored),
+	which makes :meth:`earliest_entry` and :meth:`latest_entry` instant, and :meth:`to_string` doesn't need to sort
+	anything.  Handy for logs that are read once and queried or added to a lot.
+	"""
+
+	_keys:typing.List[typing.Tuple[datetime.datetime, str, str]]
+	"""Sort key of each entry, kept in step with the entries for bisecting"""
+
+	def __init__(self, entries:typing.Optional[typing.Iterable[BinLogEntry]]=None):
+		super().__init__(entries)
+		# `UserList` fills in the initial entries without going through the setter
+		self.data = self._data
+
+	@BinLog.data.setter
+	def data(self, entries:typing.List[BinLogEntry]):
+		entries = sorted(entries, key=_sort_key)
+		BinLog.data.fset(self, entries)
+		self._keys = list(map(_sort_key, entries))
+
+	def __setitem__(self, index:int, item:typing.Any):
+		super().__setitem__(index, item)
+		# Could be anywhere now
+		self.data = self._data
+
+	def __delitem__(self, index:int):
+		super().__delitem__(index)
+		del self._keys[index]
+
+	def __contains__(self, item:typing.Any) -> bool:
+		return isinstance(item, BinLogEntry) and self._find(item) is not None
+
+	def insert(self, i, item):
+		"""Add an entry in its sorted position (``i`` is ignored)"""
+		self.append(item)
+
+	def append(self, item):
+		"""Add an entry in its sorted position"""
+		self._validate_item(item)
+		entries = self.data  # Parsing any lazy lines first
+
+		key = _sort_key(item)
+		index = bisect.bisect_right(self._keys, key)
+
+		self._keys.insert(index, key)
+		entries.insert(index, item)
+		self._sorted_index = None
+
+	def extend(self, other):
+		"""Add entries in their sorted positions"""
+		try:
+			other = list(other)
+		except TypeError as e:
+			raise BinLogTypeError(e) from e
+		
+		for entry in other:
+			self._validate_item(entry)
+
+		if len(other) == 1:
+			self.append(other[0])
+		elif other:
+			self.data = self.data + other
+
+	def pop(self, i:int=-1) -> BinLogEntry:
+		entry = super().pop(i)
+		del self._keys[i]
+		return entry
+
+	def remove(self, item:BinLogEntry):
+		index = self._find(item) if isinstance(item, BinLogEntry) else None
+		if index is None:
+			raise ValueError(f"{item!r} is not in the log")
+		del self[index]
+
+	def clear(self):
+		super().clear()
+		self._keys.clear()
+
+	def sort(self, *args, **kwargs):
+		"""Already sorted.  Sorting any other way would undo that, so isn't allowed."""
+		if args or kwargs:
+			raise TypeError(f"{self.__class__.__name__} is always sorted oldest first")
+
+	def reverse(self):
+		raise TypeError(f"{self.__class__.__name__} is always sorted oldest first")
+
+	def _find(self, item:BinLogEntry) -> typing.Optional[int]:
+		"""Index of an entry, found by bisecting"""
+		entries = self.data  # Parsing any lazy lines first
+		key = _sort_key(item)
+		index = bisect.bisect_left(self._keys, key)
+		return index if index < len(entries) and self._keys[index] == key else None
+
+	def to_string(self) -> str:
+		"""Format as string"""
+		return str().join(e.to_string() + "\n" for e in self.data[-MAX_ENTRIES:])
+
+	def earliest_entry(self) -> typing.Optional[BinLogEntry]:
+		"""Get the first/earliest entry from a bin log"""
+		return self.data[0] if self else None
+
+	def latest_entry(self) -> typing.Optional[BinLogEntry]:
+		"""Get the last/latest/most recent entry from a bin log"""
+		return self.data[-1] if self else None
+
+	def _get_sorted_index(self) -> typing.Tuple[typing.List[datetime.datetime], typing.List[BinLogEntry]]:
+		# The entries are sorted already, so there's only the timestamps to pull out
+		if self._sorted_index is None:
+			entries = self.data
+			self._sorted_index = ([key[0] for key in self._keys], entries)
+		return self._sorted_index
@@ -0,0 +1,193 @@
+"""
+Watching a project for new log entries as they happen
+"""
+
+import os, time, typing
+
+from ._binlog import BinLog
+from ._binlogentry import BinLogEntry
+from .defaults import DEFAULT_FILE_EXTENSION
+
+def watch(root:str, interval:float=2.0, emit_existing:bool=False, use_inotify:typing.Optional[bool]=None) -> typing.Iterator[typing.Tuple[str, BinLogEntry]]:
+	"""
+	Watch an Avid project for changes, yielding a ``(bin_path, entry)`` tuple for each new :class:`.BinLogEntry` as it appears
+
+	Logs are checked every ``interval`` seconds by comparing their size and modified time, and only re-read when those change.  
+	On Linux with the ``inotify_simple`` package installed (``pip install pybinhistory[watch]``), the watcher instead sleeps 
+	until the kernel reports a change, and only checks the logs that were reported.  Pass ``use_inotify=False`` to always poll.
+
+	Entries already in the logs when watching begins are only yielded if ``emit_existing`` is ``True``.
+	"""
+
+	watcher = LogWatcher(root)
+	initial = watcher.poll()
+
+	if emit_existing:
+		yield from initial
+
+	if use_inotify is None:
+		try:
+			_require_inotify()
+			use_inotify = True
+		except ImportError:
+			use_inotify = False
+	elif use_inotify:
+		_require_inotify()
+
+	if not use_inotify:
+		while True:
+			time.sleep(interval)
+			yield from watcher.poll()
+	
+	with _InotifyWaiter(watcher.root) as waiter:
+
+		# Anything that changed while the watches were being set up
+		yield from watcher.poll()
+
+		while True:
+			changed_paths = waiter.wait(interval)
+			if changed_paths is None:
+				# Events were lost, so fall back to checking everything
+				yield from watcher.poll()
+			elif changed_paths:
+				yield from watcher.poll(changed_paths)
+
+class LogWatcher:
+	"""
+	Keeps track of the entries in every log of a project, to report only new entries as logs change
+
+	Call :meth:`poll` to check for changes.  A log rewritten by :meth:`.BinLog.touch` (which re-sorts and trims 
+	entries to :data:`.defaults.MAX_ENTRIES`) only reports the entries which weren't there before.
+	"""
+
+	def __init__(self, root:str):
+
+		self._root = os.path.abspath(root)
+		self._known:typing.Dict[str, typing.Tuple[typing.Tuple[int, int], typing.FrozenSet[BinLogEntry]]] = dict()
+	
+	@property
+	def root(self) -> str:
+		"""Path to the project being watched"""
+		return self._root
+
+	def poll(self, log_paths:typing.Optional[typing.Iterable[str]]=None) -> typing.List[typing.Tuple[str, BinLogEntry]]:
+		"""
+		Check logs for changes, returning ``(bin_path, entry)`` tuples for any new entries, oldest first
+
+		Checks every log in the project by default, or only the given ``log_paths``.
+		"""
+		from ._scan import walk_project
+
+		if log_paths is None:
+			# The walk already has the sizes and modified times to compare
+			stat_keys = {log_info.log_path: log_info.stat_key for log_info in walk_project(self._root)}
+			for removed_path in set(self._known) - set(stat_keys):
+				del self._known[removed_path]
+		else:
+			stat_keys = dict()
+			for log_path in map(os.fspath, log_paths):
+				try:
+					stat_info = os.stat(log_path)
+				except OSError:
+					self._known.pop(log_path, None)
+					continue
+				stat_keys[log_path] = (stat_info.st_mtime_ns, stat_info.st_size)
+		
+		new_entries = []
+
+		for log_path, stat_key in stat_keys.items():
+
+			known_stat_key, known_entries = self._known.get(log_path, (None, frozenset()))
+
+			if stat_key == known_stat_key:
+				continue
+
+			try:
+				entries = frozenset(BinLog.from_path(log_path))
+			except (OSError, ValueError):
+				# Possibly caught mid-write, so leave it to be checked again next time
+				continue
+
+			self._known[log_path] = (stat_key, entries)
+
+			bin_path = BinLog.bin_path_from_log_path(log_path)
+			new_entries.extend((bin_path, entry) for entry in entries - known_entries)
+		
+		return sorted(new_entries, key=lambda change: (change[1], change[0]))
+
+class _InotifyWaiter:
+	"""Waits on inotify events for the logs in a directory tree, watching new subdirectories as they appear"""
+
+	def __init__(self, root:str):
+
+		inotify_simple = _require_inotify()
+
+		self._flags = inotify_simple.flags
+		self._inotify = inotify_simple.INotify()
+		self._directories:typing.Dict[int, str] = dict()
+		self._mask = inotify_simple.flags.CLOSE_WRITE | inotify_simple.flags.MOVED_TO | inotify_simple.flags.CREATE | inotify_simple.flags.DELETE | inotify_simple.flags.MOVED_FROM
+		self._watch_tree(root)
+	
+	def __enter__(self) -> "_InotifyWaiter":
+		return self
+	
+	def __exit__(self, exc_type, exc_value, traceback):
+		self._inotify.close()
+
+	def wait(self, timeout:float) -> typing.Optional[typing.Set[str]]:
+		"""Wait up to ``timeout`` seconds for changes, returning the affected log paths, or ``None`` if events were lost"""
+
+		flags = self._flags
+		changed_paths = set()
+
+		for event in self._inotify.read(timeout=int(timeout * 1000), read_delay=50):
+
+			if event.mask & flags.Q_OVERFLOW:
+				return None
+			
+			if event.mask & flags.IGNORED:
+				self._directories.pop(event.wd, None)
+				continue
+
+			directory = self._directories.get(event.wd)
+			if directory is None or event.name.startswith("."):
+				continue
+
+			path = os.path.join(directory, event.name)
+
+			if event.mask & flags.ISDIR:
+				if event.mask & (flags.CREATE | flags.MOVED_TO):
+					# Catch any logs that landed before the new directory was being watched
+					changed_paths.update(self._watch_tree(path))
+			elif event.name.lower().endswith(DEFAULT_FILE_EXTENSION):
+				changed_paths.add(path)
+		
+		return changed_paths
+
+	def _watch_tree(self, root:str) -> typing.List[str]:
+		"""Add watches for a directory and its subdirectories, returning any logs found along the way"""
+
+		log_paths = []
+
+		for directory, subdirectories, filenames in os.walk(root):
+
+			# Skip dotfiles, same as `scan_project`
+			subdirectories[:] = [d for d in subdirectories if not d.startswith(".")]
+
+			try:
+				self._directories[self._inotify.add_watch(directory, self._mask)] = directory
+			except OSError:
+				continue
+
+			log_paths.extend(os.path.join(directory, f) for f in filenames if not f.startswith(".") and f.lower().endswith(DEFAULT_FILE_EXTENSION))
+		
+		return log_paths
+
+def _require_inotify():
+	"""Import :mod:`inotify_simple` only once a watch actually wants it, so ``import binhistory`` doesn't pay for it"""
+
+	try:
+		import inotify_simple
+	except ImportError as e:
+		raise ImportError("`inotify_simple` is required to watch with inotify.  Install it with `pip install pybinhistory[watch]`") from e
+	return inotify_simple
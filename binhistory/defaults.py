@@ -2,6 +2,8 @@
 Sane defaults for optimal operation.  Change these at your own risk!
 """
 
+import typing
+
 def _get_default_user() -> str:
 	import getpass
 	try:
@@ -16,9 +18,19 @@ def _get_default_computer() -> str:
 	except:
 		return "pybinhistory"
 
+def _get_cpu_count() -> int:
+	import os
+	return os.cpu_count() or 1
+
 DEFAULT_FILE_EXTENSION:str = ".log"
 """The expected file extension for bin log files"""
 
+DEFAULT_BIN_EXTENSION:str = ".avb"
+"""The expected file extension for Avid bins"""
+
+DEFAULT_ENCODINGS:typing.Tuple[str, ...] = ("utf-8", "mac_roman")
+"""Text encodings to try, in order, when decoding a log file (older logs have been spotted in mac_roman)"""
+
 MAX_ENTRIES:int = 10
 """Maximum log entries allowed in a file"""
 
@@ -26,6 +38,30 @@ MAX_FIELD_LENGTH:int = 15
 """Max number of characters in User or Computer fields"""
 # NerdNote: I feel like this comes from NetBIOS max length of 15?
 
+DEFAULT_SCAN_WORKERS:int = min(32, _get_cpu_count() + 4)
+"""Number of threads used to read logs concurrently during a project scan"""
+
+DEFAULT_SCAN_PROCESSES:int = _get_cpu_count()
+"""Number of processes used to parse logs during a project scan with ``use_processes=True``"""
+
+DEFAULT_SCAN_CHUNK_SIZE:int = 64
+"""Number of logs handed to a process at a time during a project scan with ``use_processes=True``"""
+
+DEFAULT_EXPORT_BATCH_SIZE:int = 65536
+"""Number of rows per record batch when exporting a project to Arrow or Parquet"""
+
+DEFAULT_ASYNC_CONCURRENCY:int = 64
+"""Max number of file operations the async API will run at once, unless given its own semaphore"""
+
+DEFAULT_LOCK_TIMEOUT:float = 10.0
+"""Max number of seconds to wait for another writer to release a log when touching with ``lock=True``"""
+
+YEAR_CACHE_SIZE:int = 4096
+"""Max number of month/day/weekday/year combos to remember when inferring the year of a log entry"""
+
+NAME_INTERN_CACHE_SIZE:int = 4096
+"""Max number of distinct user and computer names to share between parsed log entries before starting over"""
+
 DATETIME_STRING_FORMAT:str = "%a %b %d %H:%M:%S"
 """Datetime string format for bin log entry (Example: Wed Dec 15 09:47:51)"""
 
@@ -43,4 +79,4 @@ DEFAULT_COMPUTER:str       = _get_default_computer()[:MAX_FIELD_LENGTH]
 Default Computer name to use during the creation of new :py:doc:`binhistory.BinLogEntry` object.
 
 This defaults to the hostname of the machine that is currently running the python script.
-"""
\ No newline at end of file
+"""
\ No newline at end of file
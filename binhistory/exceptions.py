@@ -5,6 +5,21 @@ Bespoke ``Exception`` classes raised by ``pybinhistory``
 class BinLogParseError(ValueError):
 	"""An invalid value was encountered while parsing the log"""
 
+class BinLogLineError(BinLogParseError):
+	"""A particular line of the log could not be parsed"""
+
+	def __init__(self, message:str, line_number:int, line:str):
+		super().__init__(message)
+
+		self.line_number = line_number
+		"""Line number (starting at 1) of the offending line"""
+
+		self.line = line
+		"""The offending line, as read from the log"""
+	
+	def __reduce__(self):
+		return self.__class__, (self.args[0], self.line_number, self.line)
+
 class BinLogFieldLengthError(ValueError):
 	"""A log field is not a valid length (between 1 and ``MAX_FIELD_LENGTH`` chars)"""
 
@@ -18,4 +33,7 @@ class BinLogNotFoundError(FileNotFoundError):
 	"""A log was not found at the given file path"""
 
 class BinNotFoundError(FileNotFoundError):
-	"""A bin was not found at the given file path"""
\ No newline at end of file
+	"""A bin was not found at the given file path"""
+
+class BinLogLockError(TimeoutError):
+	"""A lock on a log could not be acquired"""
\ No newline at end of file
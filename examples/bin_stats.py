@@ -3,7 +3,7 @@ Given an Avid project folder path, get last modified info for Avid bins
 """
 
 import sys, pathlib
-from binhistory import BinLog, exceptions
+from binhistory import scan_project
 
 if __name__ == "__main__":
 
@@ -11,18 +11,9 @@ if __name__ == "__main__":
 		print(f"Usage: {pathlib.Path(__file__)} avid_project_dir", file=sys.stderr)
 		sys.exit(1)
 	
-	for path_bin in pathlib.Path(sys.argv[1]).rglob("*.avb"):
+	for path_bin, log in scan_project(sys.argv[1]):
 
-		# Skip dotfiles
-		if path_bin.name.startswith("."):
-			continue
-
-		try:
-			log = BinLog.from_bin(path_bin)
-		except exceptions.BinLogNotFoundError:
-			# Skip bins without logs
-			continue
-		except exceptions.BinLogParseError:
+		if isinstance(log, Exception):
 			# Silently skip bad logs
 			continue
 		if not log:
@@ -31,5 +22,4 @@ if __name__ == "__main__":
 
 		last = log.latest_entry()
 
-		print(f"{path_bin.name:>72}  :  Last modified by {last.computer} on {last.timestamp}")
-		
\ No newline at end of file
+		print(f"{pathlib.Path(path_bin).name:>72}  :  Last modified by {last.computer} on {last.timestamp}")
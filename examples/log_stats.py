@@ -3,34 +3,11 @@ Given a path to an Avid project directory, print some interesting stats
 about the log files within.  Okay well I think it's pretty neat.
 """
 
-from binhistory import BinLog, BinLogEntry
+from binhistory import BinLog, BinLogStats, scan_project
 import sys, pathlib
 
 USAGE = f"{pathlib.Path(__file__)} avid_project_dir"
 
-# Stats
-logs_good = 0
-"""Logs succesfully read"""
-logs_bad  = 0
-"""Logs that weren't kind"""
-
-user_counts:dict[str,int] = dict()
-"""Number of entries per user"""
-computer_counts:dict[str,int] = dict()
-"""Number of entries per computer"""
-
-oldest_log:BinLogEntry = None
-"""Earliest log entry"""
-oldest_log_path:str = None
-"""Log path containing the earliest log entry"""
-
-newest_log:BinLogEntry = None
-"""Latest log entry"""
-newest_log_path = None
-"""Log path contining the latest log entry"""
-
-
-
 if __name__ == "__main__":
 
 	if not len(sys.argv) > 1:
@@ -44,82 +21,56 @@ if __name__ == "__main__":
 
 print("Scroungin up them logs fer yas here...")
 
-# Loop through all known logs
-for log_path in pathlib.Path(sys.argv[1]).rglob("*.log"):
+stats = BinLogStats()
 
-	# Skip resource forks
-	if log_path.name.startswith("."):
-		continue
+# Loop through all known logs (read in parallel, skipping resource forks)
+for bin_path, log in scan_project(sys.argv[1]):
 
-	# Read and print the log
-	try:
-		print(f"\033[KReading {log_path}:", end="\r", flush=True)
-		log = BinLog.from_path(log_path)
-		print(f"\033[KFound {log_path}: {log}", end="\r")
-		logs_good += 1
+	log_path = BinLog.log_path_from_bin_path(bin_path)
 
-	except Exception as e:
-		print(f"\033[KError for {log_path}: {e}", file=sys.stderr)
-		logs_bad += 1
+	# Print the log
+	if isinstance(log, Exception):
+		print(f"\033[KError for {log_path}: {log}", file=sys.stderr)
+		stats.add_error()
 		continue
 
-	# Gather stats	
-	for entry in log:
-
-		# Count user
-		if entry.user not in user_counts:
-			user_counts[entry.user] = 0
-		user_counts[entry.user] += 1
-
-		# Count hostname
-		if entry.computer not in computer_counts:
-			computer_counts[entry.computer] = 0
-		computer_counts[entry.computer] += 1
-
-		# Get timestamp extremes
-		if not log:
-			continue
-
-		if not oldest_log or log[0].timestamp < oldest_log.timestamp:
-			oldest_log = log[0]
-			oldest_log_path = log_path
+	print(f"\033[KFound {log_path}: {log}", end="\r")
 
-		if not newest_log or log[-1].timestamp > newest_log.timestamp:
-			newest_log = log[-1]
-			newest_log_path = log_path
+	# Gather stats
+	stats.add(log, log_path)
 
 
 print("")
-print(f"{logs_good} log(s) valid;  {logs_bad} log(s) invalid")
+print(f"{stats.logs_read} log(s) valid;  {stats.logs_failed} log(s) invalid")
 print("")
 
-if not logs_good:
+if not stats.logs_read:
 	sys.exit(0)
 
 # Print me them stats
 
-print(f"{len(user_counts)} User Profile(s):")
-for user,count in sorted(user_counts.items(), key=lambda u: u[1], reverse=True):
+print(f"{len(stats.user_counts)} User Profile(s):")
+for user,count in stats.user_counts.most_common():
 	print(f"{user.rjust(15)}  ({count} entries)")
 
 print("")
 
-print(f"{len(computer_counts)} System(s):")
-for computer,count in sorted(computer_counts.items(), key=lambda c: c[1], reverse=True):
+print(f"{len(stats.computer_counts)} System(s):")
+for computer,count in stats.computer_counts.most_common():
 	print(f"{computer.rjust(15)}  ({count} entries)")
 
 print("")
 
-if oldest_log:
-	print(f"  Earliest log:  {oldest_log.timestamp.strftime(r'%Y %m %d @ %H:%M:%S')}")
-	print(f"     From file:  {oldest_log_path}")
-	print(f"    From entry:  {oldest_log.to_string()}")
+if stats.earliest_entry:
+	print(f"  Earliest log:  {stats.earliest_entry.timestamp.strftime(r'%Y %m %d @ %H:%M:%S')}")
+	print(f"     From file:  {stats.earliest_path}")
+	print(f"    From entry:  {stats.earliest_entry.to_string()}")
 
 print("")
 
-if newest_log:
-	print(f"    Latest log:  {newest_log.timestamp.strftime(r'%Y %m %d @ %H:%M:%S')}")
-	print(f"     From file:  {newest_log_path}")
-	print(f"    From entry:  {newest_log.to_string()}")
+if stats.latest_entry:
+	print(f"    Latest log:  {stats.latest_entry.timestamp.strftime(r'%Y %m %d @ %H:%M:%S')}")
+	print(f"     From file:  {stats.latest_path}")
+	print(f"    From entry:  {stats.latest_entry.to_string()}")
 
 print("")
\ No newline at end of file
@@ -16,16 +16,13 @@ except ImportError:
 	print("`pyavb` and `pybinlock` packages are required for this example, but was not found.  Please `pip install` them before using", file=sys.stderr)
 	sys.exit(1)
 
-def get_log_entry_for_timestamp(log:binhistory.BinLog, timestamp:datetime.datetime) -> binhistory.BinLog:
-	"""Get the closest log entry for a given timestamp"""
-
-	last = None
-	for log_entry in log:
-		if log_entry.timestamp > timestamp:
-			last = log_entry
-	if (last.timestamp - timestamp) > datetime.timedelta(hours=1):
+def get_log_entry_for_timestamp(log:binhistory.BinLog, timestamp:datetime.datetime) -> binhistory.BinLogEntry:
+	"""Get the log entry for the bin save following a given timestamp (within the hour)"""
+
+	log_entry = log.entry_at_or_after(timestamp)
+	if log_entry is None or (log_entry.timestamp - timestamp) > datetime.timedelta(hours=1):
 		return None
-	return last
+	return log_entry
 
 def build_change_list(log:binhistory.BinLog, sequences:list[avb.trackgroups.Composition]) -> dict[binhistory.BinLogEntry, list[avb.trackgroups.Composition]]:
 	"""Determine who changed what"""
@@ -82,8 +79,7 @@ if __name__ == "__main__":
 		print("No sequences found in bin; nothing to do")
 		sys.exit()
 
-	sorted_log = sorted(log, key=lambda l:l.timestamp, reverse=True)
-	changes = build_change_list(sorted_log, sequences)
+	changes = build_change_list(log, sequences)
 
 	for change in [c for c in changes if c is not None]:
 		print("")
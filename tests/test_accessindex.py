@@ -0,0 +1,108 @@
+import unittest, tempfile, pathlib, datetime
+from binhistory import AccessIndex, BinLog, BinLogEntry, scan_project
+
+START = datetime.datetime(2024, 5, 6, 9, 0, 0)
+HOUR  = datetime.timedelta(hours=1)
+
+class TestAccessIndex(unittest.TestCase):
+
+	def setUp(self):
+
+		self._temp_dir = tempfile.TemporaryDirectory()
+		self.project = pathlib.Path(self._temp_dir.name)
+
+		self.bin_paths = [str(self.project/f"Reel {index}.avb") for index in range(1, 4)]
+
+		BinLog([
+			BinLogEntry(timestamp=START, computer="zBay1", user="editor"),
+			BinLogEntry(timestamp=START + HOUR * 5, computer="zBay4", user="assistant"),
+		]).to_bin(self.bin_paths[0])
+
+		BinLog([
+			BinLogEntry(timestamp=START + HOUR, computer="zBay4", user="editor"),
+		]).to_bin(self.bin_paths[1])
+
+		BinLog([
+			BinLogEntry(timestamp=START + HOUR * 2, computer="zBay1", user="assistant"),
+			BinLogEntry(timestamp=START + HOUR * 3, computer="zBay1", user="editor"),
+		]).to_bin(self.bin_paths[2])
+
+		(self.project/"Broken.log").write_text("Heehee oops\n")
+
+		self.index = AccessIndex.from_project(self.project, workers=2)
+	
+	def tearDown(self):
+		self._temp_dir.cleanup()
+
+	def test_build(self):
+
+		self.assertEqual(len(self.index), 3)
+		self.assertCountEqual(self.index.bin_paths, self.bin_paths)
+		self.assertCountEqual(self.index.users, ["editor", "assistant"])
+		self.assertCountEqual(self.index.computers, ["zBay1", "zBay4"])
+
+		self.assertEqual(self.index.user_postings("editor"), [
+			(START, self.bin_paths[0]),
+			(START + HOUR, self.bin_paths[1]),
+			(START + HOUR * 3, self.bin_paths[2]),
+		])
+		self.assertEqual(self.index.user_postings("nobody"), [])
+
+		# Same as building from any other scan results
+		self.assertEqual(AccessIndex.from_scan(scan_project(self.project)).user_postings("editor"), self.index.user_postings("editor"))
+
+	def test_duplicate_bins(self):
+
+		old_log = BinLog([BinLogEntry(timestamp=START, computer="zOldBay", user="olduser")])
+		new_log = BinLog([BinLogEntry(timestamp=START + HOUR, computer="zBay1", user="editor")])
+
+		index = AccessIndex.from_scan([(self.bin_paths[0], old_log), (self.bin_paths[0], new_log)])
+		self.assertEqual(len(index), 1)
+		self.assertEqual(index.users, ["editor"])
+		self.assertEqual(index.computer_postings("zOldBay"), [])
+
+		index.remove_bin(self.bin_paths[0])
+		self.assertEqual((index.users, index.computers), ([], []))
+
+	def test_queries(self):
+
+		self.assertEqual(self.index.computer_postings("zBay1", start=START + HOUR, end=START + HOUR * 3), [
+			(START + HOUR * 2, self.bin_paths[2]),
+			(START + HOUR * 3, self.bin_paths[2]),
+		])
+		self.assertEqual(self.index.computer_postings("zBay1", end=START), [(START, self.bin_paths[0])])
+		self.assertEqual(self.index.computer_postings("zBay1", start=START + HOUR * 4), [])
+
+		self.assertEqual(self.index.bins_touched(users="editor"), [self.bin_paths[2], self.bin_paths[1], self.bin_paths[0]])
+		self.assertEqual(self.index.bins_touched(users=["assistant"], computers="zBay4", start=START + HOUR, end=START + HOUR * 2), [self.bin_paths[2], self.bin_paths[1]])
+		self.assertEqual(self.index.bins_touched(), [])
+
+	def test_update(self):
+
+		# A new entry in one log
+		BinLog.touch_bin(self.bin_paths[1], BinLogEntry(timestamp=START + HOUR * 6, computer="zBay9", user="producer"))
+		self.index.update_bin(self.bin_paths[1])
+
+		self.assertEqual(self.index.bins_touched(users="producer"), [self.bin_paths[1]])
+		self.assertEqual(len(self.index.user_postings("editor")), 3)
+
+		# Given a log directly, replacing what was there
+		self.index.update_bin(self.bin_paths[0], BinLog([BinLogEntry(timestamp=START + HOUR * 7, computer="zBay9", user="producer")]))
+		self.assertEqual(self.index.bins_touched(users="producer"), [self.bin_paths[0], self.bin_paths[1]])
+		self.assertNotIn(self.bin_paths[0], [posting.bin_path for posting in self.index.user_postings("assistant")])
+		self.assertEqual(len(self.index.user_postings("editor")), 2)
+
+		# Removed logs
+		pathlib.Path(BinLog.log_path_from_bin_path(self.bin_paths[2])).unlink()
+		self.index.update_bin(self.bin_paths[2])
+		self.assertNotIn(self.bin_paths[2], self.index.bin_paths)
+		self.assertNotIn("assistant", self.index.users)
+		self.assertNotIn("zBay1", self.index.computers)
+
+		self.index.remove_bin(self.bin_paths[1])
+		self.index.remove_bin("Not a bin.avb")
+		self.assertEqual(self.index.bin_paths, [self.bin_paths[0]])
+
+if __name__ == "__main__":
+
+	unittest.main()
@@ -0,0 +1,93 @@
+import unittest, tempfile, pathlib, shutil, asyncio
+from unittest import mock
+from binhistory import BinLog, BinLogEntry, ascan_project, exceptions
+
+PATH_BIN = str(pathlib.Path(__file__).with_name("example.avb"))
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestAsync(unittest.TestCase):
+
+	def test_read(self):
+
+		async def read():
+			return await BinLog.afrom_path(PATH_LOG), await BinLog.afrom_bin(PATH_BIN, lazy=True)
+
+		from_path, from_bin = asyncio.run(read())
+		self.assertEqual(from_path, BinLog.from_path(PATH_LOG))
+		self.assertEqual(from_bin, from_path)
+
+		with self.assertRaises(exceptions.BinLogNotFoundError):
+			asyncio.run(BinLog.afrom_bin("example2.avb"))
+	
+	def test_touch(self):
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+			temp_dir = pathlib.Path(temp_dir)
+
+			with self.assertRaises(exceptions.BinNotFoundError):
+				asyncio.run(BinLog.atouch_bin(temp_dir/"weewee.avb", missing_bin_ok=False))
+			
+			async def touch_lots():
+				limiter = asyncio.Semaphore(4)
+				await asyncio.gather(*(BinLog.atouch_bin(temp_dir/f"Reel {i}.avb", BinLogEntry(user=f"user{i}"), limiter=limiter) for i in range(20)))
+				await BinLog.atouch(temp_dir/"Reel 0.log", BinLogEntry(user="again"))
+			
+			asyncio.run(touch_lots())
+
+			self.assertEqual(len(list(temp_dir.glob("*.log"))), 20)
+			self.assertCountEqual(BinLog.from_path(temp_dir/"Reel 0.log").users(), ["user0", "again"])
+	
+	def test_scan(self):
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+			temp_dir = pathlib.Path(temp_dir)
+
+			(temp_dir/"Reels").mkdir()
+			shutil.copy(PATH_LOG, temp_dir/"Reel 1.log")
+			shutil.copy(PATH_LOG, temp_dir/"Reels"/"Reel 2.log")
+			(temp_dir/"Broken.log").write_text("Heehee oops\n")
+
+			async def scan():
+				return [result async for result in ascan_project(temp_dir, limiter=asyncio.Semaphore(2))]
+			
+			results = dict(asyncio.run(scan()))
+			self.assertEqual(len(results), 3)
+			self.assertIsInstance(results.pop(str(temp_dir/"Broken.avb")), exceptions.BinLogParseError)
+			for log in results.values():
+				self.assertEqual(log, BinLog.from_path(PATH_LOG))
+
+	def test_scan_is_bounded(self):
+
+		from binhistory import _async, _scan
+		walk_project = _scan.walk_project
+		walked = []
+
+		def counting_walk(root):
+			for log_info in walk_project(root):
+				walked.append(log_info)
+				yield log_info
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+			temp_dir = pathlib.Path(temp_dir)
+			for i in range(20):
+				shutil.copy(PATH_LOG, temp_dir/f"Reel {i}.log")
+
+			async def first_result():
+				async for result in ascan_project(temp_dir):
+					return result, len(walked)
+
+			async def all_results():
+				return [result async for result in ascan_project(temp_dir)]
+
+			with mock.patch.object(_async, "DEFAULT_ASYNC_CONCURRENCY", 2), mock.patch.object(_scan, "walk_project", counting_walk):
+
+				# Only a window's worth of the project has been walked by the time the first log is read
+				_, walked_count = asyncio.run(first_result())
+				self.assertLessEqual(walked_count, 8)
+
+				walked.clear()
+				self.assertEqual(len(asyncio.run(all_results())), 20)
+
+if __name__ == "__main__":
+
+	unittest.main()
@@ -1,4 +1,4 @@
-import unittest, tempfile, pathlib, time, datetime
+import unittest, tempfile, pathlib, shutil, time, datetime, os
 from binhistory import BinLog, BinLogEntry, exceptions, defaults
 
 PATH_BIN = str(pathlib.Path(__file__).with_name("example.avb"))
@@ -47,6 +47,147 @@ class TestBinLog(unittest.TestCase):
 		with self.assertRaises(exceptions.BinLogNotFoundError):
 			BinLog.from_bin("example2.avb", missing_bin_ok=True)
 
+	def test_lazy(self):
+
+		log = BinLog.from_path(PATH_LOG)
+		lazy_log = BinLog.from_bin(PATH_BIN, lazy=True)
+
+		# Cheap stuff shouldn't parse
+		self.assertFalse(lazy_log.is_parsed)
+		self.assertEqual(len(lazy_log), len(log))
+		self.assertEqual(lazy_log.latest_entry(), log.latest_entry())
+		self.assertEqual(lazy_log.earliest_entry(), log.earliest_entry())
+		self.assertFalse(lazy_log.is_parsed)
+
+		# Everything else should
+		self.assertEqual(lazy_log[0], log[0])
+		self.assertTrue(lazy_log.is_parsed)
+		self.assertEqual(lazy_log, log)
+		self.assertEqual(lazy_log.to_string(), log.to_string())
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+			
+			bad_path = pathlib.Path(temp_dir, "bad.log")
+			bad_path.write_text("Heehee oops\n")
+			bad_log = BinLog.from_path(bad_path, lazy=True)
+
+			self.assertEqual(len(bad_log), 1)
+			with self.assertRaises(exceptions.BinLogParseError):
+				list(bad_log)
+			
+			# A bad field on a line that isn't the latest still counts
+			blank_user_line = log.earliest_entry().to_string()[:53].ljust(68)
+			blank_user_path = pathlib.Path(temp_dir, "blank_user.log")
+			blank_user_path.write_text(blank_user_line + "\n" + log.latest_entry().to_string() + "\n")
+			with self.assertRaises(exceptions.BinLogFieldLengthError):
+				BinLog.from_path(blank_user_path)
+			with self.assertRaises(exceptions.BinLogFieldLengthError):
+				BinLog.from_path(blank_user_path, lazy=True).latest_entry()
+
+			empty_path = pathlib.Path(temp_dir, "empty.log")
+			empty_path.write_text("")
+			self.assertIsNone(BinLog.from_path(empty_path, lazy=True).latest_entry())
+
+	def test_iter_entries(self):
+
+		log = BinLog.from_path(PATH_LOG)
+
+		with open(PATH_LOG) as log_handle:
+			entries = BinLog.iter_entries(log_handle)
+			self.assertNotIsInstance(entries, list)
+			self.assertEqual(list(entries), list(log))
+		
+		with tempfile.TemporaryDirectory() as temp_dir:
+
+			# Make line 3 a stinker
+			lines = log.to_string().splitlines(keepends=True)
+			lines[2] = "Heehee oops\n"
+			bad_path = pathlib.Path(temp_dir, "bad.log")
+			bad_path.write_text(str().join(lines))
+
+			with open(bad_path) as log_handle:
+				with self.assertRaises(exceptions.BinLogLineError) as raised:
+					list(BinLog.iter_entries(log_handle))
+			self.assertEqual(raised.exception.line_number, 3)
+			self.assertIsInstance(raised.exception, exceptions.BinLogParseError)
+			
+			with open(bad_path) as log_handle:
+				self.assertEqual(list(BinLog.iter_entries(log_handle, on_error="skip")), log[:2] + log[3:])
+			
+			with open(bad_path) as log_handle:
+				results = list(BinLog.iter_entries(log_handle, on_error="yield"))
+			self.assertEqual(len(results), len(log))
+			self.assertIsInstance(results[2], exceptions.BinLogLineError)
+			self.assertEqual((results[2].line_number, results[2].line), (3, "Heehee oops\n"))
+			self.assertEqual(results[:2] + results[3:], log[:2] + log[3:])
+
+			with open(bad_path) as log_handle, self.assertRaises(ValueError):
+				next(BinLog.iter_entries(log_handle, on_error="ignore"))
+
+	def test_encodings(self):
+
+		log = BinLog([BinLogEntry(timestamp=datetime.datetime(2023, 4, 28, 18, 46, 21), computer="Café", user="Zoë")])
+		log_string = log.to_string()
+
+		self.assertEqual(BinLog.from_bytes(log_string.encode("utf-8"), max_year=2023), log)
+		self.assertEqual(BinLog.from_bytes(log_string.encode("mac_roman"), max_year=2023), log)
+		self.assertEqual(BinLog.from_bytes(log_string.replace("\n", "\r\n").encode("utf-8"), max_year=2023), log)
+
+		with self.assertRaises(exceptions.BinLogParseError):
+			BinLog.from_bytes(log_string.encode("mac_roman"), max_year=2023, encodings=["utf-8"])
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+
+			log_path = pathlib.Path(temp_dir, "mac_roman.log")
+			log_path.write_bytes(log_string.encode("mac_roman"))
+
+			self.assertEqual(BinLog.from_path(log_path, max_year=2023), log)
+			self.assertEqual(BinLog.from_path(log_path, max_year=2023, lazy=True), log)
+
+			# Touching re-writes it as UTF-8
+			BinLog.touch(log_path)
+			self.assertEqual(BinLog.from_path(log_path, encodings=["utf-8"])[0], log[0])
+	
+	def test_time_queries(self):
+
+		hour = datetime.timedelta(hours=1)
+		start = datetime.datetime(2024, 5, 1, 12, 0, 0)
+		entries = [BinLogEntry(timestamp=start + hour * offset, user=f"user{offset}") for offset in (3, 0, 2, 6)]
+		log = BinLog(entries)
+
+		self.assertIsNone(log.entry_at_or_before(start - hour))
+		self.assertEqual(log.entry_at_or_before(start).user, "user0")
+		self.assertEqual(log.entry_at_or_before(start + hour * 5).user, "user3")
+		self.assertEqual(log.entry_at_or_after(start + hour).user, "user2")
+		self.assertEqual(log.entry_at_or_after(start + hour * 6).user, "user6")
+		self.assertIsNone(log.entry_at_or_after(start + hour * 7))
+
+		self.assertEqual(log.nearest(start + hour * 4).user, "user3")
+		self.assertEqual(log.nearest(start + hour * 4.5).user, "user3")  # Tie goes to the earlier one
+		self.assertEqual(log.nearest(start + hour * 5).user, "user6")
+		self.assertIsNone(log.nearest(start + hour * 4.5, tolerance=hour))
+		self.assertIsNone(BinLog().nearest(start))
+
+		self.assertEqual([e.user for e in log.between(start + hour, start + hour * 6)], ["user2", "user3", "user6"])
+		self.assertEqual([e.user for e in log.between(end=start + hour * 2)], ["user0", "user2"])
+		self.assertIsInstance(log.between(), BinLog)
+		self.assertEqual(len(log.between(start + hour * 7)), 0)
+
+		# Changes to the log are picked up
+		log.append(BinLogEntry(timestamp=start + hour * 4, user="user4"))
+		self.assertEqual(log.entry_at_or_after(start + hour * 4).user, "user4")
+		log.remove(log.entry_at_or_after(start + hour * 4))
+		self.assertEqual(log.entry_at_or_after(start + hour * 4).user, "user6")
+		del log[-1]
+		self.assertIsNone(log.entry_at_or_after(start + hour * 4))
+		log.clear()
+		self.assertIsNone(log.entry_at_or_before(start + hour * 4))
+
+		# Lazy logs too
+		lazy_log = BinLog.from_path(PATH_LOG, lazy=True)
+		latest = BinLog.from_path(PATH_LOG).latest_entry()
+		self.assertEqual(lazy_log.entry_at_or_before(latest.timestamp + hour), latest)
+	
 	def test_list_operations(self):
 
 		log = BinLog.from_path(PATH_LOG)
@@ -171,6 +312,98 @@ class TestBinLog(unittest.TestCase):
 			self.assertEqual(that_new_log[0].timestamp, first_timestamp)
 			self.assertNotEqual(that_new_log[0], that_new_log[1])
 
+	def test_touch_atomic(self):
+
+		existing_log = BinLog.from_path(PATH_LOG)
+		new_entry = BinLogEntry(computer="zNewGuy")
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+			temp_dir = pathlib.Path(temp_dir)
+
+			# Already sorted, so existing lines are kept as-is
+			shutil.copy(PATH_LOG, temp_dir/"sorted.log")
+			(temp_dir/"sorted.log").chmod(0o640)
+			BinLog.touch(temp_dir/"sorted.log", new_entry, fsync=True)
+			self.assertEqual((temp_dir/"sorted.log").read_text(), BinLog(existing_log + BinLog([new_entry])).to_string())
+			self.assertEqual((temp_dir/"sorted.log").stat().st_mode & 0o777, 0o640)
+
+			# Not sorted, or new entry isn't the latest, so it's done the long way
+			unsorted_log = BinLog(reversed(existing_log))
+			(temp_dir/"unsorted.log").write_text(str().join(e.to_string() + "\n" for e in unsorted_log))
+			BinLog.touch(temp_dir/"unsorted.log", new_entry, atomic=False)
+			self.assertEqual((temp_dir/"unsorted.log").read_text(), BinLog(existing_log + BinLog([new_entry])).to_string())
+
+			old_entry = existing_log.earliest_entry().copy_with(user="oldguy")
+			shutil.copy(PATH_LOG, temp_dir/"old.log")
+			BinLog.touch(temp_dir/"old.log", old_entry)
+			self.assertEqual((temp_dir/"old.log").read_text(), existing_log.to_string())
+
+			# Running over New Year's, so the fixed-width fields alone don't give the order
+			new_year_log = BinLog([BinLogEntry(timestamp=datetime.datetime(2022, 12, 31, 23, 59, 0)), BinLogEntry(timestamp=datetime.datetime(2023, 1, 1, 0, 1, 0))])
+			(temp_dir/"new_year.log").write_text(new_year_log.to_string())
+			os.utime(temp_dir/"new_year.log", (datetime.datetime(2023, 1, 2).timestamp(),) * 2)
+			new_year_entry = BinLogEntry(timestamp=datetime.datetime(2023, 1, 1, 0, 2, 0))
+			BinLog.touch(temp_dir/"new_year.log", new_year_entry)
+			self.assertEqual((temp_dir/"new_year.log").read_text(), BinLog(new_year_log + BinLog([new_year_entry])).to_string())
+
+			# Months going up while the years go down: sorted by their fixed-width fields, but not by time
+			mtime_2026 = (datetime.datetime(2026, 1, 11).timestamp(),) * 2
+			out_of_order = [BinLogEntry(timestamp=datetime.datetime(2026, 1, 10, 9, 0, 0))] + [BinLogEntry(timestamp=datetime.datetime(2021, month, 3, 9, 0, 0)) for month in range(3, 3 + defaults.MAX_ENTRIES - 1)]
+			(temp_dir/"out_of_order.log").write_text(str().join(e.to_string() + "\n" for e in out_of_order))
+			os.utime(temp_dir/"out_of_order.log", mtime_2026)
+			self.assertEqual(list(BinLog.from_path(temp_dir/"out_of_order.log")), out_of_order)
+
+			out_of_order_entry = BinLogEntry(timestamp=datetime.datetime(2026, 1, 10, 10, 0, 0))
+			BinLog.touch(temp_dir/"out_of_order.log", out_of_order_entry)
+			touched_log = BinLog.from_path(temp_dir/"out_of_order.log")
+			self.assertEqual(touched_log.to_string(), BinLog(out_of_order + [out_of_order_entry]).to_string())
+			self.assertIn(out_of_order[0], touched_log)
+
+			# Still refuses bad logs, including ones laid out properly but with a date that doesn't exist
+			no_such_date = str().join(timestamp + BinLogEntry().to_string()[19:] + "\n" for timestamp in ("Sun Jan 04 10:00:00", "Mon Feb 30 10:00:00", "Sun Mar 01 10:00:00"))
+			(temp_dir/"no_such_date.log").write_text(no_such_date)
+			with self.assertRaises(exceptions.BinLogParseError):
+				BinLog.touch(temp_dir/"no_such_date.log", new_entry)
+			self.assertEqual((temp_dir/"no_such_date.log").read_text(), no_such_date)
+
+			(temp_dir/"bad.log").write_text("Heehee oops\n")
+			with self.assertRaises(exceptions.BinLogParseError):
+				BinLog.touch(temp_dir/"bad.log", new_entry)
+			self.assertEqual((temp_dir/"bad.log").read_text(), "Heehee oops\n")
+			
+			# No temp files left lying around
+			self.assertCountEqual([p.name for p in temp_dir.iterdir()], ["sorted.log", "unsorted.log", "old.log", "new_year.log", "out_of_order.log", "no_such_date.log", "bad.log"])
+
+	def test_touch_many(self):
+
+		entry = BinLogEntry(user="conform")
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+			temp_dir = pathlib.Path(temp_dir)
+
+			bin_paths = [temp_dir/f"Reel {i}.avb" for i in range(20)]
+			for bin_path in bin_paths[:10]:
+				bin_path.write_bytes(b"")
+			shutil.copy(PATH_LOG, temp_dir/"Reel 0.log")
+			(temp_dir/"Reel 1.log").write_text("Heehee oops\n")
+
+			results = BinLog.touch_many(bin_paths, entry, workers=4, missing_bin_ok=False)
+
+			self.assertEqual([r.bin_path for r in results], [str(p) for p in bin_paths])
+			self.assertEqual([r.log_path for r in results], [str(p.with_suffix(".log")) for p in bin_paths])
+
+			self.assertTrue(all(r.ok for r in results[2:10]))
+			self.assertIsInstance(results[1].error, exceptions.BinLogParseError)
+			for result in results[10:]:
+				self.assertIsInstance(result.error, exceptions.BinNotFoundError)
+			
+			self.assertEqual(BinLog.from_path(temp_dir/"Reel 0.log").latest_entry().user, "conform")
+			self.assertEqual(BinLog.from_path(temp_dir/"Reel 5.log"), BinLog.from_path(temp_dir/"Reel 6.log"))
+
+			# Missing bins are fine by default
+			self.assertTrue(all(r.ok for r in BinLog.touch_many(bin_paths[10:], workers=4)))
+			self.assertTrue((temp_dir/"Reel 19.log").is_file())
+
 if __name__ == "__main__":
 
 	unittest.main()
\ No newline at end of file
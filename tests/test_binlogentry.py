@@ -1,5 +1,5 @@
-import unittest, datetime
-from binhistory import BinLogEntry, exceptions, defaults
+import unittest, datetime, pickle, dataclasses, weakref
+from binhistory import BinLogEntry, exceptions, defaults, clear_interned_names
 
 EXAMPLE_STRING = "Mon Mar 10 17:32:54  Computer: zMichael        User: poop           "
 EXAMPLE_DATE   = datetime.datetime(year=2025, month=3, day=10, hour=17, minute=32, second=54)
@@ -36,6 +36,45 @@ class TestBinLogEntry(unittest.TestCase):
 			BinLogEntry.from_string("Tue Feb 29 17:32:54  Computer: zMichael        User: poop           ", max_year=2025)
 		
 
+	def test_year_resolution_cache(self):
+
+		from binhistory._binlogentry import _resolve_year
+
+		self.assertEqual(_resolve_year(3, 10, "Mon", 2025), 2025)
+		self.assertEqual(_resolve_year(2, 29, "Mon", 2025), 2016)
+		self.assertIsNone(_resolve_year(2, 29, "Tue", 2025))
+
+		# Same month/day/weekday/max_year should be a single lookup for every entry
+		hits = _resolve_year.cache_info().hits
+		BinLogEntry.from_string(EXAMPLE_STRING, max_year=2025)
+		BinLogEntry.from_string(EXAMPLE_STRING, max_year=2025)
+		self.assertGreaterEqual(_resolve_year.cache_info().hits, hits + 2)
+
+	def test_parse_lines(self):
+
+		lines = [EXAMPLE_STRING, "Mon Feb 29 17:32:54  Computer: zMichael        User: poop           \n"]
+		entries = BinLogEntry.parse_lines(lines, max_year=2025)
+
+		self.assertEqual(entries, [BinLogEntry.from_string(line, max_year=2025) for line in lines])
+		self.assertEqual(entries[0], EXAMPLE_ENTRY)
+		self.assertEqual(BinLogEntry.parse_lines([]), [])
+
+		with self.assertRaises(exceptions.BinLogParseError):
+			BinLogEntry.parse_lines([EXAMPLE_STRING, "Mon Mar 10 24:32:54  Computer: zMichael        User: poop           "], max_year=2025)
+	
+	def test_parse_timestamp_fallback(self):
+
+		# Not quite the fixed-width layout, but `strptime` has always been cool with it
+		self.assertEqual(
+			BinLogEntry._datetime_from_log_timestamp("Mon Mar 3 17:32:54", max_year=2025),
+			datetime.datetime(year=2025, month=3, day=3, hour=17, minute=32, second=54)
+		)
+
+		with self.assertRaises(ValueError):
+			BinLogEntry._datetime_from_log_timestamp("Mon Mar 10 17:32:5x", max_year=2025)
+		with self.assertRaises(ValueError):
+			BinLogEntry._datetime_from_log_timestamp("Mon Apr 31 17:32:54", max_year=2025)
+
 	def test_to_string(self):
 
 		self.assertEqual(EXAMPLE_ENTRY.to_string(), EXAMPLE_STRING)
@@ -63,6 +102,47 @@ class TestBinLogEntry(unittest.TestCase):
 		with self.assertRaises(exceptions.BinLogInvalidFieldError):
 			BinLogEntry(user="My\nGoodness")
 	
+	def test_parsed_field_validation(self):
+
+		# Lines which slice cleanly but hold bad fields still get caught on the parser's fast path
+		with self.assertRaises(exceptions.BinLogFieldLengthError):
+			BinLogEntry.from_string(EXAMPLE_STRING[:31] + " " * 16 + EXAMPLE_STRING[47:], max_year=2025)
+		with self.assertRaises(exceptions.BinLogFieldLengthError):
+			BinLogEntry.parse_lines([EXAMPLE_STRING[:31] + "ReallyBigOldName" + EXAMPLE_STRING[47:]], max_year=2025)
+		with self.assertRaises(exceptions.BinLogInvalidFieldError):
+			BinLogEntry.parse_lines([EXAMPLE_STRING[:53] + "poo\tp" + EXAMPLE_STRING[59:]], max_year=2025)
+	
+	def test_slots(self):
+
+		self.assertFalse(hasattr(EXAMPLE_ENTRY, "__dict__"))
+		self.assertEqual(dataclasses.fields(EXAMPLE_ENTRY)[0].name, "timestamp")
+
+		with self.assertRaises(dataclasses.FrozenInstanceError):
+			EXAMPLE_ENTRY.user = "peepee"
+		with self.assertRaises(dataclasses.FrozenInstanceError):
+			EXAMPLE_ENTRY.mood = "peepee"
+		
+		parsed_entry = BinLogEntry.from_string(EXAMPLE_STRING, max_year=2025)
+		self.assertIs(type(parsed_entry), BinLogEntry)
+		self.assertEqual(pickle.loads(pickle.dumps(parsed_entry)), EXAMPLE_ENTRY)
+		self.assertEqual(hash(parsed_entry), hash(EXAMPLE_ENTRY))
+
+		# Still weakly referenceable, as it was before slots
+		self.assertIs(weakref.ref(parsed_entry)(), parsed_entry)
+	
+	def test_interned_names(self):
+
+		# Pasting the string back together so it isn't the same object as a literal elsewhere
+		other_string = "".join(list(EXAMPLE_STRING))
+		entries = BinLogEntry.parse_lines([EXAMPLE_STRING, other_string], max_year=2025) + [BinLogEntry.from_string(other_string, max_year=2025)]
+
+		self.assertTrue(all(entry.user is entries[0].user for entry in entries))
+		self.assertTrue(all(entry.computer is entries[0].computer for entry in entries))
+
+		clear_interned_names()
+		self.assertIsNot(BinLogEntry.from_string(other_string, max_year=2025).user, entries[0].user)
+		self.assertEqual(BinLogEntry.from_string(other_string, max_year=2025).user, entries[0].user)
+	
 	def test_copy(self):
 		
 		self.assertEqual(
@@ -0,0 +1,59 @@
+import unittest, pathlib, json, datetime, pickle
+from binhistory import BinLog, BinLogEntry, BinLogStats
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestBinLogStats(unittest.TestCase):
+
+	def setUp(self):
+
+		self.log = BinLog.from_path(PATH_LOG)
+		self.other_log = BinLog([
+			BinLogEntry(timestamp=datetime.datetime(2020, 1, 1, 9, 0, 0), computer="zEarly", user="early"),
+			BinLogEntry(timestamp=datetime.datetime(2030, 1, 1, 9, 0, 0), computer="zLate", user="late"),
+		])
+
+	def test_add(self):
+
+		stats = BinLogStats().add(self.log, "Reel 1.avb").add(BinLog(), "Empty.avb").add_error()
+
+		self.assertEqual(stats.logs_read, 2)
+		self.assertEqual(stats.logs_failed, 1)
+		self.assertEqual(stats.entry_count, len(self.log))
+		self.assertEqual(sum(stats.user_counts.values()), len(self.log))
+		self.assertEqual(set(stats.computer_counts), set(self.log.computers()))
+		self.assertEqual(sum(stats.day_counts.values()), len(self.log))
+		self.assertEqual(stats.earliest_entry, self.log.earliest_entry())
+		self.assertEqual(stats.latest_entry, self.log.latest_entry())
+		self.assertEqual(stats.latest_path, "Reel 1.avb")
+
+	def test_merge(self):
+
+		everything = BinLogStats().add(self.log, "Reel 1.avb").add(self.other_log, "Reel 2.avb").add_error()
+		merged = BinLogStats().add(self.log, "Reel 1.avb").merge(BinLogStats().add(self.other_log, "Reel 2.avb").add_error())
+
+		self.assertEqual(merged, everything)
+		self.assertEqual(merged.earliest_path, "Reel 2.avb")
+		self.assertEqual(merged.latest_entry.user, "late")
+
+		# Merging in an empty one changes nothing
+		self.assertEqual(BinLogStats().merge(everything).merge(BinLogStats()), everything)
+
+		# Ties go to the same log whichever order they're merged in
+		self.assertEqual(BinLogStats().add(self.log, "B.avb").merge(BinLogStats().add(self.log, "A.avb")).latest_path, "A.avb")
+		self.assertEqual(BinLogStats().add(self.log, "A.avb").merge(BinLogStats().add(self.log, "B.avb")).latest_path, "A.avb")
+
+		with self.assertRaises(TypeError):
+			merged.merge({})
+
+	def test_serialize(self):
+
+		stats = BinLogStats().add(self.log, "Reel 1.avb").add(self.other_log, "Reel 2.avb")
+
+		self.assertEqual(BinLogStats.from_dict(json.loads(json.dumps(stats.to_dict()))), stats)
+		self.assertEqual(pickle.loads(pickle.dumps(stats)), stats)
+		self.assertEqual(BinLogStats.from_dict(BinLogStats().to_dict()), BinLogStats())
+
+if __name__ == "__main__":
+
+	unittest.main()
@@ -0,0 +1,86 @@
+import unittest, tempfile, pathlib, shutil
+from binhistory import BinLog, BinLogTable, walk_project
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+@unittest.skipIf(numpy is None, "`numpy` is not installed")
+class TestBinLogTable(unittest.TestCase):
+
+	def setUp(self):
+
+		self._temp_dir = tempfile.TemporaryDirectory()
+		self.project = pathlib.Path(self._temp_dir.name)
+
+		(self.project/"Reels").mkdir()
+		shutil.copy(PATH_LOG, self.project/"Reel 1.log")
+		shutil.copy(PATH_LOG, self.project/"Reels"/"Reel 2.log")
+		(self.project/"Broken.log").write_text("Heehee oops\n")
+
+		self.log = BinLog.from_path(PATH_LOG)
+		self.max_year = self.log.latest_entry().timestamp.year
+		self.lines = pathlib.Path(PATH_LOG).read_text(encoding="utf-8").splitlines()
+	
+	def tearDown(self):
+		self._temp_dir.cleanup()
+
+	def test_from_lines(self):
+
+		table = BinLogTable.from_lines([("a.avb", self.lines), ("b.avb", self.lines[:3])], max_year=self.max_year)
+
+		self.assertEqual(len(table), 13)
+		self.assertEqual(table.bin_paths, ["a.avb", "b.avb"])
+		self.assertCountEqual(table.users, self.log.users())
+		self.assertCountEqual(table.computers, self.log.computers())
+		self.assertEqual(table.timestamps.dtype, numpy.dtype("datetime64[s]"))
+
+		self.assertEqual(table.to_binlog("a.avb"), self.log)
+		self.assertEqual(table.to_binlog("b.avb"), BinLog(self.log[:3]))
+		self.assertEqual(table.to_binlog("nope.avb"), BinLog())
+	
+	def test_from_project(self):
+
+		table = BinLogTable.from_project(self.project, workers=2)
+
+		self.assertEqual(len(table), 20)
+		self.assertEqual(list(table.errors), [str(self.project/"Broken.log")])
+		self.assertEqual(table.to_binlog(self.project/"Reels"/"Reel 2.avb"), self.log)
+
+		# Bins come out in walk order, however the reads happen to finish
+		walked = [log_info.bin_path for log_info in walk_project(self.project) if not log_info.log_path.endswith("Broken.log")]
+		self.assertEqual(table.bin_paths, walked)
+		self.assertEqual(BinLogTable.from_project(self.project, workers=1).bin_paths, walked)
+
+		with self.assertRaises(ValueError):
+			BinLogTable.from_project(self.project, workers=0)
+	
+	def test_filter_and_count(self):
+
+		table = BinLogTable.from_lines([("a.avb", self.lines), ("b.avb", self.lines[:3])], max_year=self.max_year)
+
+		expected_users = {user: 0 for user in self.log.users()}
+		for entry in self.log + BinLog(self.log[:3]):
+			expected_users[entry.user] += 1
+		self.assertEqual(table.count_by("user"), expected_users)
+		self.assertEqual(table.count_by("bin_path"), {"a.avb": 10, "b.avb": 3})
+
+		with self.assertRaises(ValueError):
+			table.count_by("timestamp")
+		
+		start, end = self.log[3].timestamp, self.log[5].timestamp
+		self.assertEqual(len(table.filter(start=start, end=end)), 3)
+		self.assertEqual(len(table.filter(start=start, end=end, bin_paths="b.avb")), 0)
+
+		by_computer = table.filter(computers=[self.log[3].computer, "zNobody"])
+		self.assertEqual(len(by_computer), sum(e.computer == self.log[3].computer for e in self.log))
+		self.assertEqual(by_computer.count_by("bin_path"), {"a.avb": len(by_computer)})
+
+		self.assertEqual(len(table.filter(users="zNobody")), 0)
+
+if __name__ == "__main__":
+
+	unittest.main()
@@ -0,0 +1,109 @@
+import unittest, tempfile, pathlib, shutil, io, json, contextlib
+from binhistory import BinLog
+from binhistory._cli import main
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestCli(unittest.TestCase):
+
+	def setUp(self):
+
+		self._temp_dir = tempfile.TemporaryDirectory()
+		self.project = pathlib.Path(self._temp_dir.name)
+
+		(self.project/"Reels").mkdir()
+		for log_path in [self.project/"Reel 1.log", self.project/"Reels"/"Reel 2.log"]:
+			shutil.copy(PATH_LOG, log_path)
+		
+		(self.project/"Broken.log").write_text("Heehee oops\n")
+	
+	def tearDown(self):
+		self._temp_dir.cleanup()
+	
+	def run_cli(self, *args:str):
+		"""Run the CLI, returning the exit code and the JSON Lines it printed"""
+
+		output = io.StringIO()
+		with contextlib.redirect_stdout(output):
+			exit_code = main(list(args))
+		return exit_code, [json.loads(line) for line in output.getvalue().splitlines()]
+
+	def test_scan(self):
+
+		exit_code, records = self.run_cli("scan", str(self.project), "--workers", "2")
+		self.assertEqual(exit_code, 0)
+
+		records = {record["bin_path"]: record for record in records}
+		self.assertEqual(len(records), 3)
+		self.assertIn("error", records.pop(str(self.project/"Broken.avb")))
+
+		expected = BinLog.from_path(PATH_LOG)
+		for record in records.values():
+			self.assertEqual([entry["user"] for entry in record["entries"]], [entry.user for entry in expected])
+			self.assertEqual(record["entries"][-1]["timestamp"], expected[-1].timestamp.isoformat())
+	
+	def test_latest(self):
+
+		exit_code, records = self.run_cli("latest", str(self.project))
+		self.assertEqual(exit_code, 0)
+
+		latest = BinLog.from_path(PATH_LOG).latest_entry()
+		for record in records:
+			if "error" not in record:
+				self.assertEqual((record["timestamp"], record["computer"], record["user"]), (latest.timestamp.isoformat(), latest.computer, latest.user))
+	
+	def test_stats(self):
+
+		exit_code, records = self.run_cli("stats", str(self.project))
+		self.assertEqual(exit_code, 0)
+		self.assertEqual(len(records), 1)
+
+		log = BinLog.from_path(PATH_LOG)
+		self.assertEqual(records[0]["logs_read"], 2)
+		self.assertEqual(records[0]["logs_failed"], 1)
+		self.assertEqual(sum(records[0]["users"].values()), len(log) * 2)
+		self.assertEqual(records[0]["latest"]["timestamp"], log.latest_entry().timestamp.isoformat())
+		self.assertIn(records[0]["latest"]["path"], [str(self.project/"Reel 1.avb"), str(self.project/"Reels"/"Reel 2.avb")])
+	
+	def test_export(self):
+
+		exit_code, records = self.run_cli("export", str(self.project))
+		self.assertEqual(exit_code, 0)
+		self.assertEqual(len(records), len(BinLog.from_path(PATH_LOG)) * 2)
+		self.assertEqual(set(records[0]), {"bin_path", "timestamp", "user", "computer", "log_mtime"})
+
+		output_path = self.project/"export.csv"
+		exit_code, _ = self.run_cli("export", str(self.project), "--format", "csv", "--output", str(output_path))
+		self.assertEqual(exit_code, 0)
+		self.assertTrue(output_path.read_text(encoding="utf-8").startswith("bin_path,timestamp,user,computer,log_mtime"))
+
+		# Parquet can't go to stdout
+		with contextlib.redirect_stderr(io.StringIO()):
+			exit_code, _ = self.run_cli("export", str(self.project), "--format", "parquet")
+		self.assertEqual(exit_code, 2)
+
+	def test_touch(self):
+
+		bin_path = self.project/"Reel 3.avb"
+
+		exit_code, records = self.run_cli("touch", str(bin_path), "--user", "Cli", "--computer", "zCli")
+		self.assertEqual(exit_code, 0)
+		self.assertEqual(records[0]["bin_path"], str(bin_path))
+		self.assertEqual(BinLog.from_bin(bin_path).latest_entry().user, "Cli")
+
+		exit_code, records = self.run_cli("touch", str(self.project/"Reel 4.avb"), "--require-bin")
+		self.assertEqual(exit_code, 1)
+		self.assertIn("error", records[0])
+		self.assertFalse((self.project/"Reel 4.log").exists())
+
+	def test_bad_arguments(self):
+
+		with contextlib.redirect_stderr(io.StringIO()):
+			with self.assertRaises(SystemExit):
+				main(["scan", str(self.project), "--workers", "0"])
+			with self.assertRaises(SystemExit):
+				main([])
+
+if __name__ == "__main__":
+
+	unittest.main()
@@ -0,0 +1,118 @@
+import unittest, tempfile, pathlib, shutil, io, csv, json, datetime, os, sys
+from unittest import mock
+from binhistory import BinLog, export_csv, export_jsonl, export_parquet, iter_rows, iter_record_batches, ExportRow
+
+try:
+	import pyarrow.parquet
+except ImportError:
+	pyarrow = None
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestExport(unittest.TestCase):
+
+	def setUp(self):
+
+		self._temp_dir = tempfile.TemporaryDirectory()
+		self.project = pathlib.Path(self._temp_dir.name)
+
+		(self.project/"Reels").mkdir()
+		for log_path in [self.project/"Reel 1.log", self.project/"Reels"/"Reel 2.log"]:
+			shutil.copy(PATH_LOG, log_path)
+
+		# A log that won't parse, and should be left out
+		(self.project/"Broken.log").write_text("Heehee oops\n")
+
+		self.log = BinLog.from_path(PATH_LOG)
+		self.expected_count = 2 * len(self.log)
+
+	def tearDown(self):
+		self._temp_dir.cleanup()
+
+	def test_iter_rows(self):
+
+		rows = list(iter_rows(self.project, workers=2))
+
+		self.assertEqual(len(rows), self.expected_count)
+		self.assertTrue(all(isinstance(row, ExportRow) for row in rows))
+		self.assertCountEqual({row.bin_path for row in rows}, [str(self.project/"Reel 1.avb"), str(self.project/"Reels"/"Reel 2.avb")])
+
+		log_path = self.project/"Reel 1.log"
+		rows_reel_1 = [row for row in rows if row.bin_path == str(self.project/"Reel 1.avb")]
+		self.assertEqual([(row.timestamp, row.user, row.computer) for row in rows_reel_1], [(e.timestamp, e.user, e.computer) for e in self.log])
+		self.assertTrue(all(row.log_mtime == datetime.datetime.fromtimestamp(os.stat(log_path).st_mtime) for row in rows_reel_1))
+
+	def test_export_csv(self):
+
+		output = io.StringIO(newline="")
+		self.assertEqual(export_csv(self.project, output), self.expected_count)
+
+		rows = list(csv.reader(io.StringIO(output.getvalue(), newline="")))
+		self.assertEqual(rows[0], list(ExportRow._fields))
+		self.assertEqual(len(rows) - 1, self.expected_count)
+
+		entry = self.log[0]
+		self.assertIn([entry.timestamp.isoformat(), entry.user, entry.computer], [row[1:4] for row in rows[1:]])
+
+	def test_export_csv_path(self):
+
+		output_path = self.project/"export.csv"
+		self.assertEqual(export_csv(self.project, output_path), self.expected_count)
+
+		with open(output_path, newline="", encoding="utf-8") as output_file:
+			self.assertEqual(len(list(csv.DictReader(output_file))), self.expected_count)
+
+	def test_export_jsonl(self):
+
+		output = io.StringIO()
+		self.assertEqual(export_jsonl(self.project, output), self.expected_count)
+
+		records = [json.loads(line) for line in output.getvalue().splitlines()]
+		self.assertEqual(len(records), self.expected_count)
+		self.assertEqual(list(records[0]), list(ExportRow._fields))
+
+		entry = self.log[-1]
+		self.assertIn(entry.timestamp.isoformat(), {record["timestamp"] for record in records})
+
+	def test_empty_project(self):
+
+		with tempfile.TemporaryDirectory() as empty_project:
+			output = io.StringIO()
+			self.assertEqual(export_csv(empty_project, output), 0)
+			self.assertEqual(output.getvalue().strip(), ",".join(ExportRow._fields))
+
+	@mock.patch.dict(sys.modules, {"pyarrow": None, "pyarrow.parquet": None})
+	def test_parquet_requires_pyarrow(self):
+
+		# As if it weren't installed
+		with self.assertRaisesRegex(ImportError, r"pybinhistory\[parquet\]"):
+			export_parquet(self.project, self.project/"export.parquet")
+
+		with self.assertRaises(ImportError):
+			next(iter_record_batches(self.project))
+
+	@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+	def test_record_batches(self):
+
+		batches = list(iter_record_batches(self.project, batch_size=3))
+
+		self.assertEqual(sum(batch.num_rows for batch in batches), self.expected_count)
+		self.assertTrue(all(batch.num_rows <= 3 for batch in batches))
+		self.assertEqual(batches[0].schema.names, list(ExportRow._fields))
+
+		with self.assertRaises(ValueError):
+			next(iter_record_batches(self.project, batch_size=0))
+
+	@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+	def test_export_parquet(self):
+
+		output_path = self.project/"export.parquet"
+		self.assertEqual(export_parquet(self.project, output_path, batch_size=4), self.expected_count)
+
+		table = pyarrow.parquet.read_table(output_path)
+		self.assertEqual(table.num_rows, self.expected_count)
+		self.assertEqual(table.column_names, list(ExportRow._fields))
+
+		expected_rows = sorted(tuple(row) for row in iter_rows(self.project))
+		exported_rows = sorted(tuple(record.values()) for record in table.to_pylist())
+		self.assertEqual(exported_rows, expected_rows)
@@ -0,0 +1,80 @@
+import unittest, tempfile, pathlib, shutil
+from binhistory import BinLog, BinLogEntry, stats, exceptions
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestInstrumentation(unittest.TestCase):
+
+	def tearDown(self):
+		stats.disable()
+		stats.reset()
+
+	def test_disabled(self):
+
+		stats.reset()
+		BinLog.from_path(PATH_LOG)
+		self.assertFalse(stats.enabled)
+		self.assertEqual(sum(stats.snapshot()["counters"].values()), 0)
+		self.assertEqual(sum(stats.snapshot()["timings"].values()), 0)
+
+	def test_read(self):
+
+		with stats.collecting():
+			log = BinLog.from_path(PATH_LOG)
+			with self.assertRaises(exceptions.BinLogParseError):
+				BinLogEntry.from_string("Heehee oops")
+		
+		self.assertFalse(stats.enabled)
+
+		snapshot = stats.snapshot()
+		self.assertEqual(snapshot["counters"]["files_opened"], 1)
+		self.assertEqual(snapshot["counters"]["bytes_read"], pathlib.Path(PATH_LOG).stat().st_size)
+		self.assertEqual(snapshot["counters"]["lines_parsed"], len(log))
+		self.assertEqual(snapshot["counters"]["parse_errors"], 1)
+
+		for stage in ("open", "read", "parse", "timestamp", "validate"):
+			self.assertGreater(snapshot["timings"][stage], 0, stage)
+		self.assertGreaterEqual(snapshot["timings"]["parse"], snapshot["timings"]["timestamp"])
+	
+	def test_touch(self):
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+
+			log_path = pathlib.Path(temp_dir, "Reel 1.log")
+			shutil.copy(PATH_LOG, log_path)
+
+			stats.reset()
+			stats.enable()
+			BinLog.touch(log_path)
+			BinLog.touch(pathlib.Path(temp_dir, "Reel 2.log"))
+			stats.disable()
+
+			snapshot = stats.snapshot()
+			self.assertEqual(snapshot["counters"]["files_opened"], 1)
+			self.assertEqual(snapshot["counters"]["files_written"], 2)
+			self.assertEqual(snapshot["counters"]["bytes_written"], log_path.stat().st_size + pathlib.Path(temp_dir, "Reel 2.log").stat().st_size)
+			for stage in ("touch", "format", "write"):
+				self.assertGreater(snapshot["timings"][stage], 0, stage)
+
+			# Bytes, not characters
+			stats.reset()
+			with stats.collecting():
+				BinLog.touch(pathlib.Path(temp_dir, "Reel 3.log"), BinLogEntry(user="Zoë"))
+			self.assertEqual(stats.snapshot()["counters"]["bytes_written"], pathlib.Path(temp_dir, "Reel 3.log").stat().st_size)
+	
+	def test_timer(self):
+
+		with stats.timer("parse"):
+			pass
+		stats.count("lines_parsed")
+		self.assertEqual(stats.snapshot()["counters"]["lines_parsed"], 0)
+		self.assertEqual(stats.snapshot()["timings"]["parse"], 0)
+
+		with stats.collecting():
+			with self.assertRaises(RuntimeError), stats.timer("parse"):
+				raise RuntimeError("Still timed")
+		self.assertGreater(stats.snapshot()["timings"]["parse"], 0)
+
+if __name__ == "__main__":
+
+	unittest.main()
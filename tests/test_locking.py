@@ -0,0 +1,120 @@
+import unittest, tempfile, pathlib, threading, subprocess, socket, sys
+from unittest import mock
+from binhistory import BinLog, BinLogEntry, BinLogLock, lock_metrics, exceptions
+from binhistory._locking import fcntl
+
+class TestBinLogLock(unittest.TestCase):
+
+	def setUp(self):
+		self._temp_dir = tempfile.TemporaryDirectory()
+		self.log_path = pathlib.Path(self._temp_dir.name, "Reel 1.log")
+	
+	def tearDown(self):
+		self._temp_dir.cleanup()
+
+	def _test_contention(self, use_fcntl:bool):
+
+		lock_metrics.reset()
+
+		with BinLogLock(self.log_path, use_fcntl=use_fcntl) as held_lock:
+
+			self.assertTrue(held_lock.is_held)
+			self.assertTrue(pathlib.Path(held_lock.lock_path).name.startswith("."))
+
+			waiting_lock = BinLogLock(self.log_path, timeout=0.1, use_fcntl=use_fcntl)
+			with self.assertRaises(exceptions.BinLogLockError):
+				waiting_lock.acquire()
+			
+			self.assertFalse(waiting_lock.is_held)
+			self.assertGreater(waiting_lock.retries, 0)
+			self.assertGreaterEqual(waiting_lock.wait_time, 0.1)
+		
+		self.assertFalse(held_lock.is_held)
+
+		with waiting_lock:
+			self.assertEqual(waiting_lock.retries, 0)
+		
+		self.assertEqual(lock_metrics.acquisitions, 2)
+		self.assertEqual(lock_metrics.timeouts, 1)
+		self.assertGreater(lock_metrics.retries, 0)
+		self.assertGreaterEqual(lock_metrics.wait_time, 0.1)
+	
+	@unittest.skipIf(fcntl is None, "`fcntl` is not available on this platform")
+	def test_contention_fcntl(self):
+		self._test_contention(use_fcntl=True)
+	
+	def test_contention_lockfile(self):
+		self._test_contention(use_fcntl=False)
+
+	def test_stale_lockfile(self):
+
+		# Abandoned without releasing by a process that's since exited
+		finished = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], stdout=subprocess.PIPE, check=True)
+		lock_path = pathlib.Path(BinLogLock(self.log_path).lock_path)
+		lock_path.write_text(f"{int(finished.stdout)} {socket.gethostname()}\n")
+
+		with BinLogLock(self.log_path, stale_after=0, use_fcntl=False) as new_lock:
+			self.assertTrue(new_lock.is_held)
+		
+		self.assertFalse(lock_path.exists())
+		self.assertEqual(list(pathlib.Path(self._temp_dir.name).iterdir()), [])
+
+	def test_stale_lockfile_still_running(self):
+
+		# Old, but its holder is still going
+		held_lock = BinLogLock(self.log_path, use_fcntl=False)
+		held_lock.acquire()
+
+		with self.assertRaises(exceptions.BinLogLockError):
+			BinLogLock(self.log_path, timeout=0.05, stale_after=0, use_fcntl=False).acquire()
+		
+		self.assertTrue(pathlib.Path(held_lock.lock_path).exists())
+		held_lock.release()
+		self.assertFalse(pathlib.Path(held_lock.lock_path).exists())
+
+	def test_broken_lock_release(self):
+
+		# A lock broken as stale and taken by someone else isn't removed when its first holder finally lets go
+		first_lock = BinLogLock(self.log_path, use_fcntl=False)
+		first_lock.acquire()
+
+		with mock.patch("binhistory._locking._holder_is_running", return_value=False):
+			second_lock = BinLogLock(self.log_path, stale_after=0, use_fcntl=False)
+			second_lock.acquire()
+		
+		first_lock.release()
+		self.assertTrue(pathlib.Path(second_lock.lock_path).exists())
+		second_lock.release()
+		self.assertFalse(pathlib.Path(second_lock.lock_path).exists())
+
+	@unittest.skipIf(fcntl is None, "`fcntl` is not available on this platform")
+	def test_fcntl_lockfile_removed(self):
+
+		with BinLogLock(self.log_path, use_fcntl=True) as lock:
+			self.assertTrue(pathlib.Path(lock.lock_path).exists())
+		self.assertFalse(pathlib.Path(lock.lock_path).exists())
+	
+	def test_touch_concurrent(self):
+
+		writers, touches = 4, 5
+
+		def touch_lots(writer:int):
+			for _ in range(touches):
+				BinLog.touch(self.log_path, BinLogEntry(user=f"writer{writer}"), lock=True)
+
+		# Raise the cap so every entry sticks around to be counted
+		with mock.patch("binhistory._binlog.MAX_ENTRIES", writers * touches):
+			threads = [threading.Thread(target=touch_lots, args=(writer,)) for writer in range(writers)]
+			for thread in threads:
+				thread.start()
+			for thread in threads:
+				thread.join()
+		
+		log = BinLog.from_path(self.log_path)
+		self.assertEqual(len(log), writers * touches)
+		for writer in range(writers):
+			self.assertEqual(sum(e.user == f"writer{writer}" for e in log), touches)
+
+if __name__ == "__main__":
+
+	unittest.main()
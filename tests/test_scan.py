@@ -0,0 +1,93 @@
+import unittest, tempfile, pathlib, shutil, os
+from binhistory import BinLog, scan_project, walk_project, exceptions
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestScanProject(unittest.TestCase):
+
+	def setUp(self):
+
+		self._temp_dir = tempfile.TemporaryDirectory()
+		self.project = pathlib.Path(self._temp_dir.name)
+
+		(self.project/"Reels"/"Old").mkdir(parents=True)
+		for log_path in [self.project/"Reel 1.log", self.project/"Reels"/"Reel 2.log", self.project/"Reels"/"Old"/"Reel 3.log"]:
+			shutil.copy(PATH_LOG, log_path)
+		
+		# Resource fork and a not-a-log that should both be ignored
+		(self.project/"Reels"/"._Reel 2.log").write_bytes(b"\x00\x05\x16\x07")
+		(self.project/"Reels"/"Reel 2.avb").write_bytes(b"")
+
+		# A log that won't parse
+		(self.project/"Broken.log").write_text("Heehee oops\n")
+	
+	def tearDown(self):
+		self._temp_dir.cleanup()
+
+	def test_scan(self):
+
+		expected = BinLog.from_path(PATH_LOG)
+
+		results = dict(scan_project(self.project, workers=2))
+
+		self.assertCountEqual(results, [
+			str(self.project/"Reel 1.avb"),
+			str(self.project/"Reels"/"Reel 2.avb"),
+			str(self.project/"Reels"/"Old"/"Reel 3.avb"),
+			str(self.project/"Broken.avb"),
+		])
+
+		self.assertIsInstance(results.pop(str(self.project/"Broken.avb")), exceptions.BinLogParseError)
+
+		for log in results.values():
+			self.assertEqual(log, expected)
+	
+	def test_scan_processes(self):
+
+		threaded = dict(scan_project(self.project, workers=2))
+		processed = dict(scan_project(self.project, workers=2, use_processes=True))
+
+		self.assertCountEqual(processed, threaded)
+		self.assertIsInstance(processed.pop(str(self.project/"Broken.avb")), exceptions.BinLogParseError)
+
+		for bin_path, log in processed.items():
+			self.assertIsInstance(log, BinLog)
+			self.assertEqual(log, threaded[bin_path])
+	
+	def test_walk(self):
+
+		log_infos = {log_info.log_path: log_info for log_info in walk_project(self.project)}
+
+		self.assertCountEqual(log_infos, [
+			str(self.project/"Reel 1.log"),
+			str(self.project/"Reels"/"Reel 2.log"),
+			str(self.project/"Reels"/"Old"/"Reel 3.log"),
+			str(self.project/"Broken.log"),
+		])
+
+		for log_path, log_info in log_infos.items():
+			stat_info = os.stat(log_path)
+			self.assertEqual(log_info.bin_path, BinLog.bin_path_from_log_path(log_path))
+			self.assertEqual(log_info.stat_key, (stat_info.st_mtime_ns, stat_info.st_size))
+			self.assertEqual(log_info.has_bin, log_path == str(self.project/"Reels"/"Reel 2.log"))
+	
+	def test_scan_early_exit(self):
+
+		results = scan_project(self.project, workers=1)
+		self.assertEqual(len(next(results)), 2)
+		results.close()
+	
+	def test_scan_bad_workers(self):
+
+		with self.assertRaises(ValueError):
+			list(scan_project(self.project, workers=0))
+		with self.assertRaises(ValueError):
+			list(scan_project(self.project, workers=0, use_processes=True))
+	
+	def test_bin_path_from_log_path(self):
+
+		self.assertEqual(BinLog.bin_path_from_log_path(PATH_LOG), str(pathlib.Path(PATH_LOG).with_suffix(".avb")))
+
+if __name__ == "__main__":
+
+	unittest.main()
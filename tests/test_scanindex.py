@@ -0,0 +1,110 @@
+import unittest, tempfile, pathlib, shutil, os
+from unittest import mock
+from binhistory import BinLog, BinLogEntry, ScanIndex, exceptions
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestScanIndex(unittest.TestCase):
+
+	def setUp(self):
+
+		self._temp_dir = tempfile.TemporaryDirectory()
+		self.project = pathlib.Path(self._temp_dir.name, "Project")
+		self.index_path = pathlib.Path(self._temp_dir.name, "index.sqlite3")
+
+		(self.project/"Reels").mkdir(parents=True)
+		shutil.copy(PATH_LOG, self.project/"Reel 1.log")
+		shutil.copy(PATH_LOG, self.project/"Reels"/"Reel 2.log")
+		(self.project/"Broken.log").write_text("Heehee oops\n")
+
+		# A sibling project with a similar name that shouldn't be considered part of the project
+		(self.project.parent/"Project 2").mkdir()
+		shutil.copy(PATH_LOG, self.project.parent/"Project 2"/"Reel 1.log")
+	
+	def tearDown(self):
+		self._temp_dir.cleanup()
+
+	def test_scan(self):
+
+		expected = dict((bin_path, log) for bin_path, log in [(str(self.project/"Reel 1.avb"), BinLog.from_path(PATH_LOG)), (str(self.project/"Reels"/"Reel 2.avb"), BinLog.from_path(PATH_LOG))])
+
+		with ScanIndex(self.index_path) as index:
+
+			results = dict(index.scan(self.project))
+			self.assertIsInstance(results.pop(str(self.project/"Broken.avb")), exceptions.BinLogParseError)
+			self.assertEqual(results, expected)
+
+			changes = index.update(self.project.parent/"Project 2")
+			self.assertEqual(len(changes.changed), 1)
+
+			# Nothing changed
+			changes = index.update(self.project)
+			self.assertEqual((changes.changed, changes.removed, changes.unchanged), ([], [], 3))
+		
+		# Persists, and picks up changes and deletions
+		BinLog.touch(self.project/"Reel 1.log", BinLogEntry(computer="zNewGuy"))
+		os.remove(self.project/"Broken.log")
+
+		with ScanIndex(self.index_path) as index:
+
+			changes = index.update(self.project)
+			self.assertEqual(changes.changed, [str(self.project/"Reel 1.log")])
+			self.assertEqual(changes.removed, [str(self.project/"Broken.log")])
+			self.assertEqual(changes.unchanged, 1)
+
+			results = dict(index.logs(self.project))
+			self.assertEqual(len(results), 2)
+			self.assertIn("zNewGuy", results[str(self.project/"Reel 1.avb")].computers())
+			self.assertEqual(results[str(self.project/"Reel 1.avb")], BinLog.from_path(self.project/"Reel 1.log"))
+
+			self.assertEqual(len(list(index.logs())), 3)
+
+	def test_read_errors_are_retried(self):
+
+		from binhistory import _scan
+		read_walked_log = _scan._read_walked_log
+
+		def flaky_read(log_info):
+			if log_info.log_path.endswith("Reel 1.log"):
+				raise PermissionError("The file server is having a moment")
+			return read_walked_log(log_info)
+
+		with ScanIndex(self.index_path) as index:
+
+			with mock.patch.object(_scan, "_read_walked_log", flaky_read):
+				results = dict(index.scan(self.project))
+
+			# The original error comes back, rather than being saved as a parse error
+			self.assertIsInstance(results[str(self.project/"Reel 1.avb")], PermissionError)
+			self.assertIsInstance(results[str(self.project/"Broken.avb")], exceptions.BinLogParseError)
+
+			# Unchanged on disk, but read again since the last read failed
+			changes = index.update(self.project)
+			self.assertEqual(changes.changed, [str(self.project/"Reel 1.log")])
+			self.assertEqual(dict(index.logs(self.project))[str(self.project/"Reel 1.avb")], BinLog.from_path(PATH_LOG))
+
+	def test_shared_index(self):
+
+		from binhistory import _scan, _scanindex
+		read_walked_log = _scan._read_walked_log
+		other_changes = []
+
+		def read_and_update_other(log_info):
+			# Another process updating another project in the same index, while this one is still reading
+			if log_info.log_path.startswith(str(self.project) + os.sep) and not other_changes:
+				other_changes.append(None)
+				with ScanIndex(self.index_path) as other_index:
+					other_changes[0] = other_index.update(self.project.parent/"Project 2")
+			return read_walked_log(log_info)
+
+		with ScanIndex(self.index_path) as index, mock.patch.object(_scanindex, "_BUSY_TIMEOUT", 0.1), mock.patch.object(_scan, "_read_walked_log", read_and_update_other):
+			index.update(self.project, workers=1)
+		
+		self.assertEqual(len(other_changes[0].changed), 1)
+
+		with ScanIndex(self.index_path) as index:
+			self.assertEqual(len(list(index.logs())), 4)
+
+if __name__ == "__main__":
+
+	unittest.main()
@@ -0,0 +1,107 @@
+import unittest, pathlib, datetime, random, pickle
+from binhistory import BinLog, SortedBinLog, BinLogEntry, exceptions
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestSortedBinLog(unittest.TestCase):
+
+	def setUp(self):
+
+		start = datetime.datetime(2024, 5, 1, 12, 0, 0)
+		self.entries = [BinLogEntry(timestamp=start + datetime.timedelta(minutes=minutes), user=f"user{minutes}") for minutes in range(20)]
+		random.Random(4).shuffle(self.entries)
+
+	def assertSorted(self, log:SortedBinLog):
+		self.assertEqual(list(log), sorted(log))
+		self.assertEqual(log._keys, [(e.timestamp, e.computer, e.user) for e in log])
+
+	def test_create(self):
+
+		log = SortedBinLog(self.entries)
+		self.assertSorted(log)
+		self.assertEqual(log, sorted(self.entries))
+		self.assertEqual(log.earliest_entry(), min(self.entries))
+		self.assertEqual(log.latest_entry(), max(self.entries))
+		self.assertIsNone(SortedBinLog().latest_entry())
+
+		with self.assertRaises(exceptions.BinLogTypeError):
+			SortedBinLog(["Heehee oops"])
+
+	def test_mutations(self):
+
+		log = SortedBinLog()
+
+		for entry in self.entries[:10]:
+			log.append(entry)
+			self.assertSorted(log)
+		
+		log.insert(0, self.entries[10])
+		log.extend(self.entries[11:15])
+		log.extend([self.entries[15]])
+		log += SortedBinLog(self.entries[16:])
+		self.assertSorted(log)
+		self.assertEqual(len(log), len(self.entries))
+
+		log[0] = self.entries[0].copy_with(timestamp=datetime.datetime(2030, 1, 1))
+		self.assertSorted(log)
+		self.assertEqual(log.latest_entry().timestamp.year, 2030)
+
+		log.remove(log.latest_entry())
+		del log[0]
+		log.pop()
+		log.pop(3)
+		self.assertSorted(log)
+		self.assertEqual(len(log), len(self.entries) - 4)
+
+		self.assertIn(log[5], log)
+		self.assertNotIn(BinLogEntry(), log)
+		self.assertNotIn("Heehee oops", log)
+		with self.assertRaises(ValueError):
+			log.remove(BinLogEntry())
+		with self.assertRaises(exceptions.BinLogTypeError):
+			log.append("Heehee oops")
+		with self.assertRaises(exceptions.BinLogTypeError):
+			log.extend(5)
+
+		log.sort()
+		with self.assertRaises(TypeError):
+			log.sort(reverse=True)
+		with self.assertRaises(TypeError):
+			log.reverse()
+		
+		log.clear()
+		self.assertSorted(log)
+		self.assertFalse(log)
+
+	def test_formatting(self):
+
+		log = SortedBinLog(self.entries)
+		self.assertEqual(log.to_string(), BinLog(self.entries).to_string())
+		self.assertEqual(pickle.loads(pickle.dumps(log)), log)
+		self.assertIsInstance(log[2:5], SortedBinLog)
+		self.assertIsInstance(log.copy(), SortedBinLog)
+	
+	def test_time_queries(self):
+
+		log = SortedBinLog(self.entries)
+		middle = sorted(self.entries)[10]
+
+		self.assertEqual(log.entry_at_or_before(middle.timestamp), middle)
+		log.append(middle.copy_with(timestamp=middle.timestamp + datetime.timedelta(seconds=1)))
+		self.assertEqual(log.entry_at_or_after(middle.timestamp + datetime.timedelta(seconds=1)).timestamp, middle.timestamp + datetime.timedelta(seconds=1))
+		self.assertEqual(len(log.between(middle.timestamp, middle.timestamp + datetime.timedelta(minutes=1))), 3)
+
+	def test_from_path(self):
+
+		log = BinLog.from_path(PATH_LOG)
+
+		for lazy in (False, True):
+			sorted_log = SortedBinLog.from_path(PATH_LOG, lazy=lazy)
+			self.assertIsInstance(sorted_log, SortedBinLog)
+			self.assertEqual(sorted_log.latest_entry(), log.latest_entry())
+			self.assertEqual(list(sorted_log), sorted(log))
+			self.assertSorted(sorted_log)
+
+if __name__ == "__main__":
+
+	unittest.main()
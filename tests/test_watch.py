@@ -0,0 +1,78 @@
+import unittest, tempfile, pathlib, shutil, threading, datetime, subprocess, sys
+from binhistory import BinLog, BinLogEntry, LogWatcher, watch, defaults
+
+try:
+	import inotify_simple
+except ImportError:
+	inotify_simple = None
+
+PATH_LOG = str(pathlib.Path(__file__).with_name("example.log"))
+
+class TestWatch(unittest.TestCase):
+
+	def setUp(self):
+
+		self._temp_dir = tempfile.TemporaryDirectory()
+		self.project = pathlib.Path(self._temp_dir.name)
+
+		(self.project/"Reels").mkdir()
+		shutil.copy(PATH_LOG, self.project/"Reel 1.log")
+		shutil.copy(PATH_LOG, self.project/"Reels"/"Reel 2.log")
+	
+	def tearDown(self):
+		self._temp_dir.cleanup()
+
+	def test_poll(self):
+
+		watcher = LogWatcher(self.project)
+		self.assertEqual(len(watcher.poll()), 20)
+		self.assertEqual(watcher.poll(), [])
+
+		# Log is full, so touching it re-sorts and trims the oldest entry.  Only the new one should show.
+		entry = BinLogEntry(timestamp=datetime.datetime.now().replace(microsecond=0), computer="zNewGuy")
+		BinLog.touch_bin(self.project/"Reels"/"Reel 2.avb", entry)
+		self.assertEqual(len(BinLog.from_path(self.project/"Reels"/"Reel 2.log")), defaults.MAX_ENTRIES)
+		self.assertEqual(watcher.poll(), [(str(self.project/"Reels"/"Reel 2.avb"), entry)])
+
+		# New logs report everything, and checking just one path works
+		(self.project/"New").mkdir()
+		shutil.copy(PATH_LOG, self.project/"New"/"Reel 3.log")
+		self.assertEqual(len(watcher.poll([self.project/"New"/"Reel 3.log"])), 10)
+
+		# Deleted logs are forgotten, so they'd be reported fresh if they come back
+		(self.project/"New"/"Reel 3.log").unlink()
+		self.assertEqual(watcher.poll(), [])
+		shutil.copy(PATH_LOG, self.project/"New"/"Reel 3.log")
+		self.assertEqual(len(watcher.poll()), 10)
+	
+	def _watch_for_touch(self, use_inotify:bool):
+
+		entry = BinLogEntry(timestamp=datetime.datetime.now().replace(microsecond=0), user="watched")
+		changes = watch(self.project, interval=0.05, use_inotify=use_inotify)
+
+		# Let the watcher get its bearings before touching
+		toucher = threading.Timer(0.3, BinLog.touch_bin, args=(self.project/"Reel 1.avb", entry))
+		toucher.start()
+		try:
+			self.assertEqual(next(changes), (str(self.project/"Reel 1.avb"), entry))
+		finally:
+			toucher.join()
+			changes.close()
+
+	def test_watch_polling(self):
+		self._watch_for_touch(use_inotify=False)
+	
+	@unittest.skipIf(inotify_simple is None, "`inotify_simple` is not installed")
+	def test_watch_inotify(self):
+		self._watch_for_touch(use_inotify=True)
+
+	def test_import_is_lazy(self):
+
+		# Optional extras aren't loaded until they're actually used
+		code = "import sys, binhistory; print(' '.join(name for name in ('inotify_simple', 'numpy', 'pyarrow', 'asyncio') if name in sys.modules))"
+		result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True, cwd=pathlib.Path(__file__).parent.parent)
+		self.assertEqual(result.stdout.strip(), b"")
+
+if __name__ == "__main__":
+
+	unittest.main()